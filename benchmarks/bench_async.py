@@ -0,0 +1,74 @@
+"""
+Benchmark for the event loop latency while missions are loaded
+
+Usage: python benchmarks/bench_async.py [number of lines] [number of concurrent loads]
+"""
+# pylint: disable=import-error,wrong-import-position
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp.mission import Mission
+from litchi_wp.waypoint import Waypoint
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'waypoint', 'waypoints.csv')
+
+
+async def measure(load, filenames: list[str]) -> tuple[float, float, float]:
+    """
+    Runs the loads next to a 1 ms timer and returns the duration, the largest
+    and the mean gap between two ticks
+    """
+    gaps = []
+    done = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(load(filename) for filename in filenames))
+    duration = time.perf_counter() - start
+    done.set()
+    await tick
+    return duration, max(gaps), sum(gaps) / len(gaps)
+
+
+async def blocking(filename: str) -> Mission:
+    """
+    Loads a mission with the blocking Mission.from_file
+    """
+    return Mission.from_file(filename)
+
+
+async def main(count: int = 100000, concurrent: int = 4):
+    """
+    Writes csv files with count lines and compares the latency of the loaders
+    """
+    with open(SAMPLE, encoding='utf-8', mode='r') as file:
+        lines = file.read().split('\n')[1:-1]
+    content = Waypoint.get_header() + ''.join(lines[i % len(lines)] + '\n' for i in range(count))
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = []
+        for index in range(concurrent):
+            filenames.append(os.path.join(directory, f'mission_{index}.csv'))
+            with open(filenames[-1], encoding='utf-8', mode='w') as file:
+                file.write(content)
+        print(f"{concurrent} x {count} lines")
+        for label, load in [('Mission.from_file', blocking), ('Mission.aload', Mission.aload)]:
+            duration, worst, mean = await measure(load, filenames)
+            print(f"{label:20} {duration:7.3f} s  max latency {worst * 1000:8.1f} ms  mean {mean * 1000:6.2f} ms")
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,52 @@
+"""
+Benchmark comparing the csv and the binary mission format
+
+Usage: python benchmarks/bench_binary.py [number of waypoints]
+"""
+# pylint: disable=import-error,wrong-import-position
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp.binary import BinaryMission, dump_binary, load_binary
+from litchi_wp.table import WaypointTable
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'waypoint', 'waypoints.csv')
+
+
+def main(count: int = 100000):
+    """
+    Writes count waypoints in both formats and compares the sizes and load times
+    """
+    sample = WaypointTable.from_file(SAMPLE)
+    table = WaypointTable(sample.get_row(i % len(sample)) for i in range(count))
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, 'mission.csv')
+        binary_file = os.path.join(directory, 'mission.lwpb')
+        table.to_file(csv_file)
+        dump_binary(table, binary_file)
+        print(f"{count} waypoints, csv {os.path.getsize(csv_file) / 1e6:.1f} MB, "
+              f"binary {os.path.getsize(binary_file) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        assert len(WaypointTable.from_file(csv_file)) == count
+        print(f"{'csv WaypointTable.from_file':32} {time.perf_counter() - start:7.3f} s")
+
+        start = time.perf_counter()
+        assert len(load_binary(binary_file)) == count
+        print(f"{'binary load_binary':32} {time.perf_counter() - start:7.3f} s")
+
+        indices = random.Random(0).sample(range(count), min(count, 1000))
+        start = time.perf_counter()
+        with BinaryMission(binary_file) as mission:
+            for index in indices:
+                mission.get_waypoint(index)
+        print(f"{'binary 1000 random waypoints':32} {time.perf_counter() - start:7.3f} s")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
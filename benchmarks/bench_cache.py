@@ -0,0 +1,69 @@
+"""
+Benchmark for repeatedly loading the same litchi csv files with and without ParseCache
+
+Usage: python benchmarks/bench_cache.py [number of files] [waypoints per file] [loads per file]
+"""
+# pylint: disable=import-error,wrong-import-position
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp.cache import ParseCache
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'waypoint', 'waypoints.csv')
+
+
+def main(files: int = 20, count: int = 99, loads: int = 50):
+    """
+    Writes files csv files with count lines each and loads every file loads times
+    """
+    with open(SAMPLE, encoding='utf-8', mode='r') as file:
+        lines = file.read().split('\n')[1:-1]
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = []
+        for number in range(files):
+            filename = os.path.join(directory, f'mission_{number}.csv')
+            with open(filename, encoding='utf-8', mode='w') as file:
+                file.write(Waypoint.get_header() + ''.join(
+                    lines[(number + i) % len(lines)] + '\n' for i in range(count)
+                ))
+            filenames.append(filename)
+        order = filenames * loads
+
+        start = time.perf_counter()
+        for filename in order:
+            WaypointTable.from_file(filename)
+        parsed = time.perf_counter() - start
+
+        results = {}
+        for key in ('stat', 'hash'):
+            cache = ParseCache(key=key)
+            start = time.perf_counter()
+            for filename in order:
+                cache.load_table(filename)
+            results[key] = (time.perf_counter() - start, cache.stats)
+
+        cache_directory = os.path.join(directory, 'cache')
+        ParseCache(directory=cache_directory).load_table(filenames[0])
+        cache = ParseCache(directory=cache_directory)
+        start = time.perf_counter()
+        cache.load_table(filenames[0])
+        disk = time.perf_counter() - start
+        start = time.perf_counter()
+        WaypointTable.from_file(filenames[0])
+        single = time.perf_counter() - start
+
+    print(f"{files} files of {count} waypoints, {len(order)} loads")
+    print(f"WaypointTable.from_file:  {parsed:8.3f} s")
+    for key, (seconds, stats) in results.items():
+        print(f"ParseCache(key={key!r}):  {seconds:8.3f} s  ({parsed / seconds:5.1f}x)  {stats}")
+    print(f"single file parse {single * 1000:.2f} ms, disk hit {disk * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
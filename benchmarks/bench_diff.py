@@ -0,0 +1,87 @@
+"""
+Benchmark for diffing and patching two missions with 50k waypoints,
+including missions of repeated rows without unique anchors
+
+Usage: python benchmarks/bench_diff.py [number of waypoints] [number of edits]
+"""
+# pylint: disable=import-error,wrong-import-position
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp.diff import Patch, apply_patch, diff
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+def main(count: int = 50000, edits: int = 200):
+    """
+    Creates a mission with count waypoints, applies random inserts, deletes and
+    heading changes and measures diff and apply_patch
+    """
+    generator = random.Random(1)
+    old = [Waypoint(47 + index * 1e-5, 8 + generator.random() * 1e-3, 50 + index % 100) for index in range(count)]
+    new = list(old)
+    for _edit in range(edits):
+        index = generator.randrange(len(new))
+        choice = generator.random()
+        if choice < 0.33:
+            del new[index]
+        elif choice < 0.66:
+            new.insert(index, Waypoint(generator.random(), generator.random(), 10))
+        else:
+            waypoint = Waypoint.from_row(new[index].to_row())
+            waypoint.set_heading(90)
+            new[index] = waypoint
+    old_table = WaypointTable.from_waypoints(old)
+    new_table = WaypointTable.from_waypoints(new)
+
+    print(f"{count} waypoints, {edits} edits")
+    for align in ('rows', 'coordinates'):
+        start = time.perf_counter()
+        patch = diff(old, new, align=align)
+        seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        table_patch = diff(old_table, new_table, align=align)
+        table_seconds = time.perf_counter() - start
+        text = patch.to_json()
+        target = list(old)
+        start = time.perf_counter()
+        apply_patch(target, Patch.from_json(text))
+        apply_seconds = time.perf_counter() - start
+        assert table_patch.to_dict() == patch.to_dict()
+        assert [waypoint.to_row() for waypoint in target] == [waypoint.to_row() for waypoint in new]
+        print(
+            f"align={align!r:14} {len(patch):4} operations, {len(text):6} bytes json, "
+            f"diff {seconds:.3f} s (tables {table_seconds:.3f} s), apply {apply_seconds:.3f} s"
+        )
+
+    # repeated rows have no unique anchors, the worst case of the alignment
+    points = [Waypoint(47 + index * 1e-4, 8, 50) for index in range(7)]
+    scan = [Waypoint.from_row(points[index % 5].to_row()) for index in range(count)]
+    edited_scan = list(scan)
+    for index in range(0, count, max(1, count // edits)):
+        waypoint = Waypoint.from_row(scan[index].to_row())
+        waypoint.set_heading(90)
+        edited_scan[index] = waypoint
+    edited_scan.insert(count // 2, points[6])
+    cases = [
+        ('scan', scan, edited_scan, 'coordinates'),
+        ('alternating', [points[0], points[1]] * (count // 2), [points[1], points[0]] * (count // 2), 'rows'),
+        (
+            '3 vs 7 rows', [generator.choice(points[:3]) for _index in range(count)],
+            [generator.choice(points) for _index in range(count)], 'rows'
+        ),
+    ]
+    for name, old_rows, new_rows, align in cases:
+        start = time.perf_counter()
+        patch = diff(old_rows, new_rows, align=align)
+        seconds = time.perf_counter() - start
+        print(f"{name:12} align={align!r:14} {len(patch):6} operations, diff {seconds:.3f} s")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
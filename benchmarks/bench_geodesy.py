@@ -0,0 +1,59 @@
+"""
+Benchmark for batched leg distances and bearings compared to scalar loops
+
+Usage: python benchmarks/bench_geodesy.py [number of waypoints]
+"""
+# pylint: disable=import-error,wrong-import-position
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp import geodesy
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+def timed(function, *args):
+    """
+    Returns the result and the runtime of function(*args)
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(count: int = 200000):
+    """
+    Compares scalar loops with the batch functions
+    """
+    random.seed(0)
+    waypoints = [
+        Waypoint(50 + random.random() / 10, 8 + random.random() / 10, 50 + random.random() * 50)
+        for _ in range(count)
+    ]
+    table = WaypointTable.from_waypoints(waypoints)
+    print(f"{count} waypoints, numpy: {geodesy.np is not None}")
+    for name, scalar, batch in [
+        ('haversine', geodesy.haversine, lambda wps: geodesy.leg_distances(wps)),
+        ('vincenty', geodesy.vincenty, lambda wps: geodesy.leg_distances(wps, 'vincenty')),
+        ('bearing', geodesy.bearing, geodesy.leg_bearings),
+    ]:
+        expected, scalar_time = timed(lambda: [
+            scalar(a.lat, a.lon, b.lat, b.lon) for a, b in zip(waypoints, waypoints[1:])
+        ])
+        result, batch_time = timed(batch, waypoints)
+        assert all(math.isclose(x, y, rel_tol=1e-6, abs_tol=1e-6) for x, y in zip(expected, result))
+        _, table_time = timed(batch, table)
+        print(
+            f"{name:10} scalar {scalar_time:7.3f} s  batch {batch_time:7.3f} s "
+            f"({scalar_time / batch_time:5.1f}x)  WaypointTable {table_time:7.3f} s "
+            f"({scalar_time / table_time:5.1f}x)"
+        )
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+Benchmark for a filter pass over a litchi csv file with 100k lines,
+eager Waypoints compared to LazyWaypoints
+
+Usage: python benchmarks/bench_lazy.py [number of lines]
+"""
+# pylint: disable=import-error,wrong-import-position
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp.lazy import LazyWaypoint
+from litchi_wp.waypoint import Waypoint
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'waypoint', 'waypoints.csv')
+
+
+def main(count: int = 100000):
+    """
+    Writes a csv file with count lines and keeps the waypoints north of the median latitude
+    """
+    with open(SAMPLE, encoding='utf-8', mode='r') as file:
+        lines = file.read().split('\n')[1:-1]
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'waypoints.csv')
+        with open(source, encoding='utf-8', mode='w') as file:
+            file.write(Waypoint.get_header() + ''.join(lines[i % len(lines)] + '\n' for i in range(count)))
+        limit = sorted(Waypoint.from_line(line).lat for line in lines)[len(lines) // 2]
+
+        start = time.perf_counter()
+        with open(source, encoding='utf-8', mode='r') as file:
+            file.read()
+        read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        eager = Waypoint.dump_many(
+            (waypoint for waypoint in Waypoint.iter_file(source) if waypoint.lat > limit),
+            os.path.join(directory, 'eager.csv')
+        )
+        eager_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lazy = LazyWaypoint.dump_many(
+            (waypoint for waypoint in LazyWaypoint.iter_file(source) if waypoint.lat > limit),
+            os.path.join(directory, 'lazy.csv')
+        )
+        lazy_seconds = time.perf_counter() - start
+
+    assert eager == lazy
+    print(f"{count} lines, {lazy} kept")
+    print(f"read only:     {read:8.3f} s")
+    print(f"Waypoint:      {eager_seconds:8.3f} s")
+    print(f"LazyWaypoint:  {lazy_seconds:8.3f} s  ({eager_seconds / lazy_seconds:5.1f}x)")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,90 @@
+"""
+Benchmark for the memory used per Waypoint, measured with tracemalloc
+
+The slotted model classes are compared with a baseline of unslotted copies, which
+store their attributes in an instance __dict__ like the classes did before __slots__.
+
+Usage: python benchmarks/bench_memory.py [number of waypoints]
+"""
+# pylint: disable=import-error,wrong-import-position
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp import action, altitude, gimbal, photo, poi, waypoint
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'waypoint', 'waypoints.csv')
+
+
+def measure(create, count: int) -> float:
+    """
+    Returns the traced bytes per object that create() returns
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [create() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def unslotted(cls: type) -> type:
+    """
+    Returns a copy of a slotted class without __slots__, its instances have a __dict__
+    """
+    slots = set(cls.__dict__.get('__slots__', ()))
+    namespace = {
+        name: value for name, value in cls.__dict__.items()
+        if name not in slots and name not in ('__slots__', '__dict__', '__weakref__')
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+@contextmanager
+def unslotted_models():
+    """
+    Replaces the model classes with unslotted copies where the package creates them
+    """
+    replacements = [
+        (module, name, unslotted(getattr(module, name)))
+        for module, name in (
+            (waypoint, 'Waypoint'), (waypoint, 'Action'), (waypoint, 'Altitude'), (waypoint, 'Gimbal'),
+            (waypoint, 'Poi'), (waypoint, 'Photo'), (poi, 'Altitude'), (action, 'Action'),
+            (altitude, 'Altitude'), (gimbal, 'Gimbal'), (photo, 'Photo'), (poi, 'Poi')
+        )
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _cls in replacements]
+    try:
+        for module, name, cls in replacements:
+            setattr(module, name, cls)
+        yield
+    finally:
+        for module, name, cls in originals:
+            setattr(module, name, cls)
+
+
+def main(count: int = 20000):
+    """
+    Prints the bytes per Waypoint for new and for parsed waypoints,
+    without (before) and with (after) __slots__
+    """
+    with open(SAMPLE, encoding='utf-8', mode='r') as file:
+        line = file.read().split('\n')[1]
+    cases = (
+        ('Waypoint(0, 0, 0):       ', lambda: waypoint.Waypoint(0, 0, 0)),
+        ('Waypoint.from_line(line):', lambda: waypoint.Waypoint.from_line(line)),
+    )
+    print(f"{count} waypoints, without -> with __slots__")
+    for label, create in cases:
+        with unslotted_models():
+            before = measure(create, count)
+        after = measure(create, count)
+        print(f"{label} {before:8.0f} -> {after:8.0f} bytes/waypoint")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
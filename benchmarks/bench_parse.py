@@ -0,0 +1,57 @@
+"""
+Benchmark for parsing a litchi csv file with 100k lines
+
+Usage: python benchmarks/bench_parse.py [number of lines]
+"""
+# pylint: disable=import-error,wrong-import-position
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp.table import WaypointTable, parse_csv_bulk
+from litchi_wp.waypoint import Waypoint
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'waypoint', 'waypoints.csv')
+
+
+def main(count: int = 100000):
+    """
+    Writes a csv file with count lines and compares the parsers
+    """
+    with open(SAMPLE, encoding='utf-8', mode='r') as file:
+        lines = file.read().split('\n')[1:-1]
+    content = Waypoint.get_header() + ''.join(
+        lines[i % len(lines)] + '\n' for i in range(count)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'waypoints.csv')
+        with open(filename, encoding='utf-8', mode='w') as file:
+            file.write(content)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            reference = len(Waypoint.from_file(filename))
+        from_file = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = WaypointTable.from_file(filename)
+        table_from_file = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = parse_csv_bulk(content)
+    bulk_text = time.perf_counter() - start
+
+    assert reference == len(table) == len(bulk) == count
+    print(f"{count} lines")
+    print(f"Waypoint.from_file:       {from_file:8.3f} s")
+    print(f"WaypointTable.from_file:  {table_from_file:8.3f} s  ({from_file / table_from_file:5.1f}x)")
+    print(f"parse_csv_bulk:           {bulk_text:8.3f} s  ({from_file / bulk_text:5.1f}x)")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,55 @@
+"""
+Benchmark for simplifying a dense, noisy GPS track and the Douglas-Peucker worst case
+
+Usage: python benchmarks/bench_simplify.py [number of waypoints]
+"""
+# pylint: disable=import-error,wrong-import-position
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from litchi_wp import simplify
+from litchi_wp.waypoint import Waypoint
+
+
+def main(count: int = 1000000):
+    """
+    Simplifies a zigzag track of 1000 point runs with centimeter noise
+    """
+    random.seed(0)
+    waypoints = [
+        Waypoint(
+            50 + i * 1e-6 + random.gauss(0, 1e-7),
+            8 + (i // 1000 % 2) * (i % 1000) * 1e-6 + random.gauss(0, 1e-7),
+            30 + random.gauss(0, 0.02)
+        )
+        for i in range(count)
+    ]
+    print(f"{count} waypoints, numpy: {simplify.np is not None}")
+    for label, kwargs in [
+        ('visvalingam 10 m2', {'tolerance': 10}),
+        ('visvalingam 99 waypoints', {'max_waypoints': 99}),
+        ('douglas_peucker 1 m', {'tolerance': 1, 'method': 'douglas_peucker'}),
+    ]:
+        start = time.perf_counter()
+        kept = simplify.simplify(waypoints, **kwargs)
+        print(f"{label:25} {time.perf_counter() - start:7.3f} s  {len(kept)} waypoints kept")
+
+    # a spiral is the worst case of Douglas-Peucker, every split peels off one waypoint
+    for spiral_count in (count // 16, count // 4):
+        spiral = [
+            Waypoint(50 + i * 2e-8 * math.cos(i * 0.05), 8 + i * 3e-8 * math.sin(i * 0.05), 30)
+            for i in range(spiral_count)
+        ]
+        start = time.perf_counter()
+        kept = simplify.douglas_peucker(spiral, 0.5)
+        label = f'douglas_peucker spiral {spiral_count}'
+        print(f"{label:25} {time.perf_counter() - start:7.3f} s  {len(kept)} waypoints kept")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
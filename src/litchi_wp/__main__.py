@@ -0,0 +1,9 @@
+"""
+Entry point for python -m litchi_wp, see litchi_wp.cli
+"""
+import sys
+
+from litchi_wp.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,6 +14,7 @@ class Action:
         param (int | float): The parameter of the action. Depends on the actiontype
 
     """
+    __slots__ = ('type', 'param')
 
     def __init__(
             self,
@@ -146,3 +147,47 @@ class Action:
             raise ValueError('allowed range is -90 to 30')
         self.type = ActionType.TILT_CAMERA
         self.param = float(deg)
+
+
+class _EmptyAction(Action):
+    """
+    Immutable Action without type, shared by all empty action slots of Waypoints
+    """
+    __slots__ = ('_name',)
+
+    def __init__(self, param: int | float, name: str):
+        object.__setattr__(self, 'type', ActionType.NO_ACTION)
+        object.__setattr__(self, 'param', param)
+        object.__setattr__(self, '_name', name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('shared empty action is immutable, use Waypoint.replace_action')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self._name
+
+NO_ACTION: Action = _EmptyAction(0.0, 'NO_ACTION')
+"""Shared immutable empty action, equal to Action()"""
+
+DELETED_ACTION: Action = _EmptyAction(0, 'DELETED_ACTION')
+"""Shared immutable empty action, equal to an Action after Action.delete()"""
+
+
+def is_empty_action(action: Action) -> bool:
+    """
+    Checks if action is one of the shared immutable empty actions
+
+    Args:
+        action (Action): The action to be checked
+
+    Returns:
+        True if action is NO_ACTION or DELETED_ACTION
+
+    """
+    return action is NO_ACTION or action is DELETED_ACTION
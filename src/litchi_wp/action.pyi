@@ -15,3 +15,8 @@ class Action:
     def set_stop_rec(self) -> None: ...
     def set_rotate(self, deg: Union[int, float]): ...
     def set_tilt_cam(self, deg: Union[int, float]): ...
+
+NO_ACTION: Action
+DELETED_ACTION: Action
+
+def is_empty_action(action: Action) -> bool: ...
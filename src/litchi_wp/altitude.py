@@ -14,6 +14,7 @@ class Altitude:
         mode (AltitudeMode): The altitude mode
 
     """
+    __slots__ = ('value', 'mode')
 
     def __init__(self, value: float = -1.0, mode: AltitudeMode = AltitudeMode.AGL):
         """
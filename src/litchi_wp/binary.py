@@ -0,0 +1,330 @@
+"""
+Module for a compact binary mission format with memory mapped random access
+
+A file starts with a 16 byte header (magic b'LWPB', format version, record size and
+number of records, little endian) followed by one fixed size record per waypoint.
+A record holds the 46 csv columns in header order, so waypoint i starts at
+HEADER.size + i * record size and can be read without parsing the rest of the file.
+Enums are stored as int8 and coordinates, altitudes, speeds and the other free
+values as float64. The 15 action parameters are int16 in the compact layout
+(COMPACT_RECORD, 145 bytes), which is used if all of them are integral, and float64
+in the wide layout (RECORD, 235 bytes) otherwise, so both layouts are lossless.
+The record size in the header tells the layouts apart. Whole files are converted to
+columns with numpy if it is installed and with struct.iter_unpack otherwise.
+"""
+# pylint: disable=import-error
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator
+
+from litchi_wp.columns import ACTION_COLUMNS, ACTION_PARAM_COLUMNS, COLUMN_NAMES, ENUM_COLUMNS
+from litchi_wp.table import WaypointTable, typed_row
+from litchi_wp.waypoint import Waypoint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+MAGIC = b'LWPB'
+"""The first bytes of every binary mission file"""
+
+VERSION = 2
+"""The format version written by dump_binary, version 1 files (wide layout only) are read too"""
+
+HEADER = struct.Struct('<4sHHQ')
+"""Layout of the file header: magic, version, record size, number of records"""
+
+RECORD = struct.Struct('<' + ''.join('b' if i in ENUM_COLUMNS else 'd' for i in range(len(COLUMN_NAMES))))
+"""Layout of one waypoint record with float64 action parameters (wide layout)"""
+
+COMPACT_RECORD = struct.Struct('<' + ''.join(
+    'b' if i in ENUM_COLUMNS else 'h' if i in ACTION_PARAM_COLUMNS else 'd' for i in range(len(COLUMN_NAMES))
+))
+"""Layout of one waypoint record with int16 action parameters (compact layout)"""
+
+_PARAM_MINIMUM = -(1 << 15)
+_PARAM_MAXIMUM = (1 << 15) - 1
+
+
+def _is_compact_param(value: int | float) -> bool:
+    return float(value).is_integer() and _PARAM_MINIMUM <= value <= _PARAM_MAXIMUM
+
+
+def _compact_row(row: tuple[int | float, ...]) -> list[int | float]:
+    values = list(row)
+    for index in ACTION_PARAM_COLUMNS:
+        value = values[index]
+        if not _is_compact_param(value):
+            raise ValueError(f'{COLUMN_NAMES[index]} {value} does not fit the compact layout')
+        values[index] = int(value)
+    return values
+
+
+def dump_binary(
+        waypoints: Iterable[Waypoint] | WaypointTable,
+        file: str | os.PathLike | BinaryIO,
+        chunk_size: int = 4096,
+        compact: bool | None = None
+) -> int:
+    """
+    Writes waypoints to a binary mission file.
+    The records are written in chunks, the count in the header is written at the end,
+    so waypoints may be a generator and the stream has to be seekable.
+
+    Args:
+        waypoints (Iterable[Waypoint] | WaypointTable): The waypoints in flight order,
+            tables are written without creating Waypoint objects
+        file (str | os.PathLike | BinaryIO): The path + filename or a seekable binary stream
+        chunk_size (int): Number of records per write call
+        compact (bool | None): True for the compact, False for the wide layout. None uses
+            the compact layout for tables whose action parameters are all integral and
+            the wide layout for other waypoints, which are only iterated once.
+
+    Returns:
+        The number of written waypoints
+
+    Raises:
+        ValueError: If compact is True and an action parameter is not integral or out
+            of the int16 range, the file is incomplete then
+
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, mode='wb') as stream:
+            return dump_binary(waypoints, stream, chunk_size, compact)
+    if isinstance(waypoints, WaypointTable):
+        columns = waypoints.columns
+        fits = all(all(map(_is_compact_param, set(columns[index]))) for index in ACTION_PARAM_COLUMNS)
+        if compact is None:
+            compact = fits
+        elif compact and not fits:
+            raise ValueError('the action parameters do not fit the compact layout')
+        if compact:
+            columns = [
+                list(map(int, column)) if index in ACTION_PARAM_COLUMNS else column
+                for index, column in enumerate(columns)
+            ]
+        rows = zip(*columns)
+    else:
+        rows = (waypoint.to_row() for waypoint in waypoints)
+        if compact:
+            rows = map(_compact_row, rows)
+    record = COMPACT_RECORD if compact else RECORD
+    start = file.tell()
+    file.write(HEADER.pack(MAGIC, VERSION, record.size, 0))
+    pack = record.pack
+    count = 0
+    chunk = []
+    for row in rows:
+        chunk.append(pack(*row))
+        if len(chunk) >= chunk_size:
+            file.write(b''.join(chunk))
+            count += len(chunk)
+            chunk.clear()
+    file.write(b''.join(chunk))
+    count += len(chunk)
+    end = file.tell()
+    file.seek(start)
+    file.write(HEADER.pack(MAGIC, VERSION, record.size, count))
+    file.seek(end)
+    return count
+
+
+class BinaryMission:
+    """
+    Class giving read access to a memory mapped binary mission file.
+    Only the records that are accessed are read from the disk.
+
+    Attributes:
+        filename (str): The path + filename of the file
+
+    """
+    __slots__ = ('filename', '_file', '_map', '_count', '_record')
+
+    def __init__(self, filename: str | os.PathLike):
+        """
+        Constructor, opens and maps the file
+
+        Args:
+            filename (str | os.PathLike): The path + filename of the file
+
+        Raises:
+            ValueError: If the file is no binary mission file of a supported version
+                or is truncated
+
+        """
+        self.filename = os.fspath(filename)
+        self._file = open(filename, 'rb')  # pylint: disable=consider-using-with
+        try:
+            self._record, count = _read_header(self._file.read(HEADER.size), self.filename)
+            if os.fstat(self._file.fileno()).st_size < HEADER.size + count * self._record.size:
+                raise ValueError(f'{self.filename} is truncated')
+            self._count = count
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+
+    def __enter__(self) -> 'BinaryMission':
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Waypoint]:
+        for index in range(self._count):
+            yield self.get_waypoint(index)
+
+    def __getitem__(self, index: int) -> Waypoint:
+        return self.get_waypoint(index)
+
+    def close(self):
+        """
+        Unmaps and closes the file
+        """
+        self._map.close()
+        self._file.close()
+
+    def get_row(self, index: int) -> tuple[int | float, ...]:
+        """
+        Getter for a row, only the record of the waypoint is read
+
+        Args:
+            index (int): The index of the waypoint, negative indices count from the end
+
+        Returns:
+            The row values like Waypoint.to_row of the stored waypoint returns them
+
+        Raises:
+            IndexError: If index is out of range
+
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('waypoint index out of range')
+        record = self._record
+        values = list(record.unpack_from(self._map, HEADER.size + index * record.size))
+        if record is COMPACT_RECORD:
+            for _type_index, param_index in ACTION_COLUMNS:
+                values[param_index] = float(values[param_index])
+        return typed_row(values)
+
+    def get_waypoint(self, index: int) -> Waypoint:
+        """
+        Creates a Waypoint from a stored record
+
+        Args:
+            index (int): The index of the waypoint, negative indices count from the end
+
+        Returns:
+            The Waypoint as an instance
+
+        Raises:
+            IndexError: If index is out of range
+
+        """
+        return Waypoint.from_row(self.get_row(index))
+
+    def to_table(self) -> WaypointTable:
+        """
+        Reads all records into a WaypointTable without creating Waypoint objects
+
+        Returns:
+            The table as an instance
+
+        """
+        return _to_table(self._map, self._record, self._count)
+
+    def to_waypoints(self) -> list[Waypoint]:
+        """
+        Creates Waypoints from all stored records
+
+        Returns:
+            The list of Waypoints
+
+        """
+        return list(self)
+
+
+def _read_header(header: bytes | memoryview, name: str) -> tuple[struct.Struct, int]:
+    """
+    Unpacks a file header, returns the record layout and the number of records
+    """
+    if len(header) < HEADER.size:
+        raise ValueError(f'{name} is no binary mission file')
+    magic, version, record_size, count = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f'{name} is no binary mission file')
+    if version == VERSION and record_size == COMPACT_RECORD.size:
+        return COMPACT_RECORD, count
+    if version in (1, VERSION) and record_size == RECORD.size:
+        return RECORD, count
+    raise ValueError(f'{name} has the unsupported format version {version}')
+
+
+def _to_table(buffer, record: struct.Struct, count: int) -> WaypointTable:
+    """
+    Converts the records of a whole binary mission (header included) to a WaypointTable
+    """
+    table = WaypointTable()
+    if np is not None:
+        records = np.frombuffer(buffer, dtype=_record_dtype(record is COMPACT_RECORD), count=count, offset=HEADER.size)
+        for index, target in enumerate(table.columns):
+            target.frombytes(records[f'f{index}'].astype(target.typecode).tobytes())
+        del records
+        return table
+    with memoryview(buffer)[HEADER.size:HEADER.size + count * record.size] as view:
+        for target, column in zip(table.columns, zip(*record.iter_unpack(view))):
+            target.extend(column)
+    return table
+
+
+def _record_dtype(compact: bool):
+    return np.dtype([
+        (f'f{index}', '<i1' if index in ENUM_COLUMNS else '<i2' if compact and index in ACTION_PARAM_COLUMNS else '<f8')
+        for index in range(len(COLUMN_NAMES))
+    ])
+
+
+def load_binary(filename: str | os.PathLike) -> WaypointTable:
+    """
+    Reads a binary mission file into a WaypointTable
+
+    Args:
+        filename (str | os.PathLike): The path + filename of the file
+
+    Returns:
+        The table as an instance
+
+    Raises:
+        ValueError: If the file is no binary mission file of a supported version
+
+    """
+    with BinaryMission(filename) as mission:
+        return mission.to_table()
+
+
+def load_binary_bytes(data: bytes | bytearray | memoryview) -> WaypointTable:
+    """
+    Reads a binary mission that is already in memory into a WaypointTable
+
+    Args:
+        data (bytes | bytearray | memoryview): The content of a binary mission file
+
+    Returns:
+        The table as an instance
+
+    Raises:
+        ValueError: If data is no binary mission of a supported version or is truncated
+
+    """
+    with memoryview(data) as view:
+        record, count = _read_header(view, 'data')
+        if view.nbytes < HEADER.size + count * record.size:
+            raise ValueError('data is truncated')
+        return _to_table(view, record, count)
@@ -0,0 +1,32 @@
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, Union
+
+from litchi_wp.columns import ACTION_COLUMNS as ACTION_COLUMNS, ACTION_PARAM_COLUMNS as ACTION_PARAM_COLUMNS, COLUMN_NAMES as COLUMN_NAMES, ENUM_COLUMNS as ENUM_COLUMNS
+from litchi_wp.table import WaypointTable as WaypointTable, typed_row as typed_row
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+MAGIC: bytes
+VERSION: int
+HEADER: struct.Struct
+RECORD: struct.Struct
+COMPACT_RECORD: struct.Struct
+
+def dump_binary(waypoints: Union[Iterable[Waypoint], WaypointTable], file: Union[str, os.PathLike, BinaryIO], chunk_size: int = ..., compact: Union[bool, None] = ...) -> int: ...
+
+class BinaryMission:
+    filename: str
+    def __init__(self, filename: Union[str, os.PathLike]) -> None: ...
+    def __enter__(self) -> BinaryMission: ...
+    def __exit__(self, *_args) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Waypoint]: ...
+    def __getitem__(self, index: int) -> Waypoint: ...
+    def close(self) -> None: ...
+    def get_row(self, index: int) -> tuple[Union[int, float], ...]: ...
+    def get_waypoint(self, index: int) -> Waypoint: ...
+    def to_table(self) -> WaypointTable: ...
+    def to_waypoints(self) -> list[Waypoint]: ...
+
+def load_binary(filename: Union[str, os.PathLike]) -> WaypointTable: ...
+def load_binary_bytes(data: Union[bytes, bytearray, memoryview]) -> WaypointTable: ...
@@ -0,0 +1,248 @@
+"""
+Module for caching parsed litchi csv files
+
+Files are identified either by their path, modification time and size (cheap, one
+stat call per load) or by a hash of their content (the file is read, but not parsed).
+Parsed files are kept as WaypointTables in a least recently used memory cache and
+optionally written to a directory in the binary mission format, so that other
+processes and later runs also skip the csv parsing. Every cache file ends with a
+blake2b digest of the binary mission before it, files whose digest does not match
+(e.g. truncated or corrupted on the disk) are parsed again.
+"""
+# pylint: disable=import-error
+import gzip
+import hashlib
+import io
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from typing import Callable
+
+from litchi_wp.binary import dump_binary, load_binary_bytes
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+KEYS = ('stat', 'hash')
+"""The supported kinds of cache keys"""
+
+DIGEST_SIZE = 32
+"""The size of the blake2b digest at the end of every cache file"""
+
+
+class CacheStats:
+    """
+    Class counting the loads of a ParseCache
+
+    Attributes:
+        hits (int): Loads served from memory
+        disk_hits (int): Loads served from the cache directory
+        misses (int): Loads that parsed the csv file
+        evictions (int): Tables dropped from memory because the cache was full
+
+    """
+    __slots__ = ('hits', 'disk_hits', 'misses', 'evictions')
+
+    def __init__(self):
+        """
+        Constructor, all counters start at 0
+        """
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f'CacheStats(hits={self.hits}, disk_hits={self.disk_hits}, '
+            f'misses={self.misses}, evictions={self.evictions})'
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Getter for the share of loads that did not parse
+
+        Returns:
+            (hits + disk_hits) / all loads, 0.0 before the first load
+
+        """
+        loads = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / loads if loads else 0.0
+
+
+class ParseCache:
+    """
+    Class caching parsed litchi csv files in memory and optionally on disk.
+    The loaders return copies, the cached tables cannot be changed by the caller.
+    Lines that could not be parsed are only reported when the file is parsed,
+    not on cache hits. Instances are not thread safe.
+
+    Attributes:
+        max_entries (int): The maximum number of tables kept in memory
+        directory (str | None): The directory of the binary cache files, None for memory only
+        key (str): 'stat' to identify files by path, modification time and size,
+            'hash' to identify them by their content
+        stats (CacheStats): The hit and miss counters
+
+    """
+    __slots__ = ('max_entries', 'directory', 'key', 'stats', '_tables')
+
+    def __init__(self, max_entries: int = 32, directory: str | os.PathLike | None = None, key: str = 'stat'):
+        """
+        Constructor, creates the directory if it does not exist
+
+        Args:
+            max_entries (int): The maximum number of tables kept in memory
+            directory (str | os.PathLike | None): The directory of the binary cache files,
+                None for memory only
+            key (str): 'stat' or 'hash', see the attributes
+
+        Raises:
+            ValueError: If max_entries is not positive or key is not supported
+
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries has to be positive')
+        if key not in KEYS:
+            raise ValueError(f'key has to be one of {KEYS}')
+        self.max_entries = max_entries
+        self.directory = os.fspath(directory) if directory is not None else None
+        self.key = key
+        self.stats = CacheStats()
+        self._tables: OrderedDict[str, WaypointTable] = OrderedDict()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def clear(self):
+        """
+        Drops all tables from memory, the cache directory is not changed
+        """
+        self._tables.clear()
+
+    def load_table(
+            self,
+            filename: str | os.PathLike,
+            on_error: Callable[[int, str, ValueError], None] | None = None
+    ) -> WaypointTable:
+        """
+        Loads a litchi csv file as table, parsing it only if it is not cached
+
+        Args:
+            filename (str | os.PathLike): The path + filename, paths ending with '.gz'
+                are read as gzip compressed text
+            on_error (Callable[[int, str, ValueError], None] | None): Called with the
+                line number, the line and the error for every line that could not be
+                parsed, only if the file is parsed
+
+        Returns:
+            A copy of the cached table
+
+        Raises:
+            OSError: If the file cannot be read
+
+        """
+        content = None
+        if self.key == 'hash':
+            with open(filename, mode='rb') as file:
+                content = file.read()
+            key = hashlib.blake2b(content, digest_size=20).hexdigest()
+        else:
+            stat = os.stat(filename)
+            key = hashlib.blake2b(
+                f'{os.path.abspath(filename)}\0{stat.st_mtime_ns}\0{stat.st_size}'.encode('utf-8'),
+                digest_size=20
+            ).hexdigest()
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            self.stats.hits += 1
+            return table[:]
+        table = self._load_disk(key)
+        if table is not None:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.misses += 1
+            if content is None:
+                table = WaypointTable.from_file(filename, on_error)
+            else:
+                if os.fspath(filename).endswith('.gz'):
+                    content = gzip.decompress(content)
+                table = WaypointTable.from_file(io.StringIO(content.decode('utf-8')), on_error)
+            self._store_disk(key, table)
+        self._tables[key] = table
+        while len(self._tables) > self.max_entries:
+            self._tables.popitem(last=False)
+            self.stats.evictions += 1
+        return table[:]
+
+    def from_file(
+            self,
+            filename: str | os.PathLike,
+            on_error: Callable[[int, str, ValueError], None] | None = None
+    ) -> list[Waypoint]:
+        """
+        Creates a list of Waypoints from a litchi csv file like Waypoint.from_file,
+        parsing it only if it is not cached, see load_table
+
+        Args:
+            filename (str | os.PathLike): The path + filename of the file
+            on_error (Callable[[int, str, ValueError], None] | None): Called for every
+                line that could not be parsed, only if the file is parsed
+
+        Returns:
+            The list of Waypoints
+
+        Raises:
+            OSError: If the file cannot be read
+
+        """
+        return self.load_table(filename, on_error).to_waypoints()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.lwpb')
+
+    def _load_disk(self, key: str) -> WaypointTable | None:
+        """
+        Loads the cache file of the key, None if there is none or its digest does not match
+        """
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, mode='rb') as file:
+                content = file.read()
+            if len(content) <= DIGEST_SIZE:
+                return None
+            # the checked bytes are parsed, the file is not opened a second time
+            payload = memoryview(content)[:-DIGEST_SIZE]
+            if hashlib.blake2b(payload, digest_size=DIGEST_SIZE).digest() != content[-DIGEST_SIZE:]:
+                return None
+            return load_binary_bytes(payload)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def _store_disk(self, key: str, table: WaypointTable):
+        """
+        Writes the table and its digest to a temporary file that replaces the cache file,
+        so concurrent readers never see a partial file. Errors are ignored, the table
+        is only not cached on the disk then.
+        """
+        if self.directory is None:
+            return
+        temporary = None
+        try:
+            buffer = io.BytesIO()
+            dump_binary(table, buffer)
+            payload = buffer.getvalue()
+            handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(handle, mode='wb') as file:
+                file.write(payload)
+                file.write(hashlib.blake2b(payload, digest_size=DIGEST_SIZE).digest())
+            os.replace(temporary, self._path(key))
+        except Exception:  # pylint: disable=broad-except
+            if temporary is not None and os.path.exists(temporary):
+                os.remove(temporary)
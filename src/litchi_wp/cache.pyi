@@ -0,0 +1,29 @@
+import os
+from typing import Callable, Union
+
+from litchi_wp.binary import dump_binary as dump_binary, load_binary_bytes as load_binary_bytes
+from litchi_wp.table import WaypointTable as WaypointTable
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+KEYS: tuple[str, ...]
+DIGEST_SIZE: int
+
+class CacheStats:
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    def __init__(self) -> None: ...
+    @property
+    def hit_rate(self) -> float: ...
+
+class ParseCache:
+    max_entries: int
+    directory: Union[str, None]
+    key: str
+    stats: CacheStats
+    def __init__(self, max_entries: int = ..., directory: Union[str, os.PathLike, None] = ..., key: str = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+    def load_table(self, filename: Union[str, os.PathLike], on_error: Union[Callable[[int, str, ValueError], None], None] = ...) -> WaypointTable: ...
+    def from_file(self, filename: Union[str, os.PathLike], on_error: Union[Callable[[int, str, ValueError], None], None] = ...) -> list[Waypoint]: ...
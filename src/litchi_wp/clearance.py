@@ -0,0 +1,275 @@
+"""
+Module for checking the ground clearance of missions and for terrain following
+"""
+# pylint: disable=import-error,too-many-arguments,too-many-locals
+import math
+from collections import OrderedDict
+from typing import Sequence
+
+from litchi_wp.enums import AltitudeMode
+from litchi_wp.geodesy import haversine
+from litchi_wp.split import resume_waypoint
+from litchi_wp.terrain import Terrain
+from litchi_wp.waypoint import Waypoint
+
+Profile = tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...]]
+
+
+class LegClearance:
+    """
+    Class representing the lowest point of a leg above the terrain
+
+    Attributes:
+        index (int): The index of the waypoint the leg starts at
+        clearance (float): The smallest height above the terrain in meters
+        lat (float): The latitude of the lowest point
+        lon (float): The longitude of the lowest point
+        ok (bool): True if clearance is not below the required minimum
+
+    """
+    __slots__ = ('index', 'clearance', 'lat', 'lon', 'ok')
+
+    def __init__(self, index: int, clearance: float, lat: float, lon: float, ok: bool):
+        """
+        Constructor
+
+        Args:
+            index (int): The index of the waypoint the leg starts at
+            clearance (float): The smallest height above the terrain in meters
+            lat (float): The latitude of the lowest point
+            lon (float): The longitude of the lowest point
+            ok (bool): True if clearance is not below the required minimum
+
+        """
+        self.index = index
+        self.clearance = clearance
+        self.lat = lat
+        self.lon = lon
+        self.ok = ok
+
+    def __repr__(self) -> str:
+        return f'LegClearance(index={self.index}, clearance={self.clearance:.1f}, ok={self.ok})'
+
+
+class ClearanceChecker:
+    """
+    Class sampling the terrain along the legs of missions.
+    The terrain profile of every leg is cached by its end points, so checking an
+    edited mission again only samples the legs whose waypoints were moved.
+
+    Attributes:
+        terrain (Terrain): The terrain heights
+        step (float): The distance between the samples of a leg in meters
+        min_clearance (float): The required height above the terrain in meters
+        cache_size (int): The maximum number of cached leg profiles
+
+    """
+    __slots__ = ('terrain', 'step', 'min_clearance', 'cache_size', '_profiles')
+
+    def __init__(
+            self,
+            terrain: Terrain,
+            step: float = 10.0,
+            min_clearance: float = 30.0,
+            cache_size: int = 100000
+    ):
+        """
+        Constructor
+
+        Args:
+            terrain (Terrain): The terrain heights
+            step (float): The distance between the samples of a leg in meters
+            min_clearance (float): The required height above the terrain in meters
+            cache_size (int): The maximum number of cached leg profiles
+
+        Raises:
+            ValueError: If step is not positive
+
+        """
+        if step <= 0:
+            raise ValueError('step has to be positive')
+        self.terrain = terrain
+        self.step = float(step)
+        self.min_clearance = float(min_clearance)
+        self.cache_size = cache_size
+        self._profiles: OrderedDict[tuple[float, float, float, float], Profile] = OrderedDict()
+
+    def profiles(self, waypoints: Sequence[Waypoint]) -> list[Profile]:
+        """
+        Getter for the terrain profiles of all legs.
+        The legs missing in the cache are sampled together in one batch.
+
+        Args:
+            waypoints (Sequence[Waypoint]): The waypoints in flight order
+
+        Returns:
+            Per leg the latitudes, longitudes and terrain heights of the samples,
+            including both end points
+
+        Raises:
+            ValueError: If no terrain tile covers a sample
+
+        """
+        keys = [
+            (start.lat, start.lon, end.lat, end.lon)
+            for start, end in zip(waypoints, waypoints[1:])
+        ]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._profiles]
+        if missing:
+            lats: list[float] = []
+            lons: list[float] = []
+            bounds = []
+            for lat1, lon1, lat2, lon2 in missing:
+                count = max(1, math.ceil(haversine(lat1, lon1, lat2, lon2) / self.step))
+                bounds.append((len(lats), len(lats) + count + 1))
+                lats.extend(lat1 + (lat2 - lat1) * i / count for i in range(count + 1))
+                lons.extend(lon1 + (lon2 - lon1) * i / count for i in range(count + 1))
+            heights = self.terrain.elevations(lats, lons)
+            for key, (first, last) in zip(missing, bounds):
+                self._profiles[key] = (
+                    tuple(lats[first:last]), tuple(lons[first:last]), tuple(heights[first:last])
+                )
+        profiles = []
+        for key in keys:
+            self._profiles.move_to_end(key)
+            profiles.append(self._profiles[key])
+        while len(self._profiles) > self.cache_size:
+            self._profiles.popitem(last=False)
+        return profiles
+
+    def check(self, waypoints: Sequence[Waypoint]) -> list[LegClearance]:
+        """
+        Calculates the lowest clearance of every leg.
+        The aircraft is assumed to change its altitude linearly along a leg,
+        AGL altitudes are relative to the terrain below their waypoint.
+
+        Args:
+            waypoints (Sequence[Waypoint]): The waypoints in flight order
+
+        Returns:
+            One LegClearance per leg (len(waypoints) - 1)
+
+        Raises:
+            ValueError: If no terrain tile covers a sample or a leg is void
+
+        """
+        legs = []
+        for index, (lats, lons, heights) in enumerate(self.profiles(waypoints)):
+            start = _msl(waypoints[index], heights[0])
+            end = _msl(waypoints[index + 1], heights[-1])
+            last = len(heights) - 1
+            lowest_point = min(
+                ((start + (end - start) * i / last - height, i)
+                 for i, height in enumerate(heights)
+                 if not math.isnan(height)),
+                default=None
+            )
+            if lowest_point is None:
+                raise ValueError(f'the terrain is void along leg {index}')
+            clearance, lowest = lowest_point
+            legs.append(LegClearance(
+                index, clearance, lats[lowest], lons[lowest], clearance >= self.min_clearance
+            ))
+        return legs
+
+    def low_legs(self, waypoints: Sequence[Waypoint]) -> list[LegClearance]:
+        """
+        Finds the legs whose clearance drops below min_clearance
+
+        Args:
+            waypoints (Sequence[Waypoint]): The waypoints in flight order
+
+        Returns:
+            The LegClearance of every leg that is too low
+
+        Raises:
+            ValueError: If no terrain tile covers a sample
+
+        """
+        return [leg for leg in self.check(waypoints) if not leg.ok]
+
+    def follow_terrain(
+            self,
+            waypoints: Sequence[Waypoint],
+            agl: float,
+            tolerance: float = 5.0
+    ) -> list[Waypoint]:
+        """
+        Creates a terrain following mission with a constant height above ground.
+        The waypoints get the MSL altitude agl above their terrain, and waypoints are
+        inserted along the legs where the straight flight would deviate more than
+        tolerance from the terrain profile. Inserted waypoints copy the position
+        independent settings of the leg start but none of its actions.
+
+        Args:
+            waypoints (Sequence[Waypoint]): The waypoints in flight order, changed in place
+            agl (float): The height above ground in meters
+            tolerance (float): The allowed deviation from agl in meters
+
+        Returns:
+            The waypoints with the inserted ones in flight order
+
+        Raises:
+            ValueError: If no terrain tile covers a sample or the terrain is void,
+                the waypoints are not changed then
+
+        """
+        profiles = self.profiles(waypoints)
+        if not profiles:
+            if waypoints:
+                height = self.terrain.elevation(waypoints[0].lat, waypoints[0].lon)
+                waypoints[0].set_altitude(_checked(height) + agl, AltitudeMode.MSL)
+            return list(waypoints)
+        # all profiles are checked before the first waypoint is changed
+        all_targets = [
+            [_checked(height) + agl for height in heights] for _lats, _lons, heights in profiles
+        ]
+        result = []
+        for index, ((lats, lons, _heights), targets) in enumerate(zip(profiles, all_targets)):
+            start = waypoints[index]
+            start.set_altitude(targets[0], AltitudeMode.MSL)
+            result.append(start)
+            for i in _breakpoints(targets, tolerance):
+                waypoint = resume_waypoint(start)
+                waypoint.set_coordinates(lats[i], lons[i])
+                waypoint.set_altitude(targets[i], AltitudeMode.MSL)
+                result.append(waypoint)
+        last = waypoints[-1]
+        last.set_altitude(all_targets[-1][-1], AltitudeMode.MSL)
+        result.append(last)
+        return result
+
+
+def _msl(waypoint: Waypoint, height: float) -> float:
+    if waypoint.altitude.mode is AltitudeMode.AGL:
+        return waypoint.altitude.value + _checked(height)
+    return waypoint.altitude.value
+
+
+def _checked(height: float) -> float:
+    if math.isnan(height):
+        raise ValueError('the terrain is void along the mission')
+    return height
+
+
+def _breakpoints(targets: Sequence[float], tolerance: float) -> list[int]:
+    """
+    Finds the inner samples that must become waypoints so that the straight lines
+    between them stay within tolerance of the targets (Douglas-Peucker on the profile)
+    """
+    keep = []
+    stack = [(0, len(targets) - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst = tolerance
+        worst_index = None
+        for i in range(first + 1, last):
+            line = targets[first] + (targets[last] - targets[first]) * (i - first) / (last - first)
+            if abs(line - targets[i]) > worst:
+                worst = abs(line - targets[i])
+                worst_index = i
+        if worst_index is not None:
+            keep.append(worst_index)
+            stack.append((first, worst_index))
+            stack.append((worst_index, last))
+    return sorted(keep)
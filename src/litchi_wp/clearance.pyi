@@ -0,0 +1,29 @@
+from collections import OrderedDict
+from typing import Sequence
+
+from litchi_wp.enums import AltitudeMode as AltitudeMode
+from litchi_wp.geodesy import haversine as haversine
+from litchi_wp.split import resume_waypoint as resume_waypoint
+from litchi_wp.terrain import Terrain as Terrain
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+Profile = tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...]]
+
+class LegClearance:
+    index: int
+    clearance: float
+    lat: float
+    lon: float
+    ok: bool
+    def __init__(self, index: int, clearance: float, lat: float, lon: float, ok: bool) -> None: ...
+
+class ClearanceChecker:
+    terrain: Terrain
+    step: float
+    min_clearance: float
+    cache_size: int
+    def __init__(self, terrain: Terrain, step: float = ..., min_clearance: float = ..., cache_size: int = ...) -> None: ...
+    def profiles(self, waypoints: Sequence[Waypoint]) -> list[Profile]: ...
+    def check(self, waypoints: Sequence[Waypoint]) -> list[LegClearance]: ...
+    def low_legs(self, waypoints: Sequence[Waypoint]) -> list[LegClearance]: ...
+    def follow_terrain(self, waypoints: Sequence[Waypoint], agl: float, tolerance: float = ...) -> list[Waypoint]: ...
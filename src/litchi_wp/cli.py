@@ -0,0 +1,233 @@
+"""
+Command line interface for checking and converting many litchi csv files in parallel
+
+Usage: python -m litchi_wp [options] PATH [PATH ...]
+
+PATH can be a csv file, a directory (searched recursively for *.csv and *.csv.gz)
+or a glob pattern. Without --output the files are only parsed and checked.
+"""
+# pylint: disable=import-error
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence, TextIO
+
+from litchi_wp import __version__
+from litchi_wp.enums import NumberFormat
+from litchi_wp.formatting import set_number_format
+from litchi_wp.simplify import simplify
+from litchi_wp.split import split_mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+class FileResult:
+    """
+    Class representing the outcome of processing one file
+
+    Attributes:
+        source (str): The input file
+        targets (list[str]): The written files
+        waypoints (int): The number of parsed waypoints
+        rejected (list[tuple[int, str]]): Line number and error of every rejected line
+        error (str | None): The error that stopped the processing, None on success
+        seconds (float): The processing time
+
+    """
+    __slots__ = ('source', 'targets', 'waypoints', 'rejected', 'error', 'seconds')
+
+    def __init__(self, source: str):
+        """
+        Constructor
+
+        Args:
+            source (str): The input file
+
+        """
+        self.source = source
+        self.targets: list[str] = []
+        self.waypoints = 0
+        self.rejected: list[tuple[int, str]] = []
+        self.error: str | None = None
+        self.seconds = 0.0
+
+
+def find_files(paths: Sequence[str]) -> list[tuple[str, str]]:
+    """
+    Expands files, directories and glob patterns to csv files
+
+    Args:
+        paths (Sequence[str]): The files, directories and glob patterns
+
+    Returns:
+        The files with their path relative to the given directory (or their name)
+        in sorted order without duplicates
+
+    """
+    files: dict[str, str] = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _directories, names in os.walk(path):
+                for name in names:
+                    if name.lower().endswith(('.csv', '.csv.gz')):
+                        file = os.path.join(root, name)
+                        files.setdefault(file, os.path.relpath(file, path))
+        else:
+            for file in glob.glob(path, recursive=True) or [path]:
+                files.setdefault(file, os.path.basename(file))
+    return sorted(files.items())
+
+
+def process_file(task: tuple[str, str | None, dict]) -> FileResult:
+    """
+    Parses one file, applies the transformations and writes the result.
+    All errors are caught and reported in the result, so one broken file
+    does not stop the batch. Numbers are written in the global number format.
+
+    Args:
+        task (tuple[str, str | None, dict]): The input file, the output file
+            (None to only check) and the options
+
+    Returns:
+        The result of the file
+
+    """
+    source, target, options = task
+    result = FileResult(source)
+    start = time.perf_counter()
+    try:
+        table = WaypointTable.from_file(
+            source, on_error=lambda number, _line, error: result.rejected.append((number, str(error)))
+        )
+        result.waypoints = len(table)
+        if result.rejected and options['strict']:
+            raise ValueError(f'{len(result.rejected)} invalid lines')
+        if target is not None:
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            if not (options['reverse'] or options['simplify'] is not None or options['split']):
+                table.to_file(target)
+                result.targets.append(target)
+            else:
+                waypoints = table.to_waypoints()
+                if options['reverse']:
+                    waypoints.reverse()
+                if options['simplify'] is not None:
+                    waypoints = simplify(waypoints, options['simplify'], method='douglas_peucker')
+                if options['split']:
+                    stem, extension = target, ''
+                    for suffix in ('.csv.gz', '.csv'):
+                        if target.lower().endswith(suffix):
+                            stem, extension = target[:-len(suffix)], target[-len(suffix):]
+                            break
+                    for number, part in enumerate(
+                            split_mission(waypoints, max_waypoints=options['split']), start=1
+                    ):
+                        name = f'{stem}_{number:03d}{extension}'
+                        Waypoint.dump_many(part, name)
+                        result.targets.append(name)
+                else:
+                    Waypoint.dump_many(waypoints, target)
+                    result.targets.append(target)
+    except Exception as error:  # pylint: disable=broad-except
+        result.error = f'{type(error).__name__}: {error}'
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _report(result: FileResult, done: int, total: int, verbose: bool, stream: TextIO):
+    status = 'FAILED' if result.error else 'ok'
+    if verbose or result.error or result.rejected:
+        stream.write(f'[{done}/{total}] {result.source}: {status}, {result.waypoints} waypoints')
+        if result.rejected:
+            stream.write(f', {len(result.rejected)} rejected lines')
+        stream.write('\n')
+        if result.error:
+            stream.write(f'    {result.error}\n')
+        for number, error in result.rejected[:5]:
+            stream.write(f'    line {number}: {error}\n')
+        if len(result.rejected) > 5:
+            stream.write(f'    ... {len(result.rejected) - 5} more\n')
+    elif done == total or done % 100 == 0:
+        stream.write(f'[{done}/{total}] processed\n')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Creates the argument parser of the command line interface
+
+    Returns:
+        The parser
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m litchi_wp',
+        description='Checks and converts litchi waypoint csv files in parallel.'
+    )
+    parser.add_argument('paths', nargs='+', metavar='PATH', help='csv files, directories or glob patterns')
+    parser.add_argument('-o', '--output', help='output directory, without it the files are only checked')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='number of processes (default: CPUs)')
+    parser.add_argument('--chunksize', type=int, default=8, help='files per scheduled task (default: 8)')
+    parser.add_argument('--strict', action='store_true', help='treat files with invalid lines as failed')
+    parser.add_argument('--reverse', action='store_true', help='reverse the flight order')
+    parser.add_argument('--simplify', type=float, metavar='METERS',
+                        help='remove waypoints within METERS of the simplified track')
+    parser.add_argument('--split', type=int, metavar='N',
+                        help='split into files of at most N waypoints (litchi allows 99)')
+    parser.add_argument('--number-format', choices=[member.name.lower() for member in NumberFormat],
+                        default='repr', help='formatting of the written numbers (default: repr)')
+    parser.add_argument('--precision', type=int, default=7,
+                        help='decimals of --number-format fixed (default: 7)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='report every file')
+    parser.add_argument('--version', action='version', version=f'litchi_wp {__version__}')
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Runs the command line interface
+
+    Args:
+        argv (Sequence[str] | None): The arguments, sys.argv[1:] if None
+
+    Returns:
+        The exit code, 1 if a file failed, 0 otherwise
+
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.split is not None and args.split < 2:
+        parser.error('--split needs at least 2 waypoints')
+    if args.precision < 0:
+        parser.error('--precision must not be negative')
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs needs at least 1 process')
+    if args.chunksize < 1:
+        parser.error('--chunksize has to be at least 1')
+    options = {'strict': args.strict, 'reverse': args.reverse, 'simplify': args.simplify, 'split': args.split}
+    files = find_files(args.paths)
+    tasks = [
+        (source, os.path.join(args.output, relative) if args.output else None, options)
+        for source, relative in files
+    ]
+    start = time.perf_counter()
+    failed = waypoints = 0
+    with ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=set_number_format,
+            initargs=(NumberFormat[args.number_format.upper()], args.precision)
+    ) as executor:
+        for done, result in enumerate(
+                executor.map(process_file, tasks, chunksize=args.chunksize), start=1
+        ):
+            _report(result, done, len(tasks), args.verbose, sys.stderr)
+            failed += result.error is not None
+            waypoints += result.waypoints
+    seconds = time.perf_counter() - start
+    sys.stderr.write(
+        f'{len(tasks)} files ({failed} failed), {waypoints} waypoints in {seconds:.2f} s '
+        f'({waypoints / seconds if seconds else 0:.0f} waypoints/s)\n'
+    )
+    return 1 if failed else 0
@@ -0,0 +1,24 @@
+import argparse
+from typing import Optional, Sequence
+
+from litchi_wp import __version__ as __version__
+from litchi_wp.enums import NumberFormat as NumberFormat
+from litchi_wp.formatting import set_number_format as set_number_format
+from litchi_wp.simplify import simplify as simplify
+from litchi_wp.split import split_mission as split_mission
+from litchi_wp.table import WaypointTable as WaypointTable
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+class FileResult:
+    source: str
+    targets: list[str]
+    waypoints: int
+    rejected: list[tuple[int, str]]
+    error: Optional[str]
+    seconds: float
+    def __init__(self, source: str) -> None: ...
+
+def find_files(paths: Sequence[str]) -> list[tuple[str, str]]: ...
+def process_file(task: tuple[str, Optional[str], dict]) -> FileResult: ...
+def build_parser() -> argparse.ArgumentParser: ...
+def main(argv: Optional[Sequence[str]] = ...) -> int: ...
@@ -0,0 +1,248 @@
+"""
+Module with the declarative specification of the 46 litchi csv columns
+
+Every column is described once by its name, the pattern of its text, its allowed
+values or range and the expression that reads it from a Waypoint. The header, the
+compiled line pattern, the field patterns of the bulk parser, the ranges of the
+validator and the row getter of the writers are all generated from COLUMNS at
+import time, so adding a column to the format only means adding it here.
+"""
+# pylint: disable=import-error
+import re
+from typing import Callable, Iterable
+
+from litchi_wp.enums import ActionType, AltitudeMode, GimbalMode, RotationDirection
+
+_NUMBER = r'[-]?\d+(\.\d+)?'
+_UNSIGNED = r'\d+(\.\d+)?'
+_INTERVAL = r'(-1|\d+)(\.\d+)?'
+
+
+class Column:
+    """
+    Class describing one csv column
+
+    Attributes:
+        index (int): The position in the csv line
+        name (str): The name in the header
+        pattern (str): The regular expression a valid value matches completely
+        accessor (str): The expression reading the value from a waypoint
+        values (frozenset[int] | None): The allowed int values of enum columns, None otherwise
+        minimum (float | None): The smallest valid value, None if not checked
+        maximum (float | None): The largest valid value, None if not checked
+        condition (tuple[str, int] | None): The name of an enum column and its value
+            the range applies to, the value is 0 for all other values of that column
+        disabled (float | None): A value outside the range that disables the column
+
+    """
+    __slots__ = ('index', 'name', 'pattern', 'accessor', 'values', 'minimum', 'maximum', 'condition', 'disabled')
+
+    def __init__(
+            self,
+            name: str,
+            pattern: str,
+            accessor: str,
+            values: Iterable[int] | None = None,
+            minimum: float | None = None,
+            maximum: float | None = None,
+            condition: tuple[str, int] | None = None,
+            disabled: float | None = None
+    ):
+        """
+        Constructor, the index is set when the column is added to COLUMNS
+
+        Args:
+            name (str): The name in the header
+            pattern (str): The regular expression a valid value matches completely
+            accessor (str): The expression reading the value from a waypoint,
+                relative to the waypoint (e.g. 'altitude.value')
+            values (Iterable[int] | None): The allowed int values of enum columns
+            minimum (float | None): The smallest valid value, None if not checked
+            maximum (float | None): The largest valid value, None if not checked
+            condition (tuple[str, int] | None): The name of an enum column and the value
+                the range applies to, None if the range always applies
+            disabled (float | None): A value outside the range that disables the column
+
+        """
+        self.index = -1
+        self.name = name
+        self.pattern = pattern
+        self.accessor = accessor
+        self.values = frozenset(values) if values is not None else None
+        self.minimum = minimum
+        self.maximum = maximum
+        self.condition = condition
+        self.disabled = disabled
+
+    def __repr__(self) -> str:
+        return f'Column({self.index}, {self.name!r})'
+
+    @property
+    def is_enum(self) -> bool:
+        """
+        Getter for the column type
+
+        Returns:
+            True if the column holds enum values (stored as signed char), False for numbers
+
+        """
+        return self.values is not None
+
+
+def _enum_values(enum) -> list[int]:
+    return [member.value for member in enum]
+
+
+ACTION_PARAM_RANGES: dict[int, tuple[float, float]] = {
+    ActionType.STAY_FOR.value: (0.0, 32000.0),
+    ActionType.ROTATE_AIRCRAFT.value: (0.0, 359.0),
+    ActionType.TILT_CAMERA.value: (-90.0, 30.0)
+}
+"""The valid parameter range of the action types with a parameter, the others store 0"""
+
+
+def _action_columns() -> list[Column]:
+    columns = []
+    for slot in range(15):
+        columns.append(Column(
+            f'actiontype{slot + 1}', '-1|[0-5]', f'_actions[{slot}].type.value', _enum_values(ActionType)
+        ))
+        columns.append(Column(f'actionparam{slot + 1}', _NUMBER, f'_actions[{slot}].param'))
+    return columns
+
+
+COLUMNS: tuple[Column, ...] = tuple([
+    Column('latitude', _NUMBER, 'lat', minimum=-90.0, maximum=90.0),
+    Column('longitude', _NUMBER, 'lon', minimum=-180.0, maximum=180.0),
+    Column('altitude(m)', _UNSIGNED, 'altitude.value'),
+    Column('heading(deg)', _NUMBER, 'heading', minimum=-360.0, maximum=360.0),
+    Column('curvesize(m)', _NUMBER, 'curvesize', minimum=0.0),
+    Column('rotationdir', '[0-1]+', 'rotationdir.value', _enum_values(RotationDirection)),
+    Column('gimbalmode', '[-1]|[0-2]', 'gimbal.mode.value', _enum_values(GimbalMode)),
+    Column(
+        'gimbalpitchangle', _NUMBER, 'gimbal.pitchangle', minimum=-90.0, maximum=30.0,
+        condition=('gimbalmode', GimbalMode.INTERPOLATE.value)
+    ),
+    *_action_columns(),
+    Column('altitudemode', '[0-1]', 'altitude.mode.value', _enum_values(AltitudeMode)),
+    Column('speed(m/s)', _UNSIGNED, 'speed'),
+    Column('poi_latitude', _NUMBER, 'poi.lat', minimum=-90.0, maximum=90.0),
+    Column('poi_longitude', _NUMBER, 'poi.lon', minimum=-180.0, maximum=180.0),
+    Column('poi_altitude(m)', _UNSIGNED, 'poi.altitude.value', minimum=0.0),
+    Column('poi_altitudemode', '[-]?[0-1]', 'poi.altitude.mode.value', _enum_values(AltitudeMode)),
+    Column('photo_timeinterval', _INTERVAL, 'photo.time_interval', minimum=0.0, disabled=-1.0),
+    Column('photo_distinterval', _INTERVAL, 'photo.distance_interval', minimum=0.0, disabled=-1.0),
+])
+"""The 46 litchi csv columns in file order"""
+
+for _index, _column in enumerate(COLUMNS):
+    _column.index = _index
+
+COLUMN_NAMES: tuple[str, ...] = tuple(column.name for column in COLUMNS)
+"""The names of the 46 litchi csv columns in file order"""
+
+COLUMN_INDICES: dict[str, int] = {column.name: column.index for column in COLUMNS}
+"""The index of every column by its name"""
+
+LATITUDE = COLUMN_INDICES['latitude']
+LONGITUDE = COLUMN_INDICES['longitude']
+ALTITUDE = COLUMN_INDICES['altitude(m)']
+HEADING = COLUMN_INDICES['heading(deg)']
+CURVESIZE = COLUMN_INDICES['curvesize(m)']
+ROTATIONDIR = COLUMN_INDICES['rotationdir']
+GIMBALMODE = COLUMN_INDICES['gimbalmode']
+GIMBALPITCHANGLE = COLUMN_INDICES['gimbalpitchangle']
+ALTITUDEMODE = COLUMN_INDICES['altitudemode']
+SPEED = COLUMN_INDICES['speed(m/s)']
+POI_LATITUDE = COLUMN_INDICES['poi_latitude']
+POI_LONGITUDE = COLUMN_INDICES['poi_longitude']
+POI_ALTITUDE = COLUMN_INDICES['poi_altitude(m)']
+POI_ALTITUDEMODE = COLUMN_INDICES['poi_altitudemode']
+PHOTO_TIMEINTERVAL = COLUMN_INDICES['photo_timeinterval']
+PHOTO_DISTINTERVAL = COLUMN_INDICES['photo_distinterval']
+
+ACTION_COLUMNS: tuple[tuple[int, int], ...] = tuple(
+    (column.index, COLUMN_INDICES['actionparam' + column.name[len('actiontype'):]])
+    for column in COLUMNS
+    if column.name.startswith('actiontype')
+)
+"""The indices of the type and parameter column of every action slot"""
+
+HEADER = ','.join(COLUMN_NAMES)
+"""The header line of a litchi csv file without line break"""
+
+ENUM_COLUMNS: frozenset[int] = frozenset(column.index for column in COLUMNS if column.is_enum)
+"""Indices of the columns that hold enum values (stored as signed char)"""
+
+ENUM_RANGES: dict[int, frozenset[int]] = {column.index: column.values for column in COLUMNS if column.is_enum}
+"""Allowed int values of the enum columns"""
+
+ACTION_PARAM_COLUMNS: frozenset[int] = frozenset(
+    column.index for column in COLUMNS if column.name.startswith('actionparam')
+)
+"""Indices of the action parameter columns"""
+
+RANGES: dict[int, tuple[float, float]] = {
+    column.index: (
+        column.minimum if column.minimum is not None else float('-inf'),
+        column.maximum if column.maximum is not None else float('inf')
+    )
+    for column in COLUMNS
+    if (column.minimum is not None or column.maximum is not None) and column.condition is None
+}
+"""The valid range of every column with a static range"""
+
+CONDITIONAL_RANGES: dict[int, tuple[int, int, float, float]] = {
+    column.index: (COLUMN_INDICES[column.condition[0]], column.condition[1], column.minimum, column.maximum)
+    for column in COLUMNS
+    if column.condition is not None
+}
+"""The condition column, its value and the valid range of every column whose range has a condition"""
+
+DISABLED_VALUES: dict[int, float] = {
+    column.index: column.disabled for column in COLUMNS if column.disabled is not None
+}
+"""The value outside the range that disables the column"""
+
+FIELD_PATTERNS: tuple[re.Pattern, ...] = tuple(re.compile(column.pattern) for column in COLUMNS)
+"""
+Compiled patterns for the single columns.
+All columns have to match completely, except the last one which only has to start with a match.
+"""
+
+LINE_PATTERN: re.Pattern = re.compile('^' + ','.join(f'({column.pattern})' for column in COLUMNS))
+"""
+Compiled pattern of a valid csv line, equivalent to RegEx.VALID_LITCHI_WP_LINE.
+Characters after the last column are ignored.
+"""
+
+
+def compile_getter(columns: Iterable[Column]) -> Callable:
+    """
+    Generates a function returning the values of the given columns of a waypoint as tuple,
+    with one attribute lookup chain per column and no loop. Enum values are read from
+    their _value_ attribute, which avoids the slow Enum.value descriptor.
+
+    Args:
+        columns (Iterable[Column]): The columns in the order of the returned values
+
+    Returns:
+        The function, taking a waypoint
+
+    """
+    accessors = []
+    for column in columns:
+        accessor = column.accessor
+        if column.is_enum and accessor.endswith('.value'):
+            accessor = accessor[:-len('value')] + '_value_'
+        accessors.append(accessor)
+    source = 'def getter(waypoint):\n    return (\n' + ''.join(
+        f'        waypoint.{accessor},\n' for accessor in accessors
+    ) + '    )\n'
+    namespace: dict = {}
+    exec(compile(source, '<litchi_wp.columns>', 'exec'), namespace)  # pylint: disable=exec-used
+    return namespace['getter']
+
+
+row_getter: Callable = compile_getter(COLUMNS)
+"""Function returning the 46 column values of a waypoint, see Waypoint.to_row"""
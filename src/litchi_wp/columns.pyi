@@ -0,0 +1,54 @@
+import re
+from typing import Callable, Iterable, Union
+
+from litchi_wp.enums import ActionType as ActionType, AltitudeMode as AltitudeMode, GimbalMode as GimbalMode, RotationDirection as RotationDirection
+
+class Column:
+    index: int
+    name: str
+    pattern: str
+    accessor: str
+    values: Union[frozenset[int], None]
+    minimum: Union[float, None]
+    maximum: Union[float, None]
+    condition: Union[tuple[str, int], None]
+    disabled: Union[float, None]
+    def __init__(self, name: str, pattern: str, accessor: str, values: Union[Iterable[int], None] = ..., minimum: Union[float, None] = ..., maximum: Union[float, None] = ..., condition: Union[tuple[str, int], None] = ..., disabled: Union[float, None] = ...) -> None: ...
+    @property
+    def is_enum(self) -> bool: ...
+
+ACTION_PARAM_RANGES: dict[int, tuple[float, float]]
+CONDITIONAL_RANGES: dict[int, tuple[int, int, float, float]]
+DISABLED_VALUES: dict[int, float]
+COLUMNS: tuple[Column, ...]
+COLUMN_NAMES: tuple[str, ...]
+COLUMN_INDICES: dict[str, int]
+LATITUDE: int
+LONGITUDE: int
+ALTITUDE: int
+HEADING: int
+CURVESIZE: int
+ROTATIONDIR: int
+GIMBALMODE: int
+GIMBALPITCHANGLE: int
+ALTITUDEMODE: int
+SPEED: int
+POI_LATITUDE: int
+POI_LONGITUDE: int
+POI_ALTITUDE: int
+POI_ALTITUDEMODE: int
+PHOTO_TIMEINTERVAL: int
+PHOTO_DISTINTERVAL: int
+ACTION_COLUMNS: tuple[tuple[int, int], ...]
+HEADER: str
+ENUM_COLUMNS: frozenset[int]
+ENUM_RANGES: dict[int, frozenset[int]]
+ACTION_PARAM_COLUMNS: frozenset[int]
+RANGES: dict[int, tuple[float, float]]
+CONDITIONAL_RANGES: dict[int, tuple[int, int, float, float]]
+DISABLED_VALUES: dict[int, float]
+FIELD_PATTERNS: tuple[re.Pattern, ...]
+LINE_PATTERN: re.Pattern
+def compile_getter(columns: Iterable[Column]) -> Callable: ...
+
+row_getter: Callable
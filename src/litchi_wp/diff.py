@@ -0,0 +1,449 @@
+"""
+Module for comparing missions and patching them incrementally
+
+The waypoints are compared by their csv rows. Every distinct row (or coordinate pair)
+is hashed once and replaced by an int. The int sequences are aligned like a patience
+diff: common prefixes and suffixes are matched first, then the longest increasing
+chain of the rows that occur exactly once in both missions, and the gaps between them
+recursively. Only gaps without such unique rows fall back to difflib.SequenceMatcher,
+which is quadratic in the gap size, so it is only used for gaps of at most
+MATCHER_LIMIT pairs of waypoints. Larger gaps of repeated rows (e.g. a scan pattern
+flying the same coordinates again and again) are not aligned and become changes of
+the waypoints in order plus inserts or deletes, which keeps diff O(n log n) overall.
+The differences become a Patch of insert, delete and change operations, where a
+change only holds the columns that differ.
+"""
+# pylint: disable=import-error
+import json
+from bisect import bisect_left
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Iterable, Iterator, MutableSequence, Sequence
+
+from litchi_wp.columns import COLUMN_NAMES, row_getter
+from litchi_wp.mission import Mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+KINDS = ('insert', 'delete', 'change')
+"""The kinds of patch operations"""
+
+ALIGNMENTS = ('rows', 'coordinates')
+"""The supported ways to align two missions"""
+
+MATCHER_LIMIT = 16384
+"""The largest product of the gap lengths that is aligned with difflib.SequenceMatcher"""
+
+Row = tuple[int | float, ...]
+
+
+def _check_number(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f'{value!r} is no number')
+
+
+class PatchOperation:
+    """
+    Class representing one step of a Patch.
+    The index is the position in the mission after all previous operations were applied.
+
+    Attributes:
+        kind (str): 'insert', 'delete' or 'change'
+        index (int): The position of the first affected waypoint
+        count (int): The number of deleted waypoints (delete only)
+        rows (tuple[Row, ...]): The rows of the inserted waypoints (insert only)
+        changes (tuple[tuple[int, int | float], ...]): Column index and new value
+            of every changed column (change only)
+
+    """
+    __slots__ = ('kind', 'index', 'count', 'rows', 'changes')
+
+    def __init__(
+            self,
+            kind: str,
+            index: int,
+            count: int = 0,
+            rows: Iterable[Sequence[int | float]] = (),
+            changes: Iterable[tuple[int, int | float]] = ()
+    ):
+        """
+        Constructor
+
+        Args:
+            kind (str): 'insert', 'delete' or 'change'
+            index (int): The position of the first affected waypoint
+            count (int): The number of deleted waypoints (delete only)
+            rows (Iterable[Sequence[int | float]]): The rows of the inserted waypoints (insert only)
+            changes (Iterable[tuple[int, int | float]]): Column index and new value
+                of every changed column (change only)
+
+        Raises:
+            ValueError: If kind is unknown, index or count is negative, a column does not exist,
+                a row does not have a value for every column or a value is no number
+
+        """
+        if kind not in KINDS:
+            raise ValueError(f'kind has to be one of {KINDS}')
+        if index < 0 or count < 0:
+            raise ValueError('index and count must not be negative')
+        self.kind = kind
+        self.index = int(index)
+        self.count = int(count)
+        self.rows: tuple[Row, ...] = tuple(tuple(row) for row in rows)
+        self.changes = tuple((int(column), value) for column, value in changes)
+        for column, value in self.changes:
+            if not 0 <= column < len(COLUMN_NAMES):
+                raise ValueError(f'column {column} does not exist')
+            _check_number(value)
+        for row in self.rows:
+            if len(row) != len(COLUMN_NAMES):
+                raise ValueError(f'expected {len(COLUMN_NAMES)} values, got {len(row)}')
+            for value in row:
+                _check_number(value)
+
+    def __repr__(self) -> str:
+        if self.kind == 'delete':
+            return f'PatchOperation(delete, {self.index}, count={self.count})'
+        if self.kind == 'insert':
+            return f'PatchOperation(insert, {self.index}, rows={len(self.rows)})'
+        return f'PatchOperation(change, {self.index}, columns={[column for column, _value in self.changes]})'
+
+    def to_dict(self) -> dict:
+        """
+        Converts the operation to a dict with only the fields of its kind
+
+        Returns:
+            The operation as dict, e.g. {'op': 'delete', 'index': 3, 'count': 2}
+
+        """
+        data: dict = {'op': self.kind, 'index': self.index}
+        if self.kind == 'delete':
+            data['count'] = self.count
+        elif self.kind == 'insert':
+            data['rows'] = [list(row) for row in self.rows]
+        else:
+            data['changes'] = [list(change) for change in self.changes]
+        return data
+
+    @staticmethod
+    def from_dict(data: dict) -> 'PatchOperation':
+        """
+        Creates an operation from the output of to_dict
+
+        Args:
+            data (dict): The operation as dict
+
+        Returns:
+            The PatchOperation as an instance
+
+        Raises:
+            ValueError: If a field is missing or invalid
+
+        """
+        try:
+            return PatchOperation(
+                data['op'], data['index'], data.get('count', 0), data.get('rows', ()), data.get('changes', ())
+            )
+        except (KeyError, TypeError) as error:
+            raise ValueError(f'invalid patch operation {data!r}') from error
+
+
+class Patch:
+    """
+    Class representing the differences between two missions as ordered operations
+
+    Attributes:
+        operations (list[PatchOperation]): The operations in the order they are applied
+        source_length (int): The number of waypoints of the mission the patch applies to
+        target_length (int): The number of waypoints after the patch was applied
+
+    """
+    __slots__ = ('operations', 'source_length', 'target_length')
+
+    def __init__(self, operations: Iterable[PatchOperation], source_length: int, target_length: int):
+        """
+        Constructor
+
+        Args:
+            operations (Iterable[PatchOperation]): The operations in the order they are applied
+            source_length (int): The number of waypoints of the mission the patch applies to
+            target_length (int): The number of waypoints after the patch was applied
+
+        """
+        self.operations = list(operations)
+        self.source_length = source_length
+        self.target_length = target_length
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __iter__(self) -> Iterator[PatchOperation]:
+        return iter(self.operations)
+
+    def __repr__(self) -> str:
+        return f'Patch({len(self.operations)} operations, {self.source_length} -> {self.target_length} waypoints)'
+
+    def to_dict(self) -> dict:
+        """
+        Converts the patch to a dict of lists and numbers
+
+        Returns:
+            The patch as dict
+
+        """
+        return {
+            'source_length': self.source_length,
+            'target_length': self.target_length,
+            'operations': [operation.to_dict() for operation in self.operations]
+        }
+
+    def to_json(self) -> str:
+        """
+        Serializes the patch as compact json
+
+        Returns:
+            The json text
+
+        """
+        return json.dumps(self.to_dict(), separators=(',', ':'))
+
+    @staticmethod
+    def from_dict(data: dict) -> 'Patch':
+        """
+        Creates a patch from the output of to_dict
+
+        Args:
+            data (dict): The patch as dict
+
+        Returns:
+            The Patch as an instance
+
+        Raises:
+            ValueError: If a field is missing or invalid
+
+        """
+        try:
+            operations = data['operations']
+            source_length = int(data['source_length'])
+            target_length = int(data['target_length'])
+        except (KeyError, TypeError) as error:
+            raise ValueError('invalid patch') from error
+        return Patch((PatchOperation.from_dict(operation) for operation in operations), source_length, target_length)
+
+    @staticmethod
+    def from_json(text: str) -> 'Patch':
+        """
+        Creates a patch from the output of to_json
+
+        Args:
+            text (str): The json text
+
+        Returns:
+            The Patch as an instance
+
+        Raises:
+            ValueError: If the text is no valid patch
+
+        """
+        return Patch.from_dict(json.loads(text))
+
+
+def _rows(waypoints: Iterable[Waypoint] | WaypointTable) -> list[Row]:
+    if isinstance(waypoints, WaypointTable):
+        return list(zip(*waypoints.columns))
+    return [row_getter(waypoint) for waypoint in waypoints]
+
+
+def _keys(old: Sequence[tuple], new: Sequence[tuple]) -> tuple[list[int], list[int]]:
+    ids: dict[tuple, int] = {}
+    return (
+        [ids.setdefault(key, len(ids)) for key in old],
+        [ids.setdefault(key, len(ids)) for key in new]
+    )
+
+
+def _increasing(anchors: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Finds the longest chain of anchors (sorted by old position) whose new positions
+    increase too, with patience sorting in O(n log n)
+    """
+    tails: list[int] = []
+    tail_indices: list[int] = []
+    previous = [-1] * len(anchors)
+    for index, (_old, new) in enumerate(anchors):
+        position = bisect_left(tails, new)
+        if position:
+            previous[index] = tail_indices[position - 1]
+        if position == len(tails):
+            tails.append(new)
+            tail_indices.append(index)
+        else:
+            tails[position] = new
+            tail_indices[position] = index
+    chain = []
+    index = tail_indices[-1]
+    while index >= 0:
+        chain.append(anchors[index])
+        index = previous[index]
+    chain.reverse()
+    return chain
+
+
+def _match(
+        old: list[int],
+        new: list[int],
+        old_start: int,
+        old_end: int,
+        new_start: int,
+        new_end: int,
+        blocks: list[tuple[int, int, int]]
+):
+    """
+    Appends the matching blocks (old index, new index, size) of old[old_start:old_end]
+    and new[new_start:new_end] to blocks, in no particular order
+    """
+    size = 0
+    while old_start + size < old_end and new_start + size < new_end and old[old_start + size] == new[new_start + size]:
+        size += 1
+    if size:
+        blocks.append((old_start, new_start, size))
+        old_start += size
+        new_start += size
+    size = 0
+    while old_end - size > old_start and new_end - size > new_start and old[old_end - size - 1] == new[new_end - size - 1]:
+        size += 1
+    if size:
+        blocks.append((old_end - size, new_end - size, size))
+        old_end -= size
+        new_end -= size
+    if old_start == old_end or new_start == new_end:
+        return
+    old_counts = Counter(old[old_start:old_end])
+    new_counts = Counter(new[new_start:new_end])
+    new_positions = {new[index]: index for index in range(new_start, new_end)}
+    anchors = [
+        (index, new_positions[key]) for index, key in enumerate(old[old_start:old_end], start=old_start)
+        if old_counts[key] == 1 and new_counts.get(key) == 1
+    ]
+    if not anchors:
+        if (old_end - old_start) * (new_end - new_start) > MATCHER_LIMIT:
+            return
+        matcher = SequenceMatcher(None, old[old_start:old_end], new[new_start:new_end], autojunk=False)
+        blocks.extend(
+            (old_start + old_index, new_start + new_index, size)
+            for old_index, new_index, size in matcher.get_matching_blocks() if size
+        )
+        return
+    for old_index, new_index in _increasing(anchors):
+        if old_index > old_start and new_index > new_start:
+            _match(old, new, old_start, old_index, new_start, new_index, blocks)
+        blocks.append((old_index, new_index, 1))
+        old_start = old_index + 1
+        new_start = new_index + 1
+    _match(old, new, old_start, old_end, new_start, new_end, blocks)
+
+
+def _changes(old: Row, new: Row) -> tuple[tuple[int, int | float], ...]:
+    if old == new:
+        return ()
+    return tuple((column, value) for column, (previous, value) in enumerate(zip(old, new)) if previous != value)
+
+
+def diff(
+        old: Iterable[Waypoint] | WaypointTable,
+        new: Iterable[Waypoint] | WaypointTable,
+        align: str = 'rows'
+) -> Patch:
+    """
+    Calculates the patch that turns old into new.
+    Waypoints that are not aligned with a waypoint of the other mission are paired in
+    order within each differing block and become changes, the rest become inserts and deletes.
+
+    Args:
+        old (Iterable[Waypoint] | WaypointTable): The waypoints of the current mission
+        new (Iterable[Waypoint] | WaypointTable): The waypoints of the edited mission
+        align (str): 'rows' to align identical waypoints (an edited waypoint is a change only
+            if its block has the same length in both missions), 'coordinates' to align waypoints
+            with the same latitude and longitude (edits of other fields are always changes)
+
+    Returns:
+        The patch, empty if both missions are equal
+
+    Raises:
+        ValueError: If align is not supported
+
+    """
+    if align not in ALIGNMENTS:
+        raise ValueError(f'align has to be one of {ALIGNMENTS}')
+    old_rows = _rows(old)
+    new_rows = _rows(new)
+    if align == 'rows':
+        old_keys, new_keys = old_rows, new_rows
+    else:
+        old_keys = [row[:2] for row in old_rows]
+        new_keys = [row[:2] for row in new_rows]
+    old_keys, new_keys = _keys(old_keys, new_keys)
+    blocks: list[tuple[int, int, int]] = []
+    _match(old_keys, new_keys, 0, len(old_keys), 0, len(new_keys), blocks)
+    blocks.sort()
+    blocks.append((len(old_keys), len(new_keys), 0))
+    operations = []
+    old_start = new_start = 0
+    for old_index, new_index, size in blocks:
+        paired = min(old_index - old_start, new_index - new_start)
+        for offset in range(paired):
+            changes = _changes(old_rows[old_start + offset], new_rows[new_start + offset])
+            if changes:
+                operations.append(PatchOperation('change', new_start + offset, changes=changes))
+        if old_index - old_start > paired:
+            operations.append(PatchOperation('delete', new_start + paired, count=old_index - old_start - paired))
+        if new_index - new_start > paired:
+            operations.append(PatchOperation('insert', new_start + paired, rows=new_rows[new_start + paired:new_index]))
+        if align == 'coordinates':
+            for offset in range(size):
+                changes = _changes(old_rows[old_index + offset], new_rows[new_index + offset])
+                if changes:
+                    operations.append(PatchOperation('change', new_index + offset, changes=changes))
+        old_start = old_index + size
+        new_start = new_index + size
+    return Patch(operations, len(old_rows), len(new_rows))
+
+
+def apply_patch(mission: MutableSequence[Waypoint] | Mission, patch: Patch):
+    """
+    Applies a patch in place. Unchanged waypoints keep their objects, inserted and
+    changed waypoints are created from their rows with Waypoint.from_row.
+    The mission is only modified if the whole patch is valid.
+
+    Args:
+        mission (MutableSequence[Waypoint] | Mission): The mission, e.g. a list of Waypoints
+        patch (Patch): The patch created from a mission equal to this one
+
+    Raises:
+        ValueError: If the mission does not have source_length waypoints or an operation
+            is out of range or creates an invalid waypoint
+
+    """
+    if len(mission) != patch.source_length:
+        raise ValueError(f'the patch applies to {patch.source_length} waypoints, the mission has {len(mission)}')
+    waypoints = list(mission)
+    for operation in patch:
+        index = operation.index
+        if operation.kind == 'insert':
+            if index > len(waypoints):
+                raise ValueError(f'insert at {index} is out of range')
+            waypoints[index:index] = [Waypoint.from_row(row) for row in operation.rows]
+        elif operation.kind == 'delete':
+            if index + operation.count > len(waypoints):
+                raise ValueError(f'delete of {operation.count} at {index} is out of range')
+            del waypoints[index:index + operation.count]
+        else:
+            if index >= len(waypoints):
+                raise ValueError(f'change at {index} is out of range')
+            row = list(row_getter(waypoints[index]))
+            for column, value in operation.changes:
+                row[column] = value
+            waypoints[index] = Waypoint.from_row(row)
+    if len(waypoints) != patch.target_length:
+        raise ValueError(f'the patch results in {len(waypoints)} waypoints instead of {patch.target_length}')
+    mission[:] = waypoints
@@ -0,0 +1,39 @@
+from typing import Iterable, Iterator, MutableSequence, Sequence, Union
+
+from litchi_wp.columns import COLUMN_NAMES as COLUMN_NAMES, row_getter as row_getter
+from litchi_wp.mission import Mission as Mission
+from litchi_wp.table import WaypointTable as WaypointTable
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+KINDS: tuple[str, ...]
+ALIGNMENTS: tuple[str, ...]
+MATCHER_LIMIT: int
+Row = tuple[Union[int, float], ...]
+
+class PatchOperation:
+    kind: str
+    index: int
+    count: int
+    rows: tuple[Row, ...]
+    changes: tuple[tuple[int, Union[int, float]], ...]
+    def __init__(self, kind: str, index: int, count: int = ..., rows: Iterable[Sequence[Union[int, float]]] = ..., changes: Iterable[tuple[int, Union[int, float]]] = ...) -> None: ...
+    def to_dict(self) -> dict: ...
+    @staticmethod
+    def from_dict(data: dict) -> PatchOperation: ...
+
+class Patch:
+    operations: list[PatchOperation]
+    source_length: int
+    target_length: int
+    def __init__(self, operations: Iterable[PatchOperation], source_length: int, target_length: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[PatchOperation]: ...
+    def to_dict(self) -> dict: ...
+    def to_json(self) -> str: ...
+    @staticmethod
+    def from_dict(data: dict) -> Patch: ...
+    @staticmethod
+    def from_json(text: str) -> Patch: ...
+
+def diff(old: Union[Iterable[Waypoint], WaypointTable], new: Union[Iterable[Waypoint], WaypointTable], align: str = ...) -> Patch: ...
+def apply_patch(mission: Union[MutableSequence[Waypoint], Mission], patch: Patch) -> None: ...
@@ -4,29 +4,28 @@ Module to bundle all enum classes
 from enum import Enum
 
 
-# pylint: disable=anomalous-backslash-in-string
 class RegEx(Enum):
     """
     Enum class for all regular expressions strings
     """
     VALID_LITCHI_WP_LINE = (
-            '^[-]?\d+(\.\d+)?,'  # latitude
-            + '[-]?\d+(\.\d+)?,'  # longitude
-            + '\d+(\.\d+)?,'  # altitude(m)
-            + '[-]?\d+(\.\d+)?,'  # heading(deg)
-            + '[-]?\d+(\.\d+)?,'  # curvesize(m)
-            + '[0-1]+,'  # rotationdir
-            + '([-1]|[0-2]),'  # gimbalmode
-            + '[-]?\d+(\.\d+)?,'  # gimbalpitchangle
-            + '((-1|[0-5]),[-]?\d+(\.\d+)?,){15}'  # actiontype, actionparam 1-15
-            + '[0-1],'  # altitudemode
-            + '\d+(\.\d+)?,'  # speed(m/s)
-            + '[-]?\d+(\.\d+)?,'  # poi_latitude
-            + '[-]?\d+(\.\d+)?,'  # poi_longitude
-            + '\d+(\.\d+)?,'  # poi_altitude(m)
-            + '[-]?[0-1],'  # poi_altitudemode
-            + '((-1|\d+)(\.\d+)?),'  # photo_timeinterval
-            + '((-1|\d+)(\.\d+)?)'  # photo_distinterval
+            r'^[-]?\d+(\.\d+)?,'  # latitude
+            + r'[-]?\d+(\.\d+)?,'  # longitude
+            + r'\d+(\.\d+)?,'  # altitude(m)
+            + r'[-]?\d+(\.\d+)?,'  # heading(deg)
+            + r'[-]?\d+(\.\d+)?,'  # curvesize(m)
+            + r'[0-1]+,'  # rotationdir
+            + r'([-1]|[0-2]),'  # gimbalmode
+            + r'[-]?\d+(\.\d+)?,'  # gimbalpitchangle
+            + r'((-1|[0-5]),[-]?\d+(\.\d+)?,){15}'  # actiontype, actionparam 1-15
+            + r'[0-1],'  # altitudemode
+            + r'\d+(\.\d+)?,'  # speed(m/s)
+            + r'[-]?\d+(\.\d+)?,'  # poi_latitude
+            + r'[-]?\d+(\.\d+)?,'  # poi_longitude
+            + r'\d+(\.\d+)?,'  # poi_altitude(m)
+            + r'[-]?[0-1],'  # poi_altitudemode
+            + r'((-1|\d+)(\.\d+)?),'  # photo_timeinterval
+            + r'((-1|\d+)(\.\d+)?)'  # photo_distinterval
     )
 
 
@@ -66,3 +65,16 @@ class ActionType(Enum):
     STOP_RECORDING = 3
     ROTATE_AIRCRAFT = 4
     TILT_CAMERA = 5
+
+
+class NumberFormat(Enum):
+    """
+    Enum class for the formatting of numbers in csv lines
+
+    REPR: str() of the values, floats always with a decimal point (e.g. 100.0)
+    CANONICAL: the shortest exact representation, integral values without decimals (e.g. 100)
+    FIXED: all values except enums with a fixed number of decimals (fast, lossy)
+    """
+    REPR = 0
+    CANONICAL = 1
+    FIXED = 2
@@ -23,3 +23,8 @@ class ActionType(Enum):
     STOP_RECORDING: int
     ROTATE_AIRCRAFT: int
     TILT_CAMERA: int
+
+class NumberFormat(Enum):
+    REPR: int
+    CANONICAL: int
+    FIXED: int
@@ -0,0 +1,30 @@
+"""
+Module for opening litchi csv files, plain or gzip compressed
+"""
+# pylint: disable=import-error
+import gzip
+import os
+from typing import TextIO
+
+
+def open_text(file: str | os.PathLike, mode: str = 'r') -> TextIO:
+    """
+    Opens a csv file as utf-8 text stream. Paths ending with '.gz' are opened as
+    gzip compressed text. Streams opened for writing do not translate line breaks,
+    so the line break characters of the writer are kept.
+
+    Args:
+        file (str | os.PathLike): The path + filename of the file
+        mode (str): 'r' to read, 'w' to write
+
+    Returns:
+        The opened text stream, to be closed by the caller
+
+    Raises:
+        OSError: If the file cannot be opened
+
+    """
+    newline = '' if mode == 'w' else None
+    if os.fspath(file).endswith('.gz'):
+        return gzip.open(file, mode=mode + 't', encoding='utf-8', newline=newline)
+    return open(file, encoding='utf-8', mode=mode, newline=newline)  # pylint: disable=consider-using-with
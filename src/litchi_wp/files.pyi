@@ -0,0 +1,4 @@
+import os
+from typing import TextIO, Union
+
+def open_text(file: Union[str, os.PathLike], mode: str = 'r') -> TextIO: ...
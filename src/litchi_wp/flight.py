@@ -0,0 +1,318 @@
+"""
+Module for estimating flight time and battery usage of litchi missions
+"""
+# pylint: disable=import-error,too-many-arguments,too-many-instance-attributes
+import math
+from typing import MutableSequence
+
+from litchi_wp.enums import ActionType, GimbalMode
+from litchi_wp.geodesy import bearing, haversine
+from litchi_wp.waypoint import Waypoint
+
+
+class AircraftProfile:
+    """
+    Class representing the flight characteristics of an aircraft
+
+    Attributes:
+        cruise_speed (float): Speed in meters per second for waypoints with speed 0
+        climb_rate (float): Vertical speed upwards in meters per second
+        descent_rate (float): Vertical speed downwards in meters per second
+        yaw_rate (float): Rotation speed of the aircraft in degrees per second
+        gimbal_rate (float): Tilt speed of the gimbal in degrees per second
+        action_time (float): Time for photo and recording actions in seconds
+        stop_time (float): Time lost for braking and accelerating at a waypoint without curve
+        hover_power (float): Power while hovering in watts
+        cruise_power (float): Power while flying in watts
+        climb_power (float): Additional power while climbing in watts
+        battery_capacity (float): Battery capacity in watt hours
+        battery_reserve (float): Part of the capacity that must not be used (0 ... 1)
+
+    """
+    __slots__ = (
+        'cruise_speed', 'climb_rate', 'descent_rate', 'yaw_rate', 'gimbal_rate', 'action_time',
+        'stop_time', 'hover_power', 'cruise_power', 'climb_power', 'battery_capacity',
+        'battery_reserve'
+    )
+
+    def __init__(
+            self,
+            cruise_speed: float = 10.0,
+            climb_rate: float = 5.0,
+            descent_rate: float = 3.0,
+            yaw_rate: float = 90.0,
+            gimbal_rate: float = 60.0,
+            action_time: float = 1.0,
+            stop_time: float = 2.0,
+            hover_power: float = 180.0,
+            cruise_power: float = 210.0,
+            climb_power: float = 60.0,
+            battery_capacity: float = 77.0,
+            battery_reserve: float = 0.2
+    ):
+        """
+        Constructor, the defaults roughly match a 1.4 kg quadcopter
+
+        Args:
+            cruise_speed (float): Speed in meters per second for waypoints with speed 0
+            climb_rate (float): Vertical speed upwards in meters per second
+            descent_rate (float): Vertical speed downwards in meters per second
+            yaw_rate (float): Rotation speed of the aircraft in degrees per second
+            gimbal_rate (float): Tilt speed of the gimbal in degrees per second
+            action_time (float): Time for photo and recording actions in seconds
+            stop_time (float): Time lost for braking and accelerating at a waypoint without curve
+            hover_power (float): Power while hovering in watts
+            cruise_power (float): Power while flying in watts
+            climb_power (float): Additional power while climbing in watts
+            battery_capacity (float): Battery capacity in watt hours
+            battery_reserve (float): Part of the capacity that must not be used (0 ... 1)
+
+        Raises:
+            ValueError: If a value cannot be float or a speed, rate or the capacity is not positive
+
+        """
+        self.cruise_speed = float(cruise_speed)
+        self.climb_rate = float(climb_rate)
+        self.descent_rate = float(descent_rate)
+        self.yaw_rate = float(yaw_rate)
+        self.gimbal_rate = float(gimbal_rate)
+        self.action_time = float(action_time)
+        self.stop_time = float(stop_time)
+        self.hover_power = float(hover_power)
+        self.cruise_power = float(cruise_power)
+        self.climb_power = float(climb_power)
+        self.battery_capacity = float(battery_capacity)
+        self.battery_reserve = float(battery_reserve)
+        if min(self.cruise_speed, self.climb_rate, self.descent_rate, self.yaw_rate,
+               self.gimbal_rate, self.battery_capacity) <= 0:
+            raise ValueError('speeds, rates and battery_capacity have to be positive')
+
+    @property
+    def usable_energy(self) -> float:
+        """
+        The usable battery energy in watt hours (capacity without reserve)
+        """
+        return self.battery_capacity * (1 - self.battery_reserve)
+
+    def leg_cost(self, start: Waypoint, end: Waypoint) -> tuple[float, float, float]:
+        """
+        Calculates the straight flight from start to end with the speed of start
+
+        Args:
+            start (Waypoint): The waypoint the leg starts at
+            end (Waypoint): The waypoint the leg ends at
+
+        Returns:
+            The horizontal distance in meters, the time in seconds and the energy in joules
+
+        """
+        distance = haversine(start.lat, start.lon, end.lat, end.lon)
+        climb = end.altitude.value - start.altitude.value
+        vertical_time = climb / self.climb_rate if climb > 0 else -climb / self.descent_rate
+        time = max(distance / (abs(start.speed) or self.cruise_speed), vertical_time)
+        energy = time * self.cruise_power
+        if climb > 0:
+            energy += vertical_time * self.climb_power
+        return distance, time, energy
+
+    def action_cost(self, waypoint: Waypoint) -> tuple[float, float]:
+        """
+        Calculates the actions at a waypoint, executed while hovering
+
+        Args:
+            waypoint (Waypoint): The waypoint
+
+        Returns:
+            The time in seconds and the energy in joules
+
+        """
+        time = 0.0
+        heading = waypoint.heading
+        pitch = waypoint.gimbal.pitchangle if waypoint.gimbal.mode is GimbalMode.INTERPOLATE else 0.0
+        for action in waypoint.used_actions():
+            match action.type:
+                case ActionType.STAY_FOR:
+                    time += action.param / 1000
+                case ActionType.ROTATE_AIRCRAFT:
+                    turn = abs(action.param - heading) % 360
+                    time += min(turn, 360 - turn) / self.yaw_rate
+                    heading = action.param
+                case ActionType.TILT_CAMERA:
+                    time += abs(action.param - pitch) / self.gimbal_rate
+                    pitch = action.param
+                case ActionType.TAKE_PHOTO | ActionType.START_RECORDING | ActionType.STOP_RECORDING:
+                    time += self.action_time
+        return time, time * self.hover_power
+
+    def turn_cost(
+            self,
+            previous: Waypoint,
+            waypoint: Waypoint,
+            following: Waypoint
+    ) -> tuple[float, float, float]:
+        """
+        Calculates the correction for passing a waypoint between two legs.
+        Waypoints without curvesize cost stop_time, curves shorten the path.
+
+        Args:
+            previous (Waypoint): The waypoint before
+            waypoint (Waypoint): The waypoint that is passed
+            following (Waypoint): The waypoint after
+
+        Returns:
+            The distance in meters, the time in seconds and the energy in joules (may be negative)
+
+        """
+        if waypoint.curvesize <= 0:
+            return 0.0, self.stop_time, self.stop_time * self.hover_power
+        angle = abs(
+            bearing(waypoint.lat, waypoint.lon, following.lat, following.lon)
+            - bearing(previous.lat, previous.lon, waypoint.lat, waypoint.lon)
+        ) % 360
+        angle = math.radians(min(angle, 360 - angle))
+        if angle == 0:
+            return 0.0, 0.0, 0.0
+        tangent = min(
+            waypoint.curvesize * math.tan(angle / 2),
+            haversine(previous.lat, previous.lon, waypoint.lat, waypoint.lon) / 2,
+            haversine(waypoint.lat, waypoint.lon, following.lat, following.lon) / 2
+        )
+        saving = 2 * tangent - tangent / math.tan(angle / 2) * angle if angle < math.pi else 2 * tangent
+        time = saving / (abs(previous.speed) or self.cruise_speed)
+        return -saving, -time, -time * self.cruise_power
+
+
+class FlightEstimator:
+    """
+    Class estimating flight time and energy of a mission incrementally
+
+    The costs of every leg and every waypoint are cached. After changing waypoints
+    only the affected legs and waypoints have to be recalculated with update,
+    insert or delete, the totals are adjusted by the differences.
+
+    Attributes:
+        waypoints (MutableSequence[Waypoint]): The waypoints of the mission (not a copy)
+        profile (AircraftProfile): The aircraft used for the estimation
+        total_distance (float): The flight distance in meters
+        total_time (float): The flight time in seconds
+        total_energy (float): The energy in watt hours
+
+    """
+    __slots__ = (
+        'waypoints', 'profile', 'total_distance', 'total_time', 'total_energy',
+        '_legs', '_nodes'
+    )
+
+    def __init__(self, waypoints: MutableSequence[Waypoint], profile: AircraftProfile | None = None):
+        """
+        Constructor
+
+        Args:
+            waypoints (MutableSequence[Waypoint]): The waypoints of the mission, e.g. a list or a Mission
+            profile (AircraftProfile | None): The aircraft, AircraftProfile() if None
+
+        """
+        self.waypoints = waypoints
+        self.profile = profile or AircraftProfile()
+        self.refresh()
+
+    @property
+    def battery_usage(self) -> float:
+        """
+        The used part of the usable battery energy (> 1 means the battery is not sufficient)
+        """
+        return self.total_energy / self.profile.usable_energy
+
+    @property
+    def leg_times(self) -> list[float]:
+        """
+        The flight times of the legs in seconds (len(waypoints) - 1 values)
+        """
+        return [leg[1] for leg in self._legs]
+
+    def refresh(self):
+        """
+        Recalculates all legs and waypoints
+        """
+        self.total_distance = self.total_time = 0.0
+        self.total_energy = 0.0
+        self._legs = [(0.0, 0.0, 0.0)] * max(len(self.waypoints) - 1, 0)
+        self._nodes = [(0.0, 0.0, 0.0)] * len(self.waypoints)
+        self._recalculate(range(len(self._legs)), range(len(self._nodes)))
+
+    def update(self, index: int):
+        """
+        Recalculates the costs after the waypoint at index was changed
+
+        Args:
+            index (int): The index of the changed waypoint
+
+        Raises:
+            IndexError: If index is out of range
+
+        """
+        if not 0 <= index < len(self.waypoints):
+            raise IndexError(f"Index {index} is out of bounds")
+        self._recalculate(range(index - 1, index + 1), range(index - 1, index + 2))
+
+    def insert(self, index: int, waypoint: Waypoint):
+        """
+        Inserts a waypoint into the mission and adds its costs
+
+        Args:
+            index (int): The index of the waypoint that will follow the new one
+            waypoint (Waypoint): The waypoint to be inserted
+
+        """
+        index = min(max(index if index >= 0 else len(self.waypoints) + index, 0), len(self.waypoints))
+        self.waypoints.insert(index, waypoint)
+        self._nodes.insert(index, (0.0, 0.0, 0.0))
+        if len(self.waypoints) > 1:
+            self._legs.insert(min(index, len(self._legs)), (0.0, 0.0, 0.0))
+        self._recalculate(range(index - 1, index + 1), range(index - 1, index + 2))
+
+    def delete(self, index: int):
+        """
+        Deletes a waypoint from the mission and removes its costs
+
+        Args:
+            index (int): The index of the waypoint to be deleted
+
+        Raises:
+            IndexError: If index is out of range
+
+        """
+        if not 0 <= index < len(self.waypoints):
+            raise IndexError(f"Index {index} is out of bounds")
+        del self.waypoints[index]
+        self._set(self._nodes, index, (0.0, 0.0, 0.0))
+        del self._nodes[index]
+        if self._legs:
+            removed = min(index, len(self._legs) - 1)
+            self._set(self._legs, removed, (0.0, 0.0, 0.0))
+            del self._legs[removed]
+        self._recalculate(range(index - 1, index), range(index - 1, index + 1))
+
+    def _set(self, costs: list[tuple[float, float, float]], index: int, cost: tuple[float, float, float]):
+        old = costs[index]
+        costs[index] = cost
+        self.total_distance += cost[0] - old[0]
+        self.total_time += cost[1] - old[1]
+        self.total_energy += (cost[2] - old[2]) / 3600
+
+    def _recalculate(self, legs: range, nodes: range):
+        waypoints = self.waypoints
+        profile = self.profile
+        for index in legs:
+            if 0 <= index < len(self._legs):
+                self._set(self._legs, index, profile.leg_cost(waypoints[index], waypoints[index + 1]))
+        for index in nodes:
+            if 0 <= index < len(self._nodes):
+                time, energy = profile.action_cost(waypoints[index])
+                distance = 0.0
+                if 0 < index < len(waypoints) - 1:
+                    turn = profile.turn_cost(waypoints[index - 1], waypoints[index], waypoints[index + 1])
+                    distance = turn[0]
+                    time += turn[1]
+                    energy += turn[2]
+                self._set(self._nodes, index, (distance, time, energy))
@@ -0,0 +1,41 @@
+from typing import MutableSequence, Optional
+
+from litchi_wp.enums import ActionType as ActionType, GimbalMode as GimbalMode
+from litchi_wp.geodesy import bearing as bearing, haversine as haversine
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+class AircraftProfile:
+    cruise_speed: float
+    climb_rate: float
+    descent_rate: float
+    yaw_rate: float
+    gimbal_rate: float
+    action_time: float
+    stop_time: float
+    hover_power: float
+    cruise_power: float
+    climb_power: float
+    battery_capacity: float
+    battery_reserve: float
+    def __init__(self, cruise_speed: float = ..., climb_rate: float = ..., descent_rate: float = ..., yaw_rate: float = ..., gimbal_rate: float = ..., action_time: float = ..., stop_time: float = ..., hover_power: float = ..., cruise_power: float = ..., climb_power: float = ..., battery_capacity: float = ..., battery_reserve: float = ...) -> None: ...
+    @property
+    def usable_energy(self) -> float: ...
+    def leg_cost(self, start: Waypoint, end: Waypoint) -> tuple[float, float, float]: ...
+    def action_cost(self, waypoint: Waypoint) -> tuple[float, float]: ...
+    def turn_cost(self, previous: Waypoint, waypoint: Waypoint, following: Waypoint) -> tuple[float, float, float]: ...
+
+class FlightEstimator:
+    waypoints: MutableSequence[Waypoint]
+    profile: AircraftProfile
+    total_distance: float
+    total_time: float
+    total_energy: float
+    def __init__(self, waypoints: MutableSequence[Waypoint], profile: Optional[AircraftProfile] = ...) -> None: ...
+    @property
+    def battery_usage(self) -> float: ...
+    @property
+    def leg_times(self) -> list[float]: ...
+    def refresh(self): ...
+    def update(self, index: int): ...
+    def insert(self, index: int, waypoint: Waypoint): ...
+    def delete(self, index: int): ...
@@ -0,0 +1,112 @@
+"""
+Module for formatting the numbers of litchi csv lines
+
+The format is chosen per call (number_format argument of the writers) or globally
+with set_number_format. Every format only writes numbers the csv parsers accept,
+exponents are never written.
+"""
+# pylint: disable=import-error
+from decimal import Decimal
+from typing import Callable, Sequence
+
+from litchi_wp.columns import COLUMN_NAMES, ENUM_COLUMNS
+from litchi_wp.enums import NumberFormat
+
+_number_format = NumberFormat.REPR
+_precision = 7
+
+
+def set_number_format(number_format: NumberFormat, precision: int | None = None):
+    """
+    Setter for the global number format, used by all writers that get no number_format
+
+    Args:
+        number_format (NumberFormat): The number format
+        precision (int | None): The number of decimals of NumberFormat.FIXED, unchanged if None
+
+    Raises:
+        ValueError: If number_format is no valid NumberFormat or precision is negative
+
+    """
+    global _number_format, _precision  # pylint: disable=global-statement
+    number_format = NumberFormat(number_format)
+    if precision is not None:
+        if precision < 0:
+            raise ValueError('precision must not be negative')
+        _precision = int(precision)
+    _number_format = number_format
+
+
+def get_number_format() -> tuple[NumberFormat, int]:
+    """
+    Getter for the global number format
+
+    Returns:
+        The number format and the number of decimals of NumberFormat.FIXED
+
+    """
+    return _number_format, _precision
+
+
+def format_canonical(value: int | float) -> str:
+    """
+    Formats a number with the shortest representation that parses to the same value.
+    Integral values are written without decimals and negative zero as 0.
+
+    Args:
+        value (int | float): The number
+
+    Returns:
+        The formatted number
+
+    Raises:
+        ValueError: If value is nan or infinite
+
+    """
+    text = repr(value)
+    if text.endswith('.0'):
+        text = text[:-2]
+    elif 'e' in text:
+        text = f'{Decimal(text):f}'
+    elif 'n' in text:
+        raise ValueError(f'{value} cannot be written to a csv line')
+    return '0' if text == '-0' else text
+
+
+def row_formatter(
+        number_format: NumberFormat | None = None,
+        precision: int | None = None
+) -> Callable[[Sequence[int | float]], str]:
+    """
+    Creates a function joining the values of a row to a csv line without line break
+
+    Args:
+        number_format (NumberFormat | None): The number format, the global one if None
+        precision (int | None): The number of decimals of NumberFormat.FIXED, the global one if None
+
+    Returns:
+        The function
+
+    Raises:
+        ValueError: If number_format is no valid NumberFormat
+
+    """
+    number_format = _number_format if number_format is None else NumberFormat(number_format)
+    if number_format is NumberFormat.CANONICAL:
+        return _canonical_line
+    if number_format is NumberFormat.FIXED:
+        number = f'%.{_precision if precision is None else precision}f'
+        template = ','.join('%d' if index in ENUM_COLUMNS else number for index in range(len(COLUMN_NAMES)))
+        return lambda row: template % tuple(row)
+    return lambda row: ','.join(map(str, row))
+
+
+def _canonical_line(row: Sequence[int | float]) -> str:
+    """
+    Joins a row like format_canonical, stripping the '.0' of the str() line at once
+    and formatting value by value only for exponents, nan, inf and negative zero
+    """
+    line = ','.join(map(str, row)) + ','
+    if 'e' in line or 'n' in line or ',-0.0,' in ',' + line:
+        return ','.join(map(format_canonical, row))
+    return line.replace('.0,', ',')[:-1]
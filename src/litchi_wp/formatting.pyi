@@ -0,0 +1,9 @@
+from typing import Callable, Sequence, Union
+
+from litchi_wp.columns import COLUMN_NAMES as COLUMN_NAMES, ENUM_COLUMNS as ENUM_COLUMNS
+from litchi_wp.enums import NumberFormat as NumberFormat
+
+def set_number_format(number_format: NumberFormat, precision: Union[int, None] = ...) -> None: ...
+def get_number_format() -> tuple[NumberFormat, int]: ...
+def format_canonical(value: Union[int, float]) -> str: ...
+def row_formatter(number_format: Union[NumberFormat, None] = ..., precision: Union[int, None] = ...) -> Callable[[Sequence[Union[int, float]]], str]: ...
@@ -0,0 +1,399 @@
+"""
+Module for distances and bearings between litchi waypoints
+
+The batch functions work on whole missions at once. They use numpy if it is installed
+and fall back to pure Python otherwise.
+"""
+# pylint: disable=import-error,invalid-name,too-many-locals
+import math
+from operator import attrgetter
+from typing import Iterable, Sequence
+
+from litchi_wp.columns import COLUMN_NAMES
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+EARTH_RADIUS = 6371008.8
+"""Mean earth radius in meters (used by haversine)"""
+
+WGS84_A = 6378137.0
+"""WGS84 semi-major axis in meters"""
+
+WGS84_F = 1 / 298.257223563
+"""WGS84 flattening"""
+
+WGS84_B = WGS84_A * (1 - WGS84_F)
+"""WGS84 semi-minor axis in meters"""
+
+Coordinates = tuple[Sequence[float], Sequence[float], Sequence[float]]
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great circle distance on a sphere
+
+    Args:
+        lat1 (float): Latitude of the first point in degrees
+        lon1 (float): Longitude of the first point in degrees
+        lat2 (float): Latitude of the second point in degrees
+        lon2 (float): Longitude of the second point in degrees
+
+    Returns:
+        The distance in meters
+
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 \
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+def vincenty(
+        lat1: float,
+        lon1: float,
+        lat2: float,
+        lon2: float,
+        tolerance: float = 1e-12,
+        max_iterations: int = 200
+) -> float:
+    """
+    Distance on the WGS84 ellipsoid with Vincenty's inverse formula
+
+    Args:
+        lat1 (float): Latitude of the first point in degrees
+        lon1 (float): Longitude of the first point in degrees
+        lat2 (float): Latitude of the second point in degrees
+        lon2 (float): Longitude of the second point in degrees
+        tolerance (float): Convergence limit for lambda in radians
+        max_iterations (int): Maximum number of iterations
+
+    Returns:
+        The distance in meters
+
+    Raises:
+        ValueError: If the formula does not converge (nearly antipodal points)
+
+    """
+    U1 = math.atan((1 - WGS84_F) * math.tan(math.radians(lat1)))
+    U2 = math.atan((1 - WGS84_F) * math.tan(math.radians(lat2)))
+    L = math.radians(lon2 - lon1)
+    sin_U1, cos_U1 = math.sin(U1), math.cos(U1)
+    sin_U2, cos_U2 = math.sin(U2), math.cos(U2)
+    lam = L
+    for _ in range(max_iterations):
+        sin_lam, cos_lam = math.sin(lam), math.cos(lam)
+        sin_sigma = math.hypot(cos_U2 * sin_lam, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lam)
+        if sin_sigma == 0:
+            return 0.0
+        cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lam
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_U1 * cos_U2 * sin_lam / sin_sigma
+        cos2_alpha = 1 - sin_alpha ** 2
+        cos_2sigma_m = cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha if cos2_alpha != 0 else 0.0
+        C = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+        lam_prev = lam
+        lam = L + (1 - C) * WGS84_F * sin_alpha * (
+            sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))
+        )
+        if abs(lam - lam_prev) < tolerance:
+            break
+    else:
+        raise ValueError('vincenty formula did not converge')
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        - B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+    ))
+    return WGS84_B * A * (sigma - delta_sigma)
+
+
+def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Initial great circle bearing from the first to the second point
+
+    Args:
+        lat1 (float): Latitude of the first point in degrees
+        lon1 (float): Longitude of the first point in degrees
+        lat2 (float): Latitude of the second point in degrees
+        lon2 (float): Longitude of the second point in degrees
+
+    Returns:
+        The bearing in degrees (0 = north, 90 = east, 0 <= bearing < 360)
+
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_lon = math.radians(lon2 - lon1)
+    y = math.sin(d_lon) * math.cos(phi2)
+    x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(d_lon)
+    return math.degrees(math.atan2(y, x)) % 360
+
+
+def coordinates(waypoints: Iterable[Waypoint] | WaypointTable) -> Coordinates:
+    """
+    Extracts the coordinates of waypoints
+
+    Args:
+        waypoints (Iterable[Waypoint] | WaypointTable): Waypoints, a Mission or a WaypointTable.
+            The columns of a WaypointTable are used directly.
+
+    Returns:
+        The latitudes, longitudes and altitudes (in meters)
+
+    """
+    if isinstance(waypoints, WaypointTable):
+        return tuple(
+            waypoints.columns[COLUMN_NAMES.index(name)]
+            for name in ('latitude', 'longitude', 'altitude(m)')
+        )
+    if not isinstance(waypoints, Sequence):
+        waypoints = list(waypoints)
+    return (
+        list(map(attrgetter('lat'), waypoints)),
+        list(map(attrgetter('lon'), waypoints)),
+        list(map(attrgetter('altitude.value'), waypoints))
+    )
+
+
+def _prepare(coords: Coordinates) -> Coordinates:
+    """
+    Converts the coordinates to numpy arrays once, so slices of them are views
+    """
+    if np is None:
+        return coords
+    return tuple(np.asarray(values, dtype=float) for values in coords)
+
+
+def _haversine_many_numpy(lats1, lons1, lats2, lons2):
+    phi1 = np.radians(np.asarray(lats1, dtype=float))
+    phi2 = np.radians(np.asarray(lats2, dtype=float))
+    d_lon = np.radians(np.asarray(lons2, dtype=float) - np.asarray(lons1, dtype=float))
+    a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lon / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def _bearing_many_numpy(lats1, lons1, lats2, lons2):
+    phi1 = np.radians(np.asarray(lats1, dtype=float))
+    phi2 = np.radians(np.asarray(lats2, dtype=float))
+    d_lon = np.radians(np.asarray(lons2, dtype=float) - np.asarray(lons1, dtype=float))
+    y = np.sin(d_lon) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(d_lon)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+
+def _vincenty_many_numpy(lats1, lons1, lats2, lons2, tolerance, max_iterations):
+    U1 = np.arctan((1 - WGS84_F) * np.tan(np.radians(np.asarray(lats1, dtype=float))))
+    U2 = np.arctan((1 - WGS84_F) * np.tan(np.radians(np.asarray(lats2, dtype=float))))
+    L = np.radians(np.asarray(lons2, dtype=float) - np.asarray(lons1, dtype=float))
+    sin_U1, cos_U1 = np.sin(U1), np.cos(U1)
+    sin_U2, cos_U2 = np.sin(U2), np.cos(U2)
+    lam = L.copy()
+    active = np.ones(L.shape, dtype=bool)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_U2 * sin_lam, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lam)
+            cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_U1 * cos_U2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            cos_2sigma_m = np.where(
+                cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha
+            )
+            C = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+            lam_next = L + (1 - C) * WGS84_F * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))
+            )
+            converged = np.abs(lam_next - lam) < tolerance
+            lam = np.where(active, lam_next, lam)
+            active &= ~converged
+            if not active.any():
+                break
+        else:
+            raise ValueError('vincenty formula did not converge')
+        sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+        sin_sigma = np.hypot(cos_U2 * sin_lam, cos_U1 * sin_U2 - sin_U1 * cos_U2 * cos_lam)
+        cos_sigma = sin_U1 * sin_U2 + cos_U1 * cos_U2 * cos_lam
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+        sin_alpha = np.where(sin_sigma == 0, 0.0, cos_U1 * cos_U2 * sin_lam / sin_sigma)
+        cos2_alpha = 1 - sin_alpha ** 2
+        cos_2sigma_m = np.where(cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_U1 * sin_U2 / cos2_alpha)
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        - B / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+    ))
+    return WGS84_B * A * (sigma - delta_sigma)
+
+
+def haversine_many(
+        lats1: Sequence[float],
+        lons1: Sequence[float],
+        lats2: Sequence[float],
+        lons2: Sequence[float]
+) -> list[float]:
+    """
+    Pairwise haversine distances, see haversine
+
+    Args:
+        lats1 (Sequence[float]): Latitudes of the first points in degrees
+        lons1 (Sequence[float]): Longitudes of the first points in degrees
+        lats2 (Sequence[float]): Latitudes of the second points in degrees
+        lons2 (Sequence[float]): Longitudes of the second points in degrees
+
+    Returns:
+        The distances in meters
+
+    """
+    if np is not None:
+        return _haversine_many_numpy(lats1, lons1, lats2, lons2).tolist()
+    radians, sin, cos, asin, sqrt = math.radians, math.sin, math.cos, math.asin, math.sqrt
+    diameter = 2 * EARTH_RADIUS
+    distances = []
+    for lat1, lon1, lat2, lon2 in zip(lats1, lons1, lats2, lons2):
+        phi1 = radians(lat1)
+        phi2 = radians(lat2)
+        a = sin((phi2 - phi1) / 2) ** 2 + cos(phi1) * cos(phi2) * sin(radians(lon2 - lon1) / 2) ** 2
+        distances.append(diameter * asin(min(1.0, sqrt(a))))
+    return distances
+
+
+def vincenty_many(
+        lats1: Sequence[float],
+        lons1: Sequence[float],
+        lats2: Sequence[float],
+        lons2: Sequence[float],
+        tolerance: float = 1e-12,
+        max_iterations: int = 200
+) -> list[float]:
+    """
+    Pairwise Vincenty distances, see vincenty
+
+    Args:
+        lats1 (Sequence[float]): Latitudes of the first points in degrees
+        lons1 (Sequence[float]): Longitudes of the first points in degrees
+        lats2 (Sequence[float]): Latitudes of the second points in degrees
+        lons2 (Sequence[float]): Longitudes of the second points in degrees
+        tolerance (float): Convergence limit for lambda in radians
+        max_iterations (int): Maximum number of iterations
+
+    Returns:
+        The distances in meters
+
+    Raises:
+        ValueError: If the formula does not converge for a pair (nearly antipodal points)
+
+    """
+    if np is not None:
+        return _vincenty_many_numpy(lats1, lons1, lats2, lons2, tolerance, max_iterations).tolist()
+    return [
+        vincenty(lat1, lon1, lat2, lon2, tolerance, max_iterations)
+        for lat1, lon1, lat2, lon2 in zip(lats1, lons1, lats2, lons2)
+    ]
+
+
+def bearing_many(
+        lats1: Sequence[float],
+        lons1: Sequence[float],
+        lats2: Sequence[float],
+        lons2: Sequence[float]
+) -> list[float]:
+    """
+    Pairwise initial bearings, see bearing
+
+    Args:
+        lats1 (Sequence[float]): Latitudes of the first points in degrees
+        lons1 (Sequence[float]): Longitudes of the first points in degrees
+        lats2 (Sequence[float]): Latitudes of the second points in degrees
+        lons2 (Sequence[float]): Longitudes of the second points in degrees
+
+    Returns:
+        The bearings in degrees (0 <= bearing < 360)
+
+    """
+    if np is not None:
+        return _bearing_many_numpy(lats1, lons1, lats2, lons2).tolist()
+    return list(map(bearing, lats1, lons1, lats2, lons2))
+
+
+def leg_distances(
+        waypoints: Iterable[Waypoint] | WaypointTable,
+        method: str = 'haversine',
+        altitude: bool = False
+) -> list[float]:
+    """
+    Distances of all legs between consecutive waypoints
+
+    Args:
+        waypoints (Iterable[Waypoint] | WaypointTable): Waypoints, a Mission or a WaypointTable
+        method (str): 'haversine' (sphere) or 'vincenty' (WGS84 ellipsoid)
+        altitude (bool): Include the altitude difference (3D distance)
+
+    Returns:
+        The len(waypoints) - 1 leg distances in meters
+
+    Raises:
+        ValueError: If method is unknown
+
+    """
+    lats, lons, alts = _prepare(coordinates(waypoints))
+    match method:
+        case 'haversine':
+            distances = haversine_many(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        case 'vincenty':
+            distances = vincenty_many(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        case _:
+            raise ValueError(f"unknown method {method}")
+    if altitude:
+        if np is not None:
+            return np.hypot(distances, np.diff(alts)).tolist()
+        distances = list(map(math.hypot, distances, (b - a for a, b in zip(alts, alts[1:]))))
+    return distances
+
+
+def leg_bearings(waypoints: Iterable[Waypoint] | WaypointTable) -> list[float]:
+    """
+    Initial bearings of all legs between consecutive waypoints
+
+    Args:
+        waypoints (Iterable[Waypoint] | WaypointTable): Waypoints, a Mission or a WaypointTable
+
+    Returns:
+        The len(waypoints) - 1 leg bearings in degrees (0 <= bearing < 360)
+
+    """
+    lats, lons, _ = _prepare(coordinates(waypoints))
+    return bearing_many(lats[:-1], lons[:-1], lats[1:], lons[1:])
+
+
+def path_length(
+        waypoints: Iterable[Waypoint] | WaypointTable,
+        method: str = 'haversine',
+        altitude: bool = False
+) -> float:
+    """
+    Total length of the path through all waypoints, see leg_distances
+
+    Args:
+        waypoints (Iterable[Waypoint] | WaypointTable): Waypoints, a Mission or a WaypointTable
+        method (str): 'haversine' (sphere) or 'vincenty' (WGS84 ellipsoid)
+        altitude (bool): Include the altitude differences (3D length)
+
+    Returns:
+        The length in meters
+
+    Raises:
+        ValueError: If method is unknown
+
+    """
+    return math.fsum(leg_distances(waypoints, method, altitude))
@@ -0,0 +1,22 @@
+from typing import Iterable, Sequence, Union
+
+from litchi_wp.columns import COLUMN_NAMES as COLUMN_NAMES
+from litchi_wp.table import WaypointTable as WaypointTable
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+EARTH_RADIUS: float
+WGS84_A: float
+WGS84_F: float
+WGS84_B: float
+Coordinates = tuple[Sequence[float], Sequence[float], Sequence[float]]
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float: ...
+def vincenty(lat1: float, lon1: float, lat2: float, lon2: float, tolerance: float = ..., max_iterations: int = ...) -> float: ...
+def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float: ...
+def coordinates(waypoints: Union[Iterable[Waypoint], WaypointTable]) -> Coordinates: ...
+def haversine_many(lats1: Sequence[float], lons1: Sequence[float], lats2: Sequence[float], lons2: Sequence[float]) -> list[float]: ...
+def vincenty_many(lats1: Sequence[float], lons1: Sequence[float], lats2: Sequence[float], lons2: Sequence[float], tolerance: float = ..., max_iterations: int = ...) -> list[float]: ...
+def bearing_many(lats1: Sequence[float], lons1: Sequence[float], lats2: Sequence[float], lons2: Sequence[float]) -> list[float]: ...
+def leg_distances(waypoints: Union[Iterable[Waypoint], WaypointTable], method: str = 'haversine', altitude: bool = False) -> list[float]: ...
+def leg_bearings(waypoints: Union[Iterable[Waypoint], WaypointTable]) -> list[float]: ...
+def path_length(waypoints: Union[Iterable[Waypoint], WaypointTable], method: str = 'haversine', altitude: bool = False) -> float: ...
@@ -14,6 +14,7 @@ class Gimbal:
             pitchangle (int): The gimbal angle in degrees
 
     """
+    __slots__ = ('mode', 'pitchangle')
 
     def __init__(self, mode: GimbalMode = GimbalMode.DISABLED, pitchangle: float = 0):
         """
@@ -0,0 +1,254 @@
+"""
+Module for waypoints that are decoded from their csv line on first use
+
+A LazyWaypoint only matches the line pattern and splits the line when it is parsed.
+Every attribute of Waypoint is decoded from the fields the first time it is read,
+so a pass that only looks at the coordinates never creates the Altitude, Gimbal,
+Poi, Photo and Action objects. Waypoints whose decoded values still equal the text
+are written as their original line.
+"""
+# pylint: disable=import-error
+from typing import Callable
+
+from litchi_wp.action import NO_ACTION
+from litchi_wp.altitude import Altitude
+from litchi_wp.columns import (
+    ACTION_COLUMNS, ALTITUDE, ALTITUDEMODE, COLUMNS, CURVESIZE, GIMBALMODE, GIMBALPITCHANGLE, HEADING,
+    LATITUDE, LINE_PATTERN, LONGITUDE, PHOTO_DISTINTERVAL, PHOTO_TIMEINTERVAL, POI_ALTITUDE,
+    POI_ALTITUDEMODE, POI_LATITUDE, POI_LONGITUDE, ROTATIONDIR, SPEED, compile_getter
+)
+from litchi_wp.enums import ActionType, AltitudeMode, GimbalMode, NumberFormat, RotationDirection
+from litchi_wp.formatting import row_formatter
+from litchi_wp.gimbal import Gimbal
+from litchi_wp.photo import Photo
+from litchi_wp.poi import Poi
+from litchi_wp.waypoint import Waypoint
+
+
+def _decode_altitude(waypoint: Waypoint, fields: list[str]):
+    waypoint.altitude = Altitude(float(fields[ALTITUDE]), AltitudeMode(int(fields[ALTITUDEMODE])))
+
+
+def _decode_gimbal(waypoint: Waypoint, fields: list[str]):
+    waypoint.gimbal = Gimbal()
+    waypoint.set_gimbal(GimbalMode(int(fields[GIMBALMODE])), float(fields[GIMBALPITCHANGLE]))
+
+
+def _decode_actions(waypoint: Waypoint, fields: list[str]):
+    waypoint.actions = [NO_ACTION] * len(ACTION_COLUMNS)
+    for index, (type_index, param_index) in enumerate(ACTION_COLUMNS):
+        waypoint.replace_action(index, ActionType(int(fields[type_index])), float(fields[param_index]))
+
+
+def _decode_poi(waypoint: Waypoint, fields: list[str]):
+    waypoint.poi = Poi()
+    waypoint.set_poi(
+        float(fields[POI_LATITUDE]), float(fields[POI_LONGITUDE]), float(fields[POI_ALTITUDE]),
+        AltitudeMode(int(fields[POI_ALTITUDEMODE]))
+    )
+
+
+def _decode_photo(waypoint: Waypoint, fields: list[str]):
+    waypoint.photo = Photo(float(fields[PHOTO_TIMEINTERVAL]), float(fields[PHOTO_DISTINTERVAL]))
+
+
+_DECODERS: dict[str, Callable[[Waypoint, list[str]], None]] = {
+    'lat': lambda waypoint, fields: setattr(waypoint, 'lat', float(fields[LATITUDE])),
+    'lon': lambda waypoint, fields: setattr(waypoint, 'lon', float(fields[LONGITUDE])),
+    'altitude': _decode_altitude,
+    'heading': lambda waypoint, fields: setattr(waypoint, 'heading', float(fields[HEADING])),
+    'curvesize': lambda waypoint, fields: waypoint.set_curvesize(fields[CURVESIZE]),
+    'rotationdir': lambda waypoint, fields: setattr(
+        waypoint, 'rotationdir', RotationDirection(int(fields[ROTATIONDIR]))
+    ),
+    'gimbal': _decode_gimbal,
+    '_actions': _decode_actions,
+    'speed': lambda waypoint, fields: setattr(waypoint, 'speed', float(fields[SPEED])),
+    'poi': _decode_poi,
+    'photo': _decode_photo,
+    'next_action_index': lambda waypoint, _fields: setattr(waypoint, 'next_action_index', 0),
+}
+"""Functions setting one slot of a waypoint from the fields of its line"""
+
+_SLOTS = {name: Waypoint.__dict__[name] for name in Waypoint.__slots__}
+
+
+def _compile_slot_getters() -> dict[str, tuple[tuple[int, ...], Callable]]:
+    """
+    Generates per slot the indices of its columns and a function returning their
+    values of a waypoint
+    """
+    accessors: dict[str, list] = {}
+    for column in COLUMNS:
+        slot = column.accessor.split('.')[0].split('[')[0]
+        accessors.setdefault(slot, []).append(column)
+    return {
+        slot: (tuple(column.index for column in columns), compile_getter(columns))
+        for slot, columns in accessors.items()
+    }
+
+
+_SLOT_GETTERS = _compile_slot_getters()
+
+
+class LazyWaypoint(Waypoint):
+    """
+    Class representing a litchi waypoint that is decoded from its csv line on first use.
+    It has the API of Waypoint. The values of a slot are validated when the slot is
+    decoded, so errors of lines that Waypoint.from_line would reject are raised on the
+    first access, use materialize to decode and validate everything at once.
+    LazyWaypoint.iter_file only rejects lines that do not match the line pattern,
+    LazyWaypoint.dump_many writes unmodified waypoints as their original line if no
+    number format is requested, so filtering a file does not decode the written waypoints.
+
+    Attributes:
+        line (str): The 46 columns of the original csv line
+
+    """
+    __slots__ = ('line', '_fields', '_set')
+
+    def __init__(self, line: str):  # pylint: disable=super-init-not-called
+        """
+        Constructor, matches the line pattern and splits the line
+
+        Args:
+            line (str): The litchi waypoints csv line
+
+        Raises:
+            ValueError: If line does not match regex filter
+
+        """
+        match = LINE_PATTERN.match(line)
+        if not match:
+            raise ValueError('invalid_input')
+        self._set: set[str] = set()
+        self.line = match.group()
+        self._fields = self.line.split(',')
+
+    def __getattr__(self, name: str):
+        decode = _DECODERS.get(name)
+        if decode is None:
+            raise AttributeError(name)
+        try:
+            decode(self, self._fields)
+        except ValueError:
+            if name in self._set:
+                self._set.discard(name)
+                _SLOTS[name].__delete__(self)
+            raise
+        return _SLOTS[name].__get__(self)
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name in _SLOTS:
+            self._set.add(name)
+
+    def decoded(self) -> list[str]:
+        """
+        Getter for the slots that were decoded or assigned
+
+        Returns:
+            The names of the set slots of Waypoint.__slots__
+        """
+        return [name for name in _SLOTS if name in self._set]
+
+    def materialize(self) -> 'LazyWaypoint':
+        """
+        Decodes all slots, which validates all values like Waypoint.from_line
+
+        Returns:
+            The waypoint itself
+
+        Raises:
+            ValueError: If a value is out of range or no valid enum value
+
+        """
+        for name in _SLOTS:
+            getattr(self, name)
+        return self
+
+    def is_modified(self) -> bool:
+        """
+        Checks if the values of the decoded slots differ from the original line.
+        Only the decoded slots are compared, nothing is decoded.
+
+        Returns:
+            True if to_line would not return the original line
+        """
+        fields = self._fields
+        for name in self._set:
+            indices, getter = _SLOT_GETTERS.get(name, ((), None))
+            if getter is not None and getter(self) != tuple(float(fields[index]) for index in indices):
+                return True
+        return False
+
+    def to_row(self) -> tuple[int | float, ...]:
+        """
+        Transforms the waypoint to the 46 values of a litchi csv line, decodes all slots
+
+        Returns:
+            The column values in the order of the header, enums as their int values
+
+        """
+        self.materialize()
+        return Waypoint.to_row(self)
+
+    def to_line(
+            self,
+            line_break: str | bool | None = '\n',
+            number_format: NumberFormat | None = None
+    ) -> str:
+        """
+        Transforms the waypoint to a line in litchi csv format.
+        The original line is returned unchanged if the waypoint was not modified
+        and no number format is requested.
+
+        Args:
+            line_break (str | bool | None): Linebreak character, disable with None or False
+            number_format (NumberFormat | None): The number format, None to keep
+                the original text or to use the global one (see formatting.set_number_format)
+
+        Returns:
+            The serialized waypoint in litchi csv format
+
+        """
+        if number_format is not None or self.is_modified():
+            return Waypoint.to_line(self, line_break, number_format)
+        line = self.line
+        if line_break:
+            if line_break is not True:
+                line += line_break
+        return line
+
+    @staticmethod
+    def from_line(line: str) -> 'LazyWaypoint':
+        """
+        Parses a line from a litchi waypoint csv file without decoding its values
+
+        Args:
+            line (str): The litchi waypoints csv line
+
+        Returns:
+            The LazyWaypoint as an instance
+
+        Raises:
+            ValueError: If line does not match regex filter
+
+        """
+        return LazyWaypoint(line)
+
+    @classmethod
+    def _line_formatter(cls, number_format: NumberFormat | None) -> Callable[[Waypoint], str]:
+        """
+        Creates the function dump_many writes every waypoint with, unmodified
+        LazyWaypoints are written as their original line if no number format is requested
+        """
+        format_row = row_formatter(number_format)
+        if number_format is not None:
+            return lambda waypoint: format_row(waypoint.to_row())
+
+        def format_line(waypoint: Waypoint) -> str:
+            if isinstance(waypoint, LazyWaypoint) and not waypoint.is_modified():
+                return waypoint.line
+            return format_row(waypoint.to_row())
+        return format_line
@@ -0,0 +1,24 @@
+from typing import Union
+
+from litchi_wp.action import NO_ACTION as NO_ACTION
+from litchi_wp.altitude import Altitude as Altitude
+from litchi_wp.columns import ACTION_COLUMNS as ACTION_COLUMNS, ALTITUDE as ALTITUDE, ALTITUDEMODE as ALTITUDEMODE, COLUMNS as COLUMNS, CURVESIZE as CURVESIZE, GIMBALMODE as GIMBALMODE, GIMBALPITCHANGLE as GIMBALPITCHANGLE, HEADING as HEADING, LATITUDE as LATITUDE, LINE_PATTERN as LINE_PATTERN, LONGITUDE as LONGITUDE, PHOTO_DISTINTERVAL as PHOTO_DISTINTERVAL, PHOTO_TIMEINTERVAL as PHOTO_TIMEINTERVAL, POI_ALTITUDE as POI_ALTITUDE, POI_ALTITUDEMODE as POI_ALTITUDEMODE, POI_LATITUDE as POI_LATITUDE, POI_LONGITUDE as POI_LONGITUDE, ROTATIONDIR as ROTATIONDIR, SPEED as SPEED, compile_getter as compile_getter
+from litchi_wp.enums import ActionType as ActionType, AltitudeMode as AltitudeMode, GimbalMode as GimbalMode, NumberFormat as NumberFormat, RotationDirection as RotationDirection
+from litchi_wp.formatting import row_formatter as row_formatter
+from litchi_wp.gimbal import Gimbal as Gimbal
+from litchi_wp.photo import Photo as Photo
+from litchi_wp.poi import Poi as Poi
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+class LazyWaypoint(Waypoint):
+    line: str
+    def __init__(self, line: str) -> None: ...
+    def __getattr__(self, name: str): ...
+    def __setattr__(self, name: str, value) -> None: ...
+    def decoded(self) -> list[str]: ...
+    def materialize(self) -> LazyWaypoint: ...
+    def is_modified(self) -> bool: ...
+    def to_row(self) -> tuple[Union[int, float], ...]: ...
+    def to_line(self, line_break: Union[str, bool, None] = ..., number_format: Union[NumberFormat, None] = ...) -> str: ...
+    @staticmethod
+    def from_line(line: str) -> LazyWaypoint: ...
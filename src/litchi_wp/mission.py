@@ -0,0 +1,291 @@
+"""
+Module for working with a whole litchi mission (an ordered list of waypoints)
+"""
+# pylint: disable=import-error
+import asyncio
+import os
+from itertools import compress, islice
+from typing import Callable, Iterable, Iterator, Sequence, TextIO
+
+from litchi_wp.enums import NumberFormat
+from litchi_wp.files import open_text
+from litchi_wp.formatting import row_formatter
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+class Mission:
+    """
+    Class representing a litchi mission, an ordered collection of Waypoints
+
+    The waypoints are kept in a plain list: indexing and append are O(1) (amortized),
+    insert and deleting a single waypoint are O(n) because the following waypoints are
+    shifted. Bulk operations (insert_many, delete_many, reorder) rebuild the underlying
+    list once instead of shifting it for every single waypoint.
+
+    Attributes:
+        waypoints (list[Waypoint]): The waypoints in flight order
+
+    """
+    __slots__ = ('waypoints',)
+
+    def __init__(self, waypoints: Iterable[Waypoint] = ()):
+        """
+        Constructor
+
+        Args:
+            waypoints (Iterable[Waypoint]): The waypoints in flight order
+
+        """
+        self.waypoints: list[Waypoint] = list(waypoints)
+
+    def __len__(self) -> int:
+        return len(self.waypoints)
+
+    def __iter__(self) -> Iterator[Waypoint]:
+        return iter(self.waypoints)
+
+    def __reversed__(self) -> Iterator[Waypoint]:
+        return reversed(self.waypoints)
+
+    def __getitem__(self, index: int | slice) -> 'Waypoint | Mission':
+        if isinstance(index, slice):
+            return Mission(self.waypoints[index])
+        return self.waypoints[index]
+
+    def __setitem__(self, index: int | slice, value: 'Waypoint | Iterable[Waypoint]'):
+        self.waypoints[index] = value
+
+    def __delitem__(self, index: int | slice):
+        del self.waypoints[index]
+
+    def append(self, waypoint: Waypoint):
+        """
+        Appends a waypoint to the end of the mission
+
+        Args:
+            waypoint (Waypoint): The waypoint to be appended
+
+        """
+        self.waypoints.append(waypoint)
+
+    def extend(self, waypoints: Iterable[Waypoint]):
+        """
+        Appends waypoints to the end of the mission
+
+        Args:
+            waypoints (Iterable[Waypoint]): The waypoints to be appended
+
+        """
+        self.waypoints.extend(waypoints)
+
+    def insert(self, index: int, waypoint: Waypoint):
+        """
+        Inserts a waypoint before index, O(n) as the following waypoints are shifted
+
+        Use insert_many to insert several waypoints at once.
+
+        Args:
+            index (int): The index of the waypoint that will follow the new one
+            waypoint (Waypoint): The waypoint to be inserted
+
+        """
+        self.waypoints.insert(index, waypoint)
+
+    def insert_many(self, index: int, waypoints: Iterable[Waypoint]):
+        """
+        Inserts waypoints before index, shifting the following waypoints only once
+
+        Args:
+            index (int): The index of the waypoint that will follow the new ones
+            waypoints (Iterable[Waypoint]): The waypoints to be inserted in order
+
+        """
+        self.waypoints[index:index] = waypoints
+
+    def delete_many(self, indices: Iterable[int]):
+        """
+        Deletes the waypoints at the given indices in one pass
+
+        Args:
+            indices (Iterable[int]): The indices of the waypoints to be deleted
+
+        Raises:
+            IndexError: If an index is out of range
+
+        """
+        keep = [True] * len(self.waypoints)
+        for index in indices:
+            keep[index] = False
+        self.waypoints = list(compress(self.waypoints, keep))
+
+    def reorder(self, order: Sequence[int]):
+        """
+        Reorders the waypoints
+
+        Args:
+            order (Sequence[int]): The old indices of the waypoints in their new order,
+                a permutation of range(len(mission))
+
+        Raises:
+            ValueError: If order is no permutation of the waypoint indices
+
+        """
+        if len(order) != len(self.waypoints) or set(order) != set(range(len(self.waypoints))):
+            raise ValueError('order has to be a permutation of the waypoint indices')
+        self.waypoints = [self.waypoints[index] for index in order]
+
+    def reverse(self):
+        """
+        Reverses the flight order in place
+        """
+        self.waypoints.reverse()
+
+    def to_table(self) -> WaypointTable:
+        """
+        Transforms the mission to a WaypointTable
+
+        Returns:
+            The waypoints as WaypointTable
+
+        """
+        return WaypointTable.from_waypoints(self.waypoints)
+
+    def to_file(
+            self,
+            file: str | os.PathLike | TextIO,
+            line_break: str = '\n',
+            number_format: NumberFormat | None = None
+    ) -> int:
+        """
+        Writes the mission to a litchi waypoint csv file, see Waypoint.dump_many
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename or an opened text stream
+            line_break (str): Linebreak character
+            number_format (NumberFormat | None): The number format, the global one
+                (see formatting.set_number_format) if None
+
+        Returns:
+            The number of written waypoints
+
+        """
+        return Waypoint.dump_many(self.waypoints, file, line_break=line_break, number_format=number_format)
+
+    async def asave(
+            self,
+            file: str | os.PathLike | TextIO,
+            line_break: str = '\n',
+            chunk_size: int = 64,
+            number_format: NumberFormat | None = None
+    ) -> int:
+        """
+        Writes the mission to a litchi waypoint csv file without blocking the event loop.
+        The lines are serialized in chunks, every chunk is written in a worker thread and
+        other tasks run between the chunks. The list of waypoints is copied when the save
+        starts, waypoints changed during the save may be written in either state.
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename or an opened text stream,
+                paths ending with '.gz' are written as gzip compressed text
+            line_break (str): Linebreak character
+            chunk_size (int): Number of lines serialized between two yields to the event loop
+            number_format (NumberFormat | None): The number format, the global one
+                (see formatting.set_number_format) if None
+
+        Returns:
+            The number of written waypoints
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            stream = await asyncio.to_thread(open_text, file, 'w')
+            try:
+                return await self.asave(stream, line_break, chunk_size, number_format)
+            finally:
+                await asyncio.to_thread(stream.close)
+        waypoints = list(self.waypoints)
+        format_row = row_formatter(number_format)
+        await asyncio.to_thread(file.write, Waypoint.get_header(line_break=line_break))
+        for start in range(0, len(waypoints), max(chunk_size, 1)):
+            chunk = ''.join(
+                format_row(waypoint.to_row()) + line_break
+                for waypoint in waypoints[start:start + max(chunk_size, 1)]
+            )
+            await asyncio.to_thread(file.write, chunk)
+        return len(waypoints)
+
+    @staticmethod
+    def from_table(table: WaypointTable) -> 'Mission':
+        """
+        Creates a mission from a WaypointTable
+
+        Args:
+            table (WaypointTable): The table to be converted
+
+        Returns:
+            The Mission as an instance
+
+        """
+        return Mission(table)
+
+    @staticmethod
+    def from_file(
+            file: str | os.PathLike | TextIO,
+            on_error: Callable[[int, str, ValueError], None] | None = None
+    ) -> 'Mission':
+        """
+        Creates a mission from a litchi waypoint csv file, see Waypoint.iter_file
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename or an opened text stream
+            on_error (Callable[[int, str, ValueError], None] | None): Called with the
+                line number, the line and the error for every line that could not be parsed
+
+        Returns:
+            The Mission as an instance
+
+        """
+        return Mission(Waypoint.iter_file(file, on_error))
+
+    @staticmethod
+    async def aload(
+            file: str | os.PathLike | TextIO,
+            on_error: Callable[[int, str, ValueError], None] | None = None,
+            chunk_size: int = 64
+    ) -> 'Mission':
+        """
+        Creates a mission from a litchi waypoint csv file without blocking the event loop.
+        The file is read in chunks of lines in a worker thread, every chunk is parsed with
+        the bulk parser of WaypointTable in the event loop and other tasks run between the
+        chunks, so many missions can be loaded concurrently without a large file starving
+        the others.
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename or an opened text stream,
+                paths ending with '.gz' are opened as gzip compressed text
+            on_error (Callable[[int, str, ValueError], None] | None): Called with the
+                line number, the line and the error for every line that could not be parsed
+            chunk_size (int): Number of lines parsed between two yields to the event loop
+
+        Returns:
+            The Mission as an instance
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            stream = await asyncio.to_thread(open_text, file, 'r')
+            try:
+                return await Mission.aload(stream, on_error, chunk_size)
+            finally:
+                await asyncio.to_thread(stream.close)
+        waypoints = []
+        first_line_number = 1
+        while lines := await asyncio.to_thread(_read_lines, file, max(chunk_size, 1)):
+            table = WaypointTable()
+            table.extend_from_text(''.join(lines), on_error, first_line_number)
+            waypoints.extend(table.to_waypoints())
+            first_line_number += len(lines)
+        return Mission(waypoints)
+
+
+def _read_lines(file: TextIO, count: int) -> list[str]:
+    return list(islice(file, count))
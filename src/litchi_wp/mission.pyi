@@ -0,0 +1,34 @@
+import os
+from typing import Callable, Iterable, Iterator, Sequence, TextIO, Union
+
+from litchi_wp.enums import NumberFormat as NumberFormat
+from litchi_wp.files import open_text as open_text
+from litchi_wp.formatting import row_formatter as row_formatter
+from litchi_wp.table import WaypointTable as WaypointTable
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+class Mission:
+    waypoints: list[Waypoint]
+    def __init__(self, waypoints: Iterable[Waypoint] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Waypoint]: ...
+    def __reversed__(self) -> Iterator[Waypoint]: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[Waypoint, Mission]: ...
+    def __setitem__(self, index: Union[int, slice], value: Union[Waypoint, Iterable[Waypoint]]): ...
+    def __delitem__(self, index: Union[int, slice]): ...
+    def append(self, waypoint: Waypoint): ...
+    def extend(self, waypoints: Iterable[Waypoint]): ...
+    def insert(self, index: int, waypoint: Waypoint): ...
+    def insert_many(self, index: int, waypoints: Iterable[Waypoint]): ...
+    def delete_many(self, indices: Iterable[int]): ...
+    def reorder(self, order: Sequence[int]): ...
+    def reverse(self) -> None: ...
+    def to_table(self) -> WaypointTable: ...
+    def to_file(self, file: Union[str, os.PathLike, TextIO], line_break: str = '\n', number_format: Union[NumberFormat, None] = ...) -> int: ...
+    async def asave(self, file: Union[str, os.PathLike, TextIO], line_break: str = '\n', chunk_size: int = 64, number_format: Union[NumberFormat, None] = ...) -> int: ...
+    @staticmethod
+    def from_table(table: WaypointTable) -> Mission: ...
+    @staticmethod
+    def from_file(file: Union[str, os.PathLike, TextIO], on_error: Union[Callable[[int, str, ValueError], None], None] = ...) -> Mission: ...
+    @staticmethod
+    async def aload(file: Union[str, os.PathLike, TextIO], on_error: Union[Callable[[int, str, ValueError], None], None] = ..., chunk_size: int = 64) -> Mission: ...
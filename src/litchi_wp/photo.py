@@ -12,6 +12,7 @@ class Photo:
         distance_interval (float): The interval between photos in meters
 
     """
+    __slots__ = ('time_interval', 'distance_interval')
 
     def __init__(self, time_interval: float = -1.0, distance_interval: float = -1.0):
         """
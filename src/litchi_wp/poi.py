@@ -16,6 +16,7 @@ class Poi:
         altitude (AltitudeMode): The altitude in meters
 
     """
+    __slots__ = ('lat', 'lon', 'altitude')
 
     def __init__(
             self,
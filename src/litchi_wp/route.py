@@ -0,0 +1,310 @@
+"""
+Module for optimizing the visiting order of waypoints (travelling salesman heuristics)
+
+The distance matrix is calculated with numpy if it is installed and in pure Python otherwise.
+"""
+# pylint: disable=import-error,invalid-name,too-many-arguments,too-many-locals,too-many-branches
+import math
+import multiprocessing
+import random
+from array import array
+from typing import Sequence
+
+from litchi_wp.geodesy import EARTH_RADIUS, coordinates, haversine
+from litchi_wp.waypoint import Waypoint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_EPSILON = 1e-7
+
+_worker_matrix: list[array] = []
+_worker_neighbours: list[list[int]] = []
+
+
+def distance_matrix(waypoints: Sequence[Waypoint]) -> list[array]:
+    """
+    Calculates the 3D distances between all waypoints (haversine and altitude difference)
+
+    Args:
+        waypoints (Sequence[Waypoint]): The waypoints
+
+    Returns:
+        One array('d') per waypoint with the distances in meters to all waypoints
+    """
+    lats, lons, alts = coordinates(waypoints)
+    if np is not None:
+        phi = np.radians(np.asarray(lats, dtype=float))
+        lam = np.radians(np.asarray(lons, dtype=float))
+        alt = np.asarray(alts, dtype=float)
+        rows = []
+        for index in range(len(lats)):
+            a = (
+                np.sin((phi - phi[index]) / 2) ** 2
+                + np.cos(phi[index]) * np.cos(phi) * np.sin((lam - lam[index]) / 2) ** 2
+            )
+            horizontal = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+            rows.append(array('d', np.hypot(horizontal, alt - alt[index]).tobytes()))
+        return rows
+    return [
+        array('d', (
+            math.hypot(haversine(lat1, lon1, lat2, lon2), alt2 - alt1)
+            for lat2, lon2, alt2 in zip(lats, lons, alts)
+        ))
+        for lat1, lon1, alt1 in zip(lats, lons, alts)
+    ]
+
+
+def _neighbour_lists(matrix: list[array], count: int) -> list[list[int]]:
+    """
+    Finds the count nearest other nodes of every node
+    """
+    size = len(matrix)
+    count = min(count, size - 1)
+    if np is not None:
+        neighbours = []
+        for index, row in enumerate(matrix):
+            distances = np.frombuffer(row, dtype=float).copy()
+            distances[index] = math.inf
+            nearest = np.argpartition(distances, count - 1)[:count] if count else []
+            neighbours.append(sorted(nearest.tolist(), key=row.__getitem__) if count else [])
+        return neighbours
+    return [
+        sorted((other for other in range(size) if other != index), key=row.__getitem__)[:count]
+        for index, row in enumerate(matrix)
+    ]
+
+
+def _nearest_neighbour(
+        matrix: list[array],
+        start: int,
+        end: int,
+        rng: random.Random | None
+) -> list[int]:
+    """
+    Builds a path from start to end that always visits the nearest unvisited node next,
+    or randomly one of the three nearest if rng is given
+    """
+    unvisited = set(range(len(matrix)))
+    unvisited.discard(start)
+    unvisited.discard(end)
+    path = [start]
+    current = start
+    while unvisited:
+        row = matrix[current]
+        if rng is None or len(unvisited) < 3:
+            current = min(unvisited, key=row.__getitem__)
+        else:
+            current = rng.choice(sorted(unvisited, key=row.__getitem__)[:3])
+        unvisited.remove(current)
+        path.append(current)
+    path.append(end)
+    return path
+
+
+def _length(matrix: list[array], path: list[int]) -> float:
+    return math.fsum(matrix[a][b] for a, b in zip(path, path[1:]))
+
+
+def _two_opt(matrix: list[array], neighbours: list[list[int]], path: list[int]) -> bool:
+    """
+    Improves an open path with fixed ends by 2-opt moves between neighbouring nodes.
+    Every move is evaluated in O(1) from the matrix, only improving moves reverse the path.
+    """
+    size = len(path)
+    position = [0] * size
+    for index, node in enumerate(path):
+        position[node] = index
+    improved = False
+    active = True
+    while active:
+        active = False
+        for a in path[1:-1]:
+            for c in neighbours[a]:
+                i = position[a]
+                j = position[c]
+                if i > j:
+                    i, j = j, i
+                if j - i < 2:
+                    continue
+                first, second = path[i], path[j]
+                # connect the successors: (i, i+1), (j, j+1) -> (i, j), (i+1, j+1)
+                if j + 1 < size:
+                    after_first = path[i + 1]
+                    after_second = path[j + 1]
+                    delta = (
+                        matrix[first][second] + matrix[after_first][after_second]
+                        - matrix[first][after_first] - matrix[second][after_second]
+                    )
+                    if delta < -_EPSILON:
+                        path[i + 1:j + 1] = path[j:i:-1]
+                        for index in range(i + 1, j + 1):
+                            position[path[index]] = index
+                        improved = active = True
+                        continue
+                # connect the predecessors: (i-1, i), (j-1, j) -> (i-1, j-1), (i, j)
+                if i > 0:
+                    before_first = path[i - 1]
+                    before_second = path[j - 1]
+                    delta = (
+                        matrix[before_first][before_second] + matrix[first][second]
+                        - matrix[before_first][first] - matrix[before_second][second]
+                    )
+                    if delta < -_EPSILON:
+                        path[i:j] = path[j - 1:i - 1:-1]
+                        for index in range(i, j):
+                            position[path[index]] = index
+                        improved = active = True
+    return improved
+
+
+def _or_opt(matrix: list[array], neighbours: list[list[int]], path: list[int]) -> bool:
+    """
+    Improves an open path with fixed ends by moving segments of 1 to 3 nodes next to
+    a neighbouring node, in original or reversed direction. Every move is evaluated
+    in O(1) from the matrix.
+    """
+    position = [0] * len(path)
+    for index, node in enumerate(path):
+        position[node] = index
+    improved = False
+    active = True
+    while active:
+        active = False
+        for length in (1, 2, 3):
+            start = 1
+            while start + length < len(path):
+                end = start + length - 1
+                before = path[start - 1]
+                after = path[end + 1]
+                head = path[start]
+                tail = path[end]
+                removed = matrix[before][head] + matrix[tail][after] - matrix[before][after]
+                best = None
+                for node in neighbours[head] + neighbours[tail]:
+                    # insert between node and its successor
+                    target = position[node]
+                    if start - 1 <= target <= end or target + 1 >= len(path):
+                        continue
+                    follower = path[target + 1]
+                    forward = matrix[node][head] + matrix[tail][follower] - matrix[node][follower]
+                    backward = matrix[node][tail] + matrix[head][follower] - matrix[node][follower]
+                    gain = removed - min(forward, backward)
+                    if gain > _EPSILON and (best is None or gain > best[0]):
+                        best = (gain, target, backward < forward)
+                if best is None:
+                    start += 1
+                    continue
+                _gain, target, reverse = best
+                segment = path[start:end + 1]
+                if reverse:
+                    segment.reverse()
+                if target < start:
+                    path[target + 1 + length:end + 1] = path[target + 1:start]
+                    path[target + 1:target + 1 + length] = segment
+                    changed = range(target + 1, end + 1)
+                else:
+                    path[start:target + 1 - length] = path[end + 1:target + 1]
+                    path[target + 1 - length:target + 1] = segment
+                    changed = range(start, target + 1)
+                for index in changed:
+                    position[path[index]] = index
+                improved = active = True
+    return improved
+
+
+def _improve(matrix: list[array], neighbours: list[list[int]], path: list[int]) -> list[int]:
+    while _two_opt(matrix, neighbours, path) | _or_opt(matrix, neighbours, path):
+        pass
+    return path
+
+
+def _init_worker(matrix: list[array], neighbours: list[list[int]]):
+    global _worker_matrix, _worker_neighbours  # pylint: disable=global-statement
+    _worker_matrix = matrix
+    _worker_neighbours = neighbours
+
+
+def _restart(arguments: tuple[int, int, int]) -> tuple[float, list[int]]:
+    start, end, seed = arguments
+    path = _nearest_neighbour(_worker_matrix, start, end, random.Random(seed))
+    _improve(_worker_matrix, _worker_neighbours, path)
+    return _length(_worker_matrix, path), path
+
+
+def optimize_order(
+        waypoints: Sequence[Waypoint],
+        fixed_start: bool = True,
+        fixed_end: bool = False,
+        restarts: int = 0,
+        processes: int | None = 1,
+        neighbours: int = 10,
+        seed: int | None = None
+) -> list[int]:
+    """
+    Finds a short visiting order for waypoints, e.g. unordered inspection targets.
+    A nearest neighbour path is improved by 2-opt and Or-opt moves between each
+    waypoint and its nearest neighbours until no move shortens the path.
+    The result can be applied with Mission.reorder.
+
+    Args:
+        waypoints (Sequence[Waypoint]): The waypoints
+        fixed_start (bool): Keep the first waypoint at the start
+        fixed_end (bool): Keep the last waypoint at the end
+        restarts (int): Number of additional randomized starts, the shortest path wins
+        processes (int | None): Number of processes for the restarts,
+            None for one per CPU, 1 to run them in this process
+        neighbours (int): Number of nearest neighbours considered for the moves of a waypoint
+        seed (int | None): Seed of the randomized restarts
+
+    Returns:
+        The indices of the waypoints in the optimized order
+    """
+    count = len(waypoints)
+    if count < 3:
+        return list(range(count))
+    matrix = distance_matrix(waypoints)
+    # free ends are modelled as an additional node with distance 0 to all others
+    start, end = 0, count - 1
+    if not fixed_start:
+        start = len(matrix)
+        matrix = [row + array('d', [0.0]) for row in matrix] + [array('d', [0.0] * (len(matrix) + 1))]
+    if not fixed_end:
+        end = len(matrix)
+        matrix = [row + array('d', [0.0]) for row in matrix] + [array('d', [0.0] * (len(matrix) + 1))]
+        if not fixed_start:
+            matrix[start][end] = matrix[end][start] = math.inf
+    neighbour_lists = _neighbour_lists(matrix, neighbours)
+
+    best = _improve(matrix, neighbour_lists, _nearest_neighbour(matrix, start, end, None))
+    best_length = _length(matrix, best)
+    if restarts > 0:
+        seeds = random.Random(seed).sample(range(2 ** 31), restarts)
+        tasks = [(start, end, task_seed) for task_seed in seeds]
+        if processes == 1:
+            _init_worker(matrix, neighbour_lists)
+            results = list(map(_restart, tasks))
+        else:
+            with multiprocessing.Pool(processes, _init_worker, (matrix, neighbour_lists)) as pool:
+                results = pool.map(_restart, tasks)
+        for length, path in results:
+            if length < best_length - _EPSILON:
+                best_length, best = length, path
+    return [node for node in best if node < count]
+
+
+def optimize_route(waypoints: Sequence[Waypoint], **options) -> list[Waypoint]:
+    """
+    Reorders waypoints to a short visiting order, see optimize_order.
+    The waypoints are not copied, so their actions and POIs are kept.
+
+    Args:
+        waypoints (Sequence[Waypoint]): The waypoints
+        **options: The options of optimize_order
+
+    Returns:
+        The waypoints in the optimized order
+    """
+    return [waypoints[index] for index in optimize_order(waypoints, **options)]
@@ -0,0 +1,9 @@
+from array import array
+from typing import Optional, Sequence
+
+from litchi_wp.geodesy import EARTH_RADIUS as EARTH_RADIUS, coordinates as coordinates, haversine as haversine
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+def distance_matrix(waypoints: Sequence[Waypoint]) -> list[array]: ...
+def optimize_order(waypoints: Sequence[Waypoint], fixed_start: bool = ..., fixed_end: bool = ..., restarts: int = ..., processes: Optional[int] = ..., neighbours: int = ..., seed: Optional[int] = ...) -> list[int]: ...
+def optimize_route(waypoints: Sequence[Waypoint], **options) -> list[Waypoint]: ...
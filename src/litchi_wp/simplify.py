@@ -0,0 +1,287 @@
+"""
+Module for simplifying dense waypoint tracks (Visvalingam-Whyatt and Douglas-Peucker)
+
+The projection, the initial triangle areas and the Douglas-Peucker distances use numpy
+if it is installed and fall back to pure Python otherwise.
+"""
+# pylint: disable=import-error,invalid-name,too-many-locals
+import heapq
+import math
+from typing import Sequence
+
+from litchi_wp.geodesy import EARTH_RADIUS, Coordinates, coordinates
+from litchi_wp.waypoint import Waypoint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_AREA_UNIT = 1e-6
+_INDEX_BITS = 40
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+_KEEP = 1 << 128
+_REMOVED = -1
+
+
+def is_anchor(waypoint: Waypoint, previous: Waypoint | None = None) -> bool:
+    """
+    Checks if a waypoint must be kept by the simplification, because it carries
+    actions, a POI or changes the photo interval
+
+    Args:
+        waypoint (Waypoint): The waypoint to be checked
+        previous (Waypoint | None): The waypoint before, None for the first waypoint
+
+    Returns:
+        True if the waypoint must be kept
+
+    """
+    if waypoint.poi.lat != 0 or waypoint.poi.lon != 0 or waypoint.has_actions():
+        return True
+    if previous is None:
+        return False
+    return (
+        waypoint.photo.time_interval != previous.photo.time_interval
+        or waypoint.photo.distance_interval != previous.photo.distance_interval
+    )
+
+
+def _anchors(waypoints: Sequence[Waypoint]) -> list[bool]:
+    anchors = [is_anchor(waypoint, previous) for previous, waypoint in zip(waypoints, waypoints[1:])]
+    anchors.insert(0, True)
+    anchors[-1] = True
+    return anchors
+
+
+def _project(waypoints: Sequence[Waypoint]) -> Coordinates:
+    """
+    Projects the waypoints to a local plane in meters, with the altitude as z.
+    Returns numpy arrays if numpy is installed, lists otherwise.
+    """
+    lats, lons, alts = coordinates(waypoints)
+    scale_y = math.radians(1) * EARTH_RADIUS
+    scale_x = scale_y * math.cos(math.radians(math.fsum(lats) / len(lats)))
+    if np is not None:
+        return np.asarray(lons) * scale_x, np.asarray(lats) * scale_y, np.asarray(alts, dtype=float)
+    return [lon * scale_x for lon in lons], [lat * scale_y for lat in lats], alts
+
+
+def _triangle_keys(xs, ys, zs) -> list[int]:
+    """
+    Calculates the heap keys of the triangle areas of all inner points with their neighbours
+    """
+    if np is not None:
+        ax, ay, az = xs[:-2] - xs[1:-1], ys[:-2] - ys[1:-1], zs[:-2] - zs[1:-1]
+        bx, by, bz = xs[2:] - xs[1:-1], ys[2:] - ys[1:-1], zs[2:] - zs[1:-1]
+        cross = np.sqrt(
+            (ay * bz - az * by) ** 2 + (az * bx - ax * bz) ** 2 + (ax * by - ay * bx) ** 2
+        )
+        areas = np.floor(cross / (2 * _AREA_UNIT)).tolist()
+    else:
+        areas = []
+        for index in range(1, len(xs) - 1):
+            ax, ay, az = xs[index - 1] - xs[index], ys[index - 1] - ys[index], zs[index - 1] - zs[index]
+            bx, by, bz = xs[index + 1] - xs[index], ys[index + 1] - ys[index], zs[index + 1] - zs[index]
+            cx, cy, cz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+            areas.append(math.sqrt(cx * cx + cy * cy + cz * cz) / (2 * _AREA_UNIT))
+    return [_KEEP] + [int(area) << _INDEX_BITS for area in areas] + [_KEEP]
+
+
+def visvalingam(
+        waypoints: Sequence[Waypoint],
+        tolerance: float = 0.0,
+        max_waypoints: int | None = None
+) -> list[int]:
+    """
+    Simplifies a track with the Visvalingam-Whyatt algorithm in O(n log n).
+    The waypoint whose triangle with its neighbours has the smallest area is removed
+    until the smallest area exceeds the tolerance and the track has at most
+    max_waypoints waypoints. First, last and anchor waypoints (see is_anchor) are kept.
+
+    Args:
+        waypoints (Sequence[Waypoint]): The track in flight order
+        tolerance (float): The area in square meters below which waypoints are removed
+        max_waypoints (int | None): Keep removing until at most this many waypoints are left
+            (or only anchors are left)
+
+    Returns:
+        The indices of the kept waypoints in ascending order
+
+    """
+    count = len(waypoints)
+    if count < 3:
+        return list(range(count))
+    xs, ys, zs = _project(waypoints)
+    # the areas are kept as integers in units of _AREA_UNIT with the index in the low
+    # bits, so the heap compares plain integers instead of (area, index) tuples
+    keys = _triangle_keys(xs, ys, zs)
+    if np is not None:
+        xs, ys, zs = xs.tolist(), ys.tolist(), zs.tolist()
+    for index, anchor in enumerate(_anchors(waypoints)):
+        if anchor:
+            keys[index] = _KEEP
+    heap = [key | index for index, key in enumerate(keys) if key != _KEEP]
+    heapq.heapify(heap)
+    previous = list(range(-1, count - 1))
+    following = list(range(1, count + 1))
+    limit = count if max_waypoints is None else max_waypoints
+    threshold = math.floor(tolerance / _AREA_UNIT) << _INDEX_BITS if tolerance >= 0 else -1
+    left = count
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    heapreplace = heapq.heapreplace
+    sqrt = math.sqrt
+    mask = _INDEX_MASK
+    scale = 1 / (2 * _AREA_UNIT)
+    while heap:
+        entry = heap[0]
+        index = entry & mask
+        key = keys[index]
+        smallest = entry - index
+        if key != smallest:
+            # removed points and entries of decreased areas are dropped, entries of
+            # increased areas are only moved down when they reach the top
+            if key < smallest:
+                heappop(heap)
+            else:
+                heapreplace(heap, key | index)
+            continue
+        if smallest > threshold and left <= limit:
+            break
+        heappop(heap)
+        keys[index] = _REMOVED
+        left -= 1
+        before = previous[index]
+        after = following[index]
+        following[before] = after
+        previous[after] = before
+        for point in (before, after):
+            old = keys[point]
+            if old == _KEEP:
+                continue
+            first = previous[point]
+            last = following[point]
+            x, y, z = xs[point], ys[point], zs[point]
+            ax, ay, az = xs[first] - x, ys[first] - y, zs[first] - z
+            bx, by, bz = xs[last] - x, ys[last] - y, zs[last] - z
+            cx, cy, cz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+            key = int(sqrt(cx * cx + cy * cy + cz * cz) * scale) << _INDEX_BITS
+            # the area of a neighbour never drops below the removed one, so
+            # the removal order stays monotone
+            if key < smallest:
+                key = smallest
+            keys[point] = key
+            if key < old:
+                heappush(heap, key | point)
+    return [index for index in range(count) if keys[index] >= 0]
+
+
+def _farthest(xs, ys, zs, first: int, last: int) -> tuple[float, int]:
+    """
+    Finds the point between first and last with the largest squared distance to their segment
+    """
+    x0, y0, z0 = xs[first], ys[first], zs[first]
+    dx, dy, dz = xs[last] - x0, ys[last] - y0, zs[last] - z0
+    length = dx * dx + dy * dy + dz * dz
+    if np is not None:
+        px, py, pz = xs[first + 1:last] - x0, ys[first + 1:last] - y0, zs[first + 1:last] - z0
+        if length:
+            t = np.clip((px * dx + py * dy + pz * dz) / length, 0.0, 1.0)
+            px, py, pz = px - t * dx, py - t * dy, pz - t * dz
+        distances = px * px + py * py + pz * pz
+        index = int(distances.argmax())
+        return float(distances[index]), first + 1 + index
+    worst = -1.0
+    worst_index = first
+    for index in range(first + 1, last):
+        px, py, pz = xs[index] - x0, ys[index] - y0, zs[index] - z0
+        if length:
+            t = min(max((px * dx + py * dy + pz * dz) / length, 0.0), 1.0)
+            px -= t * dx
+            py -= t * dy
+            pz -= t * dz
+        distance = px * px + py * py + pz * pz
+        if distance > worst:
+            worst = distance
+            worst_index = index
+    return worst, worst_index
+
+
+def douglas_peucker(waypoints: Sequence[Waypoint], tolerance: float) -> list[int]:
+    """
+    Simplifies a track with the Douglas-Peucker algorithm, without recursion.
+    Every span between anchor waypoints (see is_anchor) is simplified separately,
+    a waypoint is kept if it is more than tolerance away from the simplified line.
+    Spans are split at their farthest waypoint, which peels off only one waypoint
+    per split on e.g. spirals and makes the plain algorithm O(n^2). Spans that were
+    split more than twice the bit length of n times in a row are therefore split at
+    their middle waypoint instead, which bounds the worst case to O(n log^2 n) and
+    keeps the tolerance guarantee, at the cost of a few extra waypoints on such tracks.
+    Balanced tracks never reach the depth limit and stay O(n log n).
+
+    Args:
+        waypoints (Sequence[Waypoint]): The track in flight order
+        tolerance (float): The maximum 3D distance in meters of a removed waypoint to the track
+
+    Returns:
+        The indices of the kept waypoints in ascending order
+
+    """
+    count = len(waypoints)
+    if count < 3:
+        return list(range(count))
+    xs, ys, zs = _project(waypoints)
+    keep = _anchors(waypoints)
+    anchor_indices = [index for index, anchor in enumerate(keep) if anchor]
+    stack = [(first, last, 0) for first, last in zip(anchor_indices, anchor_indices[1:])]
+    squared_tolerance = tolerance * tolerance if tolerance >= 0 else -1.0
+    max_depth = 2 * count.bit_length()
+    while stack:
+        first, last, depth = stack.pop()
+        if last - first < 2:
+            continue
+        worst, worst_index = _farthest(xs, ys, zs, first, last)
+        if worst > squared_tolerance:
+            if depth >= max_depth:
+                worst_index = (first + last) // 2
+                depth = -1
+            keep[worst_index] = True
+            stack.append((first, worst_index, depth + 1))
+            stack.append((worst_index, last, depth + 1))
+    return [index for index, kept in enumerate(keep) if kept]
+
+
+def simplify(
+        waypoints: Sequence[Waypoint],
+        tolerance: float = 0.0,
+        max_waypoints: int | None = None,
+        method: str = 'visvalingam'
+) -> list[Waypoint]:
+    """
+    Simplifies a dense track, e.g. an imported GPS track, using latitude, longitude
+    and altitude. Waypoints with actions, a POI or a photo interval change are never removed.
+
+    Args:
+        waypoints (Sequence[Waypoint]): The track in flight order
+        tolerance (float): Square meters for 'visvalingam', meters for 'douglas_peucker'
+        max_waypoints (int | None): Maximum number of waypoints, only for 'visvalingam'
+        method (str): 'visvalingam' (O(n log n)) or 'douglas_peucker' (O(n log n) for
+            typical tracks, O(n log^2 n) in the worst case)
+
+    Returns:
+        The kept waypoints (not copies) in flight order
+
+    Raises:
+        ValueError: If method is unknown or max_waypoints is used with 'douglas_peucker'
+
+    """
+    if method == 'visvalingam':
+        indices = visvalingam(waypoints, tolerance, max_waypoints)
+    elif method == 'douglas_peucker':
+        if max_waypoints is not None:
+            raise ValueError('max_waypoints is only supported by visvalingam')
+        indices = douglas_peucker(waypoints, tolerance)
+    else:
+        raise ValueError(f'unknown method {method}')
+    return [waypoints[index] for index in indices]
@@ -0,0 +1,9 @@
+from typing import Optional, Sequence
+
+from litchi_wp.geodesy import Coordinates as Coordinates, EARTH_RADIUS as EARTH_RADIUS, coordinates as coordinates
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+def is_anchor(waypoint: Waypoint, previous: Optional[Waypoint] = ...) -> bool: ...
+def visvalingam(waypoints: Sequence[Waypoint], tolerance: float = ..., max_waypoints: Optional[int] = ...) -> list[int]: ...
+def douglas_peucker(waypoints: Sequence[Waypoint], tolerance: float) -> list[int]: ...
+def simplify(waypoints: Sequence[Waypoint], tolerance: float = ..., max_waypoints: Optional[int] = ..., method: str = ...) -> list[Waypoint]: ...
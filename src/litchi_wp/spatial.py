@@ -0,0 +1,269 @@
+"""
+Module for a spatial index over waypoints (grid hash) for nearest and bounding box queries
+"""
+# pylint: disable=import-error
+import math
+from typing import Iterable, Iterator
+
+from litchi_wp.geodesy import EARTH_RADIUS, haversine_many
+from litchi_wp.waypoint import Waypoint
+
+
+class SpatialIndex:
+    """
+    Class indexing waypoints in a grid of cells with a fixed size in meters.
+    Queries only look at the cells around the query, so they do not depend on the
+    number of waypoints. The distances of the candidates are calculated in one batch
+    (with numpy if it is installed).
+
+    The index does not notice changed coordinates on its own, move waypoints with
+    move or call update after set_coordinates.
+
+    Attributes:
+        cell_size (float): The edge length of a cell in meters
+        reference_lat (float): The latitude at which the cells are square
+
+    """
+    __slots__ = ('cell_size', 'reference_lat', '_cell_lat', '_cell_lon', '_cells', '_grid')
+
+    def __init__(
+            self,
+            waypoints: Iterable[Waypoint] = (),
+            cell_size: float = 50.0,
+            reference_lat: float | None = None
+    ):
+        """
+        Constructor
+
+        Args:
+            waypoints (Iterable[Waypoint]): The waypoints to be indexed
+            cell_size (float): The edge length of a cell in meters, about the typical query radius
+            reference_lat (float | None): The latitude at which the cells are square,
+                the latitude of the first waypoint if None
+
+        Raises:
+            ValueError: If cell_size is not positive
+
+        """
+        if cell_size <= 0:
+            raise ValueError('cell_size has to be positive')
+        waypoints = list(waypoints)
+        if reference_lat is None:
+            reference_lat = waypoints[0].lat if waypoints else 0.0
+        self.cell_size = float(cell_size)
+        self.reference_lat = float(reference_lat)
+        self._cell_lat = math.degrees(self.cell_size / EARTH_RADIUS)
+        self._cell_lon = self._cell_lat / max(math.cos(math.radians(self.reference_lat)), 1e-6)
+        self._cells: dict[Waypoint, tuple[int, int]] = {}
+        self._grid: dict[tuple[int, int], list[Waypoint]] = {}
+        for waypoint in waypoints:
+            self.insert(waypoint)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __iter__(self) -> Iterator[Waypoint]:
+        return iter(self._cells)
+
+    def __contains__(self, waypoint: Waypoint) -> bool:
+        return waypoint in self._cells
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self._cell_lat), math.floor(lon / self._cell_lon)
+
+    def insert(self, waypoint: Waypoint):
+        """
+        Adds a waypoint to the index, waypoints that are already indexed are updated
+
+        Args:
+            waypoint (Waypoint): The waypoint to be added
+
+        """
+        if waypoint in self._cells:
+            self.update(waypoint)
+            return
+        cell = self._cell(waypoint.lat, waypoint.lon)
+        self._cells[waypoint] = cell
+        self._grid.setdefault(cell, []).append(waypoint)
+
+    def remove(self, waypoint: Waypoint):
+        """
+        Removes a waypoint from the index
+
+        Args:
+            waypoint (Waypoint): The waypoint to be removed
+
+        Raises:
+            ValueError: If the waypoint is not indexed
+
+        """
+        if waypoint not in self._cells:
+            raise ValueError('waypoint is not indexed')
+        cell = self._cells.pop(waypoint)
+        bucket = self._grid[cell]
+        bucket.remove(waypoint)
+        if not bucket:
+            del self._grid[cell]
+
+    def update(self, waypoint: Waypoint):
+        """
+        Moves a waypoint to its new cell after its coordinates were changed
+
+        Args:
+            waypoint (Waypoint): The changed waypoint
+
+        Raises:
+            ValueError: If the waypoint is not indexed
+
+        """
+        if waypoint not in self._cells:
+            raise ValueError('waypoint is not indexed')
+        if self._cells[waypoint] != self._cell(waypoint.lat, waypoint.lon):
+            self.remove(waypoint)
+            self.insert(waypoint)
+
+    def move(self, waypoint: Waypoint, lat: float, lon: float):
+        """
+        Calls set_coordinates of an indexed waypoint and updates the index
+
+        Args:
+            waypoint (Waypoint): The waypoint to be moved
+            lat (float): The new latitude
+            lon (float): The new longitude
+
+        Raises:
+            ValueError: If the waypoint is not indexed or lat or lon cannot be float
+
+        """
+        if waypoint not in self._cells:
+            raise ValueError('waypoint is not indexed')
+        waypoint.set_coordinates(lat, lon)
+        self.update(waypoint)
+
+    def _collect(self, first: tuple[int, int], last: tuple[int, int]) -> list[Waypoint]:
+        """
+        Returns the waypoints of all cells from first to last (inclusive), scanning the
+        occupied cells instead if that is cheaper
+        """
+        rows = last[0] - first[0] + 1
+        columns = last[1] - first[1] + 1
+        if rows <= 0 or columns <= 0:
+            return []
+        grid = self._grid
+        if rows * columns > len(grid):
+            return [
+                waypoint
+                for (row, column), bucket in grid.items()
+                if first[0] <= row <= last[0] and first[1] <= column <= last[1]
+                for waypoint in bucket
+            ]
+        candidates = []
+        for row in range(first[0], last[0] + 1):
+            for column in range(first[1], last[1] + 1):
+                bucket = grid.get((row, column))
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
+
+    def in_bbox(self, south: float, west: float, north: float, east: float) -> list[Waypoint]:
+        """
+        Finds the waypoints inside a bounding box (borders included)
+
+        Args:
+            south (float): The minimum latitude
+            west (float): The minimum longitude
+            north (float): The maximum latitude
+            east (float): The maximum longitude
+
+        Returns:
+            The waypoints inside the box in no particular order
+
+        """
+        return [
+            waypoint
+            for waypoint in self._collect(self._cell(south, west), self._cell(north, east))
+            if south <= waypoint.lat <= north and west <= waypoint.lon <= east
+        ]
+
+    def within(self, lat: float, lon: float, radius: float) -> list[Waypoint]:
+        """
+        Finds the waypoints within a distance of a point
+
+        Args:
+            lat (float): The latitude of the point
+            lon (float): The longitude of the point
+            radius (float): The maximum distance in meters
+
+        Returns:
+            The waypoints within radius, nearest first
+
+        """
+        delta_lat = math.degrees(radius / EARTH_RADIUS)
+        delta_lon = delta_lat / max(math.cos(math.radians(min(abs(lat) + delta_lat, 90.0))), 1e-6)
+        candidates = self._collect(
+            self._cell(lat - delta_lat, lon - delta_lon),
+            self._cell(lat + delta_lat, lon + delta_lon)
+        )
+        return [
+            waypoint
+            for distance, waypoint in self._ranked(lat, lon, candidates)
+            if distance <= radius
+        ]
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> list[Waypoint]:
+        """
+        Finds the k nearest waypoints of a point.
+        The rings of cells around the point are searched until the k-th nearest
+        waypoint is closer than every cell that was not searched yet.
+
+        Args:
+            lat (float): The latitude of the point
+            lon (float): The longitude of the point
+            k (int): The number of waypoints
+
+        Returns:
+            Up to k waypoints, nearest first
+
+        """
+        if k <= 0 or not self._cells:
+            return []
+        row, column = self._cell(lat, lon)
+        # the smallest edge of a cell in meters near the point bounds the distance of unsearched rings
+        edge = self.cell_size * min(
+            1.0, math.cos(math.radians(min(abs(lat), 90.0))) * self._cell_lon / self._cell_lat
+        )
+        candidates: list[Waypoint] = []
+        radius = 0
+        while True:
+            if (2 * radius + 1) ** 2 > len(self._grid):
+                # searching more rings would be slower than ranking all waypoints
+                ranked = self._ranked(lat, lon, list(self._cells))
+                break
+            for cell_row in range(row - radius, row + radius + 1):
+                step = 1 if abs(cell_row - row) == radius else 2 * radius
+                for cell_column in range(column - radius, column + radius + 1, step):
+                    bucket = self._grid.get((cell_row, cell_column))
+                    if bucket:
+                        candidates.extend(bucket)
+            if len(candidates) >= k:
+                ranked = self._ranked(lat, lon, candidates)
+                if ranked[k - 1][0] <= radius * edge:
+                    break
+            radius += 1
+        return [waypoint for _distance, waypoint in ranked[:k]]
+
+    @staticmethod
+    def _ranked(lat: float, lon: float, candidates: list[Waypoint]) -> list[tuple[float, Waypoint]]:
+        """
+        Sorts the candidates by their distance to the point
+        """
+        if not candidates:
+            return []
+        distances = haversine_many(
+            [lat] * len(candidates),
+            [lon] * len(candidates),
+            [waypoint.lat for waypoint in candidates],
+            [waypoint.lon for waypoint in candidates]
+        )
+        ranked = sorted(zip(distances, range(len(candidates))))
+        return [(distance, candidates[index]) for distance, index in ranked]
@@ -0,0 +1,19 @@
+from typing import Iterable, Iterator, Optional
+
+from litchi_wp.geodesy import EARTH_RADIUS as EARTH_RADIUS, haversine_many as haversine_many
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+class SpatialIndex:
+    cell_size: float
+    reference_lat: float
+    def __init__(self, waypoints: Iterable[Waypoint] = ..., cell_size: float = ..., reference_lat: Optional[float] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Waypoint]: ...
+    def __contains__(self, waypoint: Waypoint) -> bool: ...
+    def insert(self, waypoint: Waypoint): ...
+    def remove(self, waypoint: Waypoint): ...
+    def update(self, waypoint: Waypoint): ...
+    def move(self, waypoint: Waypoint, lat: float, lon: float): ...
+    def in_bbox(self, south: float, west: float, north: float, east: float) -> list[Waypoint]: ...
+    def within(self, lat: float, lon: float, radius: float) -> list[Waypoint]: ...
+    def nearest(self, lat: float, lon: float, k: int = ...) -> list[Waypoint]: ...
@@ -0,0 +1,154 @@
+"""
+Module for splitting long litchi missions into parts that fit a flight budget
+"""
+# pylint: disable=import-error,too-many-arguments,too-many-locals
+import copy
+import os
+from typing import Iterable, Iterator
+
+from litchi_wp.action import NO_ACTION
+from litchi_wp.enums import ActionType
+from litchi_wp.flight import AircraftProfile
+from litchi_wp.waypoint import Waypoint
+
+
+def resume_waypoint(waypoint: Waypoint, recording: bool = False) -> Waypoint:
+    """
+    Creates the entry waypoint of a part from the exit waypoint of the part before.
+    Position, altitude, heading, speed, gimbal, POI and photo interval are copied,
+    the actions are not, because they were already executed at the exit waypoint.
+
+    Args:
+        waypoint (Waypoint): The exit waypoint of the previous part
+        recording (bool): Start recording at the entry waypoint, because a recording
+            was running at the exit waypoint
+
+    Returns:
+        The entry waypoint as a new instance
+
+    """
+    entry = copy.deepcopy(waypoint)
+    entry.actions = [NO_ACTION] * 15
+    entry.next_action_index = 0
+    if recording:
+        entry.set_action(ActionType.START_RECORDING)
+    return entry
+
+
+def split_mission(
+        waypoints: Iterable[Waypoint],
+        max_time: float | None = None,
+        max_distance: float | None = None,
+        max_energy: float | None = None,
+        max_waypoints: int | None = None,
+        profile: AircraftProfile | None = None
+) -> Iterator[list[Waypoint]]:
+    """
+    Splits a mission into parts that each stay within the given budgets.
+    The waypoints are consumed in a single pass, so generators (e.g. Waypoint.iter_file)
+    of any length can be split in linear time while only one part is held in memory.
+
+    Every part but the first starts with an entry waypoint created by resume_waypoint
+    from the exit waypoint of the part before, so the parts connect seamlessly and
+    keep the gimbal, POI, photo interval and recording state of the cut point.
+    The costs are estimated as in FlightEstimator.
+
+    Args:
+        waypoints (Iterable[Waypoint]): The waypoints in flight order, may be a generator
+        max_time (float | None): Maximum flight time of a part in seconds
+        max_distance (float | None): Maximum flight distance of a part in meters
+        max_energy (float | None): Maximum energy of a part in watt hours,
+            e.g. profile.usable_energy
+        max_waypoints (int | None): Maximum number of waypoints of a part (litchi allows 99)
+        profile (AircraftProfile | None): The aircraft, AircraftProfile() if None
+
+    Yields:
+        The parts as lists of waypoints
+
+    Raises:
+        ValueError: If no budget is given or a single leg exceeds a budget
+
+    """
+    if max_time is None and max_distance is None and max_energy is None and max_waypoints is None:
+        raise ValueError('at least one budget has to be given')
+    if max_waypoints is not None and max_waypoints < 2:
+        raise ValueError('max_waypoints has to be at least 2')
+    profile = profile or AircraftProfile()
+    inf = float('inf')
+    limit_time = inf if max_time is None else max_time
+    limit_distance = inf if max_distance is None else max_distance
+    limit_energy = inf if max_energy is None else max_energy * 3600
+    limit_waypoints = max_waypoints or inf
+
+    part: list[Waypoint] = []
+    distance = time = energy = 0.0
+    recording = False
+    for waypoint in waypoints:
+        while True:
+            step_time, step_energy = profile.action_cost(waypoint)
+            step_distance = 0.0
+            if part:
+                leg = profile.leg_cost(part[-1], waypoint)
+                step_distance += leg[0]
+                step_time += leg[1]
+                step_energy += leg[2]
+                if len(part) > 1:
+                    turn = profile.turn_cost(part[-2], part[-1], waypoint)
+                    step_distance += turn[0]
+                    step_time += turn[1]
+                    step_energy += turn[2]
+            if (
+                    distance + step_distance <= limit_distance
+                    and time + step_time <= limit_time
+                    and energy + step_energy <= limit_energy
+                    and len(part) < limit_waypoints
+            ):
+                break
+            if len(part) < 2:
+                raise ValueError('a single leg exceeds the budget')
+            yield part
+            part = [resume_waypoint(part[-1], recording)]
+            distance = time = energy = 0.0
+        part.append(waypoint)
+        distance += step_distance
+        time += step_time
+        energy += step_energy
+        for action in waypoint.used_actions():
+            if action.type is ActionType.START_RECORDING:
+                recording = True
+            elif action.type is ActionType.STOP_RECORDING:
+                recording = False
+    if part:
+        yield part
+
+
+def split_to_files(
+        waypoints: Iterable[Waypoint],
+        filename: str | os.PathLike,
+        line_break: str = '\n',
+        **budget
+) -> list[str]:
+    """
+    Splits a mission with split_mission and writes every part to its own csv file.
+    The parts are written as soon as they are complete.
+
+    Args:
+        waypoints (Iterable[Waypoint]): The waypoints in flight order, may be a generator
+        filename (str | os.PathLike): Template for the filenames, formatted with the
+            part number starting at 1, e.g. 'survey_{:03d}.csv'
+        line_break (str): Linebreak character
+        **budget: The budgets and profile passed to split_mission
+
+    Returns:
+        The names of the written files
+
+    Raises:
+        ValueError: If no budget is given or a single leg exceeds a budget
+
+    """
+    filenames = []
+    for number, part in enumerate(split_mission(waypoints, **budget), start=1):
+        name = os.fspath(filename).format(number)
+        Waypoint.dump_many(part, name, line_break=line_break)
+        filenames.append(name)
+    return filenames
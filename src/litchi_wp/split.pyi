@@ -0,0 +1,11 @@
+import os
+from typing import Iterable, Iterator, Optional, Union
+
+from litchi_wp.action import NO_ACTION as NO_ACTION
+from litchi_wp.enums import ActionType as ActionType
+from litchi_wp.flight import AircraftProfile as AircraftProfile
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+def resume_waypoint(waypoint: Waypoint, recording: bool = ...) -> Waypoint: ...
+def split_mission(waypoints: Iterable[Waypoint], max_time: Optional[float] = ..., max_distance: Optional[float] = ..., max_energy: Optional[float] = ..., max_waypoints: Optional[int] = ..., profile: Optional[AircraftProfile] = ...) -> Iterator[list[Waypoint]]: ...
+def split_to_files(waypoints: Iterable[Waypoint], filename: Union[str, os.PathLike], line_break: str = ..., **budget) -> list[str]: ...
@@ -0,0 +1,159 @@
+"""
+Module for generating lawnmower (boustrophedon) survey missions over a polygon
+"""
+# pylint: disable=import-error,too-many-arguments,too-many-locals
+import math
+from typing import Iterator, Sequence
+
+from litchi_wp.enums import GimbalMode
+from litchi_wp.geodesy import EARTH_RADIUS
+from litchi_wp.waypoint import Waypoint
+
+
+def camera_footprint(
+        altitude: float,
+        sensor_width: float,
+        sensor_height: float,
+        focal_length: float
+) -> tuple[float, float]:
+    """
+    Calculates the ground footprint of a nadir camera
+
+    Args:
+        altitude (float): The height above ground in meters
+        sensor_width (float): The sensor width in millimeters (across the flight line)
+        sensor_height (float): The sensor height in millimeters (along the flight line)
+        focal_length (float): The focal length in millimeters
+
+    Returns:
+        The width and height of the footprint in meters
+
+    Raises:
+        ValueError: If focal_length is not positive
+
+    """
+    if focal_length <= 0:
+        raise ValueError('focal_length has to be positive')
+    return altitude * sensor_width / focal_length, altitude * sensor_height / focal_length
+
+
+def _scanlines(
+        points: list[tuple[float, float]],
+        spacing: float
+) -> Iterator[tuple[float, list[tuple[float, float]]]]:
+    """
+    Sweeps horizontal lines with the given spacing over a polygon.
+    The edges are sorted once by their lower end, every line only intersects the
+    edges that are active at its height, so concave polygons cost O(n log n + k).
+
+    Yields:
+        The height and the inside segments (x_start, x_end) of every line from bottom to top
+    """
+    edges = []
+    for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+        if y1 == y2:
+            continue
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        edges.append((y1, y2, x1, (x2 - x1) / (y2 - y1)))
+    if not edges:
+        return
+    edges.sort()
+    top = max(edge[1] for edge in edges)
+    active: list[tuple[float, float, float, float]] = []
+    next_edge = 0
+    y = edges[0][0] + spacing / 2
+    while y < top:
+        while next_edge < len(edges) and edges[next_edge][0] <= y:
+            active.append(edges[next_edge])
+            next_edge += 1
+        active = [edge for edge in active if edge[1] > y]
+        crossings = sorted(x + (y - y1) * slope for y1, _y2, x, slope in active)
+        yield y, [
+            (crossings[i], crossings[i + 1])
+            for i in range(0, len(crossings) - 1, 2)
+            if crossings[i + 1] > crossings[i]
+        ]
+        y += spacing
+
+
+def survey(
+        polygon: Sequence[tuple[float, float]],
+        altitude: float,
+        footprint: tuple[float, float],
+        front_overlap: float = 0.8,
+        side_overlap: float = 0.7,
+        direction: float = 90.0,
+        speed: float = 0.0
+) -> Iterator[Waypoint]:
+    """
+    Lazily generates a lawnmower survey over a polygon.
+    The lines are generated one by one while the waypoints are consumed, so the
+    full grid is never built in memory.
+
+    Every line crossing the polygon produces a waypoint where it enters and one
+    where it leaves the polygon. The camera points straight down and takes photos
+    by distance between entry and exit, not on the turns and not over the gaps of
+    concave polygons.
+
+    Args:
+        polygon (Sequence[tuple[float, float]]): The corners as (lat, lon), the ring may be closed
+        altitude (float): The altitude of all waypoints in meters
+        footprint (tuple[float, float]): The ground footprint (width, height) of one photo
+            in meters, e.g. from camera_footprint
+        front_overlap (float): The overlap of consecutive photos (0 ... 1)
+        side_overlap (float): The overlap of neighbouring lines (0 ... 1)
+        direction (float): The bearing of the lines in degrees (90 = east-west lines)
+        speed (float): The speed in meters per second, 0 for the mission default
+
+    Yields:
+        The waypoints in flight order
+
+    Raises:
+        ValueError: If the polygon has less than 3 corners or an overlap is not in [0, 1)
+
+    """
+    if len(polygon) > 1 and tuple(polygon[0]) == tuple(polygon[-1]):
+        polygon = polygon[:-1]
+    if len(polygon) < 3:
+        raise ValueError('the polygon needs at least 3 corners')
+    if not (0 <= front_overlap < 1 and 0 <= side_overlap < 1):
+        raise ValueError('overlaps have to be in [0, 1)')
+    spacing = footprint[0] * (1 - side_overlap)
+    interval = footprint[1] * (1 - front_overlap)
+    if spacing <= 0 or interval <= 0:
+        raise ValueError('footprint has to be positive')
+
+    lat0 = sum(float(lat) for lat, _lon in polygon) / len(polygon)
+    lon0 = sum(float(lon) for _lat, lon in polygon) / len(polygon)
+    scale_y = math.radians(1) * EARTH_RADIUS
+    scale_x = scale_y * math.cos(math.radians(lat0))
+    sin_d = math.sin(math.radians(direction))
+    cos_d = math.cos(math.radians(direction))
+    points = []
+    for lat, lon in polygon:
+        x = (float(lon) - lon0) * scale_x
+        y = (float(lat) - lat0) * scale_y
+        points.append((x * sin_d + y * cos_d, y * sin_d - x * cos_d))
+
+    forward = True
+    for y, segments in _scanlines(points, spacing):
+        if not segments:
+            continue
+        heading = direction % 360 if forward else (direction + 180) % 360
+        if not forward:
+            segments = [(x2, x1) for x1, x2 in reversed(segments)]
+        for x1, x2 in segments:
+            for x, photos in ((x1, True), (x2, False)):
+                waypoint = Waypoint(
+                    lat0 + (x * cos_d + y * sin_d) / scale_y,
+                    lon0 + (x * sin_d - y * cos_d) / scale_x,
+                    altitude,
+                    head=heading,
+                    speed=speed
+                )
+                waypoint.set_gimbal(GimbalMode.INTERPOLATE, -90)
+                if photos:
+                    waypoint.set_photo_interval_distance(interval)
+                yield waypoint
+        forward = not forward
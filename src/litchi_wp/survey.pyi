@@ -0,0 +1,8 @@
+from typing import Iterator, Sequence
+
+from litchi_wp.enums import GimbalMode as GimbalMode
+from litchi_wp.geodesy import EARTH_RADIUS as EARTH_RADIUS
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+def camera_footprint(altitude: float, sensor_width: float, sensor_height: float, focal_length: float) -> tuple[float, float]: ...
+def survey(polygon: Sequence[tuple[float, float]], altitude: float, footprint: tuple[float, float], front_overlap: float = ..., side_overlap: float = ..., direction: float = ..., speed: float = ...) -> Iterator[Waypoint]: ...
@@ -0,0 +1,470 @@
+"""
+Module for holding large amounts of litchi waypoints in typed column arrays
+"""
+# pylint: disable=import-error
+import os
+from array import array
+from itertools import compress, islice, repeat
+from typing import Callable, Iterable, Iterator, Sequence, TextIO
+
+from litchi_wp.columns import (
+    ACTION_COLUMNS, ACTION_PARAM_RANGES, COLUMN_NAMES, CONDITIONAL_RANGES, CURVESIZE, ENUM_COLUMNS,
+    ENUM_RANGES, FIELD_PATTERNS, HEADER
+)
+from litchi_wp.enums import ActionType, NumberFormat
+from litchi_wp.files import open_text
+from litchi_wp.formatting import row_formatter
+from litchi_wp.waypoint import Waypoint
+
+FLOAT_ACTION_TYPES: frozenset[int] = frozenset([
+    ActionType.ROTATE_AIRCRAFT.value,
+    ActionType.TILT_CAMERA.value
+])
+"""Action types whose parameter is a float, all other parameters are ints"""
+
+_PARAM_ACTION_TYPES = frozenset(ACTION_PARAM_RANGES)
+
+CHUNK_SIZE = 65536
+"""Number of lines that WaypointTable.from_file parses at once"""
+
+
+def typed_row(values: list[int | float]) -> tuple[int | float, ...]:
+    """
+    Converts stored column values to a row like Waypoint.to_row returns it,
+    the parameters of actions without float parameter become ints
+
+    Args:
+        values (list[int | float]): The 46 stored values, changed in place
+
+    Returns:
+        The row
+
+    """
+    for type_index, param_index in ACTION_COLUMNS:
+        if values[type_index] not in FLOAT_ACTION_TYPES:
+            values[param_index] = int(values[param_index])
+    return tuple(values)
+
+
+def _new_column(index: int, values: Iterable[int | float] = ()) -> array:
+    return array('b' if index in ENUM_COLUMNS else 'd', values)
+
+
+class WaypointTable:
+    """
+    Class holding litchi waypoints column wise in typed arrays
+
+    Every column uses a single array.array ('d' for numbers, 'b' for enums) instead of
+    about 20 Python objects per Waypoint. Waypoint objects are only created on demand.
+
+    Attributes:
+        columns (list[array]): The 46 column arrays in the order of the header
+
+    """
+
+    def __init__(self, rows: Iterable[Sequence[int | float]] = ()):
+        """
+        Constructor
+
+        Args:
+            rows (Iterable[Sequence[int | float]]): Rows as returned by Waypoint.to_row
+
+        Raises:
+            ValueError: If a row does not have 46 values
+
+        """
+        self.columns: list[array] = [_new_column(i) for i in range(len(COLUMN_NAMES))]
+        for row in rows:
+            self.append_row(row)
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def __iter__(self) -> Iterator[Waypoint]:
+        for index in range(len(self)):
+            yield self.get_waypoint(index)
+
+    def __getitem__(self, index: int | slice) -> 'Waypoint | WaypointTable':
+        if isinstance(index, slice):
+            table = WaypointTable()
+            table.columns = [column[index] for column in self.columns]
+            return table
+        return self.get_waypoint(index)
+
+    def __setitem__(self, index: int, waypoint: Waypoint):
+        for column, value in zip(self.columns, waypoint.to_row()):
+            column[index] = value
+
+    def __delitem__(self, index: int | slice):
+        for column in self.columns:
+            del column[index]
+
+    def column(self, name: str) -> array:
+        """
+        Getter for a column array
+
+        Args:
+            name (str): The column name as in the header (e.g. 'latitude' or 'altitude(m)')
+
+        Returns:
+            The array of the column (not a copy)
+
+        Raises:
+            ValueError: If name is no valid column name
+
+        """
+        return self.columns[COLUMN_NAMES.index(name)]
+
+    def append_row(self, row: Sequence[int | float]):
+        """
+        Appends a row of 46 values
+
+        Args:
+            row (Sequence[int | float]): The column values as returned by Waypoint.to_row
+
+        Raises:
+            ValueError: If the row does not have 46 values
+
+        """
+        if len(row) != len(COLUMN_NAMES):
+            raise ValueError(f"expected {len(COLUMN_NAMES)} values, got {len(row)}")
+        for column, value in zip(self.columns, row):
+            column.append(value)
+
+    def append(self, waypoint: Waypoint):
+        """
+        Appends a Waypoint
+
+        Args:
+            waypoint (Waypoint): The Waypoint to be stored
+
+        """
+        self.append_row(waypoint.to_row())
+
+    def extend(self, waypoints: Iterable[Waypoint]):
+        """
+        Appends multiple Waypoints
+
+        Args:
+            waypoints (Iterable[Waypoint]): The Waypoints to be stored
+
+        """
+        for waypoint in waypoints:
+            self.append_row(waypoint.to_row())
+
+    def extend_from_text(
+            self,
+            text: str,
+            on_error: Callable[[int, str, ValueError], None] | None = None,
+            first_line_number: int = 1
+    ) -> int:
+        """
+        Parses csv lines with the bulk parser (see parse_csv_bulk) and appends the valid ones,
+        e.g. the chunks of a file that is read piece by piece
+
+        Args:
+            text (str): Complete csv lines, the header is only skipped on line 1
+            on_error (Callable[[int, str, ValueError], None] | None): Called with the
+                line number, the line and the error for every line that could not be parsed
+            first_line_number (int): The line number of the first line of text in its file
+
+        Returns:
+            The number of appended waypoints
+
+        """
+        count = len(self)
+        _parse_text(text, self, on_error, first_line_number)
+        return len(self) - count
+
+    def get_row(self, index: int) -> tuple[int | float, ...]:
+        """
+        Getter for a row
+
+        Args:
+            index (int): The index of the waypoint
+
+        Returns:
+            The row values like Waypoint.to_row of the parsed waypoint would return them
+
+        Raises:
+            IndexError: If index is out of range
+
+        """
+        return typed_row([column[index] for column in self.columns])
+
+    def get_waypoint(self, index: int) -> Waypoint:
+        """
+        Creates a Waypoint from a stored row.
+        The Waypoint is a copy, write changes back with table[index] = waypoint.
+
+        Args:
+            index (int): The index of the waypoint
+
+        Returns:
+            The Waypoint as an instance
+
+        Raises:
+            IndexError: If index is out of range
+
+        """
+        return Waypoint.from_row(self.get_row(index))
+
+    def to_waypoints(self) -> list[Waypoint]:
+        """
+        Creates Waypoints from all stored rows
+
+        Returns:
+            The list of Waypoints
+
+        """
+        return list(self)
+
+    def to_line(
+            self,
+            index: int,
+            line_break: str | bool | None = '\n',
+            number_format: NumberFormat | None = None
+    ) -> str:
+        """
+        Transforms a stored row to a line in litchi csv format
+
+        Args:
+            index (int): The index of the waypoint
+            line_break (str | bool | None): Linebreak character, disable with None or False
+            number_format (NumberFormat | None): The number format, the global one
+                (see formatting.set_number_format) if None
+
+        Returns:
+            The serialized waypoint in litchi csv format
+
+        """
+        line = row_formatter(number_format)(self.get_row(index))
+        if line_break:
+            if line_break is not True:
+                line += line_break
+        return line
+
+    def to_file(
+            self,
+            file: str | os.PathLike | TextIO,
+            chunk_size: int = 4096,
+            number_format: NumberFormat | None = None
+    ):
+        """
+        Writes the header and all rows in litchi csv format, see Waypoint.dump_many
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename or an opened text stream
+            chunk_size (int): Number of lines per write call
+            number_format (NumberFormat | None): The number format, the global one
+                (see formatting.set_number_format) if None
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open_text(file, 'w') as stream:
+                self.to_file(stream, chunk_size, number_format)
+            return
+        file.write(Waypoint.get_header())
+        format_row = row_formatter(number_format)
+        for start in range(0, len(self), chunk_size):
+            file.write(''.join(
+                format_row(self.get_row(index)) + '\n'
+                for index in range(start, min(start + chunk_size, len(self)))
+            ))
+
+    @staticmethod
+    def from_waypoints(waypoints: Iterable[Waypoint]) -> 'WaypointTable':
+        """
+        Creates a table from Waypoints
+
+        Args:
+            waypoints (Iterable[Waypoint]): The Waypoints to be stored
+
+        Returns:
+            The table as an instance
+
+        """
+        table = WaypointTable()
+        table.extend(waypoints)
+        return table
+
+    @staticmethod
+    def from_file(
+            file: str | os.PathLike | TextIO,
+            on_error: Callable[[int, str, ValueError], None] | None = None
+    ) -> 'WaypointTable':
+        """
+        Creates a table from a litchi waypoint csv file, see Waypoint.iter_file.
+        The file is read and parsed in chunks of CHUNK_SIZE lines with parse_csv_bulk.
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename or an opened text stream
+            on_error (Callable[[int, str, ValueError], None] | None): Called with the
+                line number, the line and the error for every line that could not be parsed
+
+        Returns:
+            The table as an instance
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open_text(file) as stream:
+                return WaypointTable.from_file(stream, on_error)
+        table = WaypointTable()
+        first_line_number = 1
+        while chunk := list(islice(file, CHUNK_SIZE)):
+            table.extend_from_text(''.join(chunk), on_error, first_line_number)
+            first_line_number += len(chunk)
+        return table
+
+def _action_params(types: list[int], params: list[float], invalid: dict[int, str]) -> list[float]:
+    """
+    Normalizes action parameters like Waypoint.replace_action and records out of range rows
+    """
+    if set(types).isdisjoint(_PARAM_ACTION_TYPES):
+        return [0.0] * len(params)
+    params = list(params)
+    stay_for = ActionType.STAY_FOR.value
+    for i, (action_type, param) in enumerate(zip(types, params)):
+        if action_type not in _PARAM_ACTION_TYPES:
+            params[i] = 0.0
+            continue
+        if action_type == stay_for:
+            param = int(param)
+            params[i] = float(param)
+        minimum, maximum = ACTION_PARAM_RANGES[action_type]
+        if param < minimum or param > maximum:
+            invalid.setdefault(i, f'allowed range is {minimum:g} to {maximum:g}')
+    return params
+
+
+def _parse_columns(columns: list, invalid: dict[int, str]) -> list[list[int | float]]:
+    """
+    Validates and converts the string columns column by column.
+
+    Returns:
+        The converted columns, rows that are in invalid afterwards are not valid
+    """
+    end = len(columns) - 1
+    last = FIELD_PATTERNS[end]
+    if not all(map(last.fullmatch, set(columns[end]))):
+        columns[end] = [
+            match.group() if match else value
+            for value, match in zip(columns[end], map(last.match, columns[end]))
+        ]
+    for j, column in enumerate(columns):
+        if j in ENUM_RANGES:
+            lookup = {}
+            for value in set(column):
+                if FIELD_PATTERNS[j].fullmatch(value):
+                    try:
+                        if int(float(value)) in ENUM_RANGES[j]:
+                            lookup[value] = int(float(value))
+                    except ValueError:
+                        pass
+            if len(lookup) < len(set(column)):
+                for i, value in enumerate(column):
+                    if value not in lookup:
+                        invalid.setdefault(i, f"invalid value {value!r} in column {COLUMN_NAMES[j]}")
+                columns[j] = [lookup.get(value, 0) for value in column]
+            else:
+                columns[j] = list(map(lookup.__getitem__, column))
+        else:
+            if not all(map(FIELD_PATTERNS[j].fullmatch, set(column))):
+                fullmatch = FIELD_PATTERNS[j].fullmatch
+                for i, value in enumerate(column):
+                    if not fullmatch(value):
+                        invalid.setdefault(i, f"invalid value {value!r} in column {COLUMN_NAMES[j]}")
+                column = [value if fullmatch(value) else '0' for value in column]
+            columns[j] = list(map(float, column))
+    columns[CURVESIZE] = list(map(abs, columns[CURVESIZE]))
+    for j, (condition, value, minimum, maximum) in CONDITIONAL_RANGES.items():
+        if set(columns[condition]) != {value}:
+            columns[j] = [
+                number if mode == value else 0.0
+                for mode, number in zip(columns[condition], columns[j])
+            ]
+        if not minimum <= min(columns[j]) or not max(columns[j]) <= maximum:
+            for i, number in enumerate(columns[j]):
+                if number < minimum or number > maximum:
+                    invalid.setdefault(i, f'allowed range is {minimum:g} to {maximum:g}')
+    for type_index, param_index in ACTION_COLUMNS:
+        columns[param_index] = _action_params(columns[type_index], columns[param_index], invalid)
+    return columns
+
+
+def _parse_text(
+        text: str,
+        table: WaypointTable,
+        on_error: Callable[[int, str, ValueError], None] | None,
+        first_line_number: int = 1
+):
+    """
+    Parses lines and appends the valid ones to the table, see parse_csv_bulk
+    """
+    header = HEADER
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    if first_line_number == 1 and text.startswith(header) and text[len(header):len(header) + 1] in ('', '\n'):
+        text = text[len(header) + 1:]
+        first_line_number = 2
+    if text.endswith('\n'):
+        text = text[:-1]
+    if not text:
+        return
+    errors = []
+    lines = text.split('\n')
+    separators = list(map(str.count, lines, repeat(',')))
+    if separators.count(len(COLUMN_NAMES) - 1) == len(lines):
+        fields = text.replace('\n', ',').split(',')
+        columns: list = [fields[j::len(COLUMN_NAMES)] for j in range(len(COLUMN_NAMES))]
+        line_numbers = range(first_line_number, first_line_number + len(columns[0]))
+    else:
+        rows = []
+        line_numbers = []
+        for line_number, line in enumerate(lines, start=first_line_number):
+            line = line.rstrip('\r')
+            fields = line.split(',')
+            if len(fields) >= len(COLUMN_NAMES):
+                rows.append(fields[:len(COLUMN_NAMES)] if len(fields) > len(COLUMN_NAMES) else fields)
+                line_numbers.append(line_number)
+            elif line:
+                errors.append((line_number, line, f"expected {len(COLUMN_NAMES)} columns, got {len(fields)}"))
+        columns = list(zip(*rows))
+    invalid: dict[int, str] = {}
+    if columns:
+        columns = _parse_columns(columns, invalid)
+        if invalid:
+            valid = [i not in invalid for i in range(len(columns[0]))]
+            columns = [list(compress(column, valid)) for column in columns]
+            for i, message in invalid.items():
+                line_number = line_numbers[i]
+                errors.append((line_number, lines[line_number - first_line_number].rstrip('\r'), message))
+        for target, column in zip(table.columns, columns):
+            target.extend(array(target.typecode, column))
+    if on_error is not None:
+        for line_number, line, message in sorted(errors):
+            on_error(line_number, line, ValueError(message))
+
+
+def parse_csv_bulk(
+        text: str,
+        on_error: Callable[[int, str, ValueError], None] | None = None
+) -> WaypointTable:
+    """
+    Parses the content of a litchi waypoint csv file at once.
+    The text is split into columns which are validated and converted column by column,
+    without creating Waypoint objects. Accepts exactly the lines Waypoint.from_line accepts.
+
+    Args:
+        text (str): The content of the csv file
+        on_error (Callable[[int, str, ValueError], None] | None): Called with the
+            line number (starting at 1), the line and the error for every line that
+            could not be parsed. The header line and empty lines are skipped silently.
+
+    Returns:
+        The parsed waypoints as WaypointTable
+
+    """
+    table = WaypointTable()
+    table.extend_from_text(text, on_error)
+    return table
@@ -0,0 +1,39 @@
+import os
+from array import array
+from typing import Callable, Iterable, Iterator, Sequence, TextIO, Union
+
+from litchi_wp.columns import ACTION_COLUMNS as ACTION_COLUMNS, ACTION_PARAM_RANGES as ACTION_PARAM_RANGES, COLUMN_NAMES as COLUMN_NAMES, CONDITIONAL_RANGES as CONDITIONAL_RANGES, CURVESIZE as CURVESIZE, ENUM_COLUMNS as ENUM_COLUMNS, ENUM_RANGES as ENUM_RANGES, FIELD_PATTERNS as FIELD_PATTERNS, HEADER as HEADER
+from litchi_wp.enums import ActionType as ActionType, NumberFormat as NumberFormat
+from litchi_wp.files import open_text as open_text
+from litchi_wp.formatting import row_formatter as row_formatter
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+FLOAT_ACTION_TYPES: frozenset[int]
+CHUNK_SIZE: int
+
+def typed_row(values: list[Union[int, float]]) -> tuple[Union[int, float], ...]: ...
+
+class WaypointTable:
+    columns: list[array]
+    def __init__(self, rows: Iterable[Sequence[Union[int, float]]] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Waypoint]: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[Waypoint, WaypointTable]: ...
+    def __setitem__(self, index: int, waypoint: Waypoint): ...
+    def __delitem__(self, index: Union[int, slice]): ...
+    def column(self, name: str) -> array: ...
+    def append_row(self, row: Sequence[Union[int, float]]): ...
+    def append(self, waypoint: Waypoint): ...
+    def extend(self, waypoints: Iterable[Waypoint]): ...
+    def extend_from_text(self, text: str, on_error: Union[Callable[[int, str, ValueError], None], None] = ..., first_line_number: int = ...) -> int: ...
+    def get_row(self, index: int) -> tuple[Union[int, float], ...]: ...
+    def get_waypoint(self, index: int) -> Waypoint: ...
+    def to_waypoints(self) -> list[Waypoint]: ...
+    def to_line(self, index: int, line_break: Union[str, bool, None] = '\n', number_format: Union[NumberFormat, None] = ...) -> str: ...
+    def to_file(self, file: Union[str, os.PathLike, TextIO], chunk_size: int = ..., number_format: Union[NumberFormat, None] = ...): ...
+    @staticmethod
+    def from_waypoints(waypoints: Iterable[Waypoint]) -> WaypointTable: ...
+    @staticmethod
+    def from_file(file: Union[str, os.PathLike, TextIO], on_error: Union[Callable[[int, str, ValueError], None], None] = ...) -> WaypointTable: ...
+
+def parse_csv_bulk(text: str, on_error: Union[Callable[[int, str, ValueError], None], None] = ...) -> WaypointTable: ...
@@ -0,0 +1,320 @@
+"""
+Module for terrain heights from SRTM tiles and conversion between AGL and MSL altitudes
+
+The tiles are raw grids of big endian 16 bit heights in meters, rows from north to south,
+as in the SRTM .hgt files (e.g. N50E008.hgt covering 50..51 N, 8..9 E). They are memory
+mapped, so only the sampled pages are read. The sampling uses numpy if it is installed
+and falls back to pure Python otherwise.
+"""
+# pylint: disable=import-error,invalid-name,too-many-locals
+import math
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from typing import Iterable, Sequence
+
+from litchi_wp.enums import AltitudeMode
+from litchi_wp.waypoint import Waypoint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+VOID = -32768
+
+
+def tile_name(lat: float, lon: float) -> str:
+    """
+    Getter for the SRTM filename of the tile containing a point
+
+    Args:
+        lat (float): The latitude
+        lon (float): The longitude
+
+    Returns:
+        The filename, e.g. 'N50E008.hgt'
+
+    """
+    south = math.floor(lat)
+    west = math.floor(lon)
+    return f"{'N' if south >= 0 else 'S'}{abs(south):02d}{'E' if west >= 0 else 'W'}{abs(west):03d}.hgt"
+
+
+class Tile:
+    """
+    Class representing one memory mapped terrain tile of 1 x 1 degree
+
+    Attributes:
+        south (int): The latitude of the southern border
+        west (int): The longitude of the western border
+        size (int): The number of samples per row and column (1201 or 3601 for SRTM)
+
+    """
+    __slots__ = ('south', 'west', 'size', '_file', '_map', '_grid')
+
+    def __init__(self, filename: str | os.PathLike, south: int, west: int):
+        """
+        Constructor, opens and maps the file
+
+        Args:
+            filename (str | os.PathLike): The path + filename of the tile
+            south (int): The latitude of the southern border
+            west (int): The longitude of the western border
+
+        Raises:
+            ValueError: If the file is no square grid of 16 bit values
+
+        """
+        self.south = south
+        self.west = west
+        self._file = open(filename, 'rb')  # pylint: disable=consider-using-with
+        try:
+            length = os.fstat(self._file.fileno()).st_size
+            self.size = math.isqrt(length // 2)
+            if self.size < 2 or self.size * self.size * 2 != length:
+                raise ValueError(f'{filename} is no square grid of 16 bit heights')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+        self._grid = (
+            np.frombuffer(self._map, dtype='>i2').reshape(self.size, self.size) if np is not None else None
+        )
+
+    def close(self):
+        """
+        Unmaps and closes the file
+        """
+        self._grid = None
+        self._map.close()
+        self._file.close()
+
+    def sample(self, lats: Sequence[float], lons: Sequence[float]) -> list[float]:
+        """
+        Samples the heights of points inside the tile with bilinear interpolation
+
+        Args:
+            lats (Sequence[float]): The latitudes
+            lons (Sequence[float]): The longitudes
+
+        Returns:
+            The heights in meters, nan where a corner is void
+
+        """
+        last = self.size - 1
+        if self._grid is not None:
+            rows = np.clip((self.south + 1 - np.asarray(lats, dtype=float)) * last, 0, last)
+            columns = np.clip((np.asarray(lons, dtype=float) - self.west) * last, 0, last)
+            row = np.minimum(rows.astype(int), last - 1)
+            column = np.minimum(columns.astype(int), last - 1)
+            dy = rows - row
+            dx = columns - column
+            grid = self._grid
+            corners = [
+                grid[row, column], grid[row, column + 1], grid[row + 1, column], grid[row + 1, column + 1]
+            ]
+            void = np.zeros(len(row), dtype=bool)
+            for corner in corners:
+                void |= corner == VOID
+            top_left, top_right, bottom_left, bottom_right = (corner.astype(float) for corner in corners)
+            heights = (
+                (top_left * (1 - dx) + top_right * dx) * (1 - dy)
+                + (bottom_left * (1 - dx) + bottom_right * dx) * dy
+            )
+            heights[void] = math.nan
+            return heights.tolist()
+        heights = []
+        unpack = struct.Struct('>hh').unpack_from
+        for lat, lon in zip(lats, lons):
+            y = min(max((self.south + 1 - lat) * last, 0), last)
+            x = min(max((lon - self.west) * last, 0), last)
+            row = min(int(y), last - 1)
+            column = min(int(x), last - 1)
+            dy = y - row
+            dx = x - column
+            top_left, top_right = unpack(self._map, (row * self.size + column) * 2)
+            bottom_left, bottom_right = unpack(self._map, ((row + 1) * self.size + column) * 2)
+            if VOID in (top_left, top_right, bottom_left, bottom_right):
+                heights.append(math.nan)
+                continue
+            heights.append(
+                (top_left * (1 - dx) + top_right * dx) * (1 - dy)
+                + (bottom_left * (1 - dx) + bottom_right * dx) * dy
+            )
+        return heights
+
+
+class Terrain:
+    """
+    Class sampling terrain heights from a directory of SRTM .hgt tiles.
+    Opened tiles are kept mapped in a least recently used cache.
+
+    Attributes:
+        directory (str): The directory containing the tiles
+        cache_size (int): The maximum number of mapped tiles
+
+    """
+    __slots__ = ('directory', 'cache_size', '_tiles')
+
+    def __init__(self, directory: str | os.PathLike, cache_size: int = 16):
+        """
+        Constructor
+
+        Args:
+            directory (str | os.PathLike): The directory containing the tiles
+            cache_size (int): The maximum number of mapped tiles
+
+        Raises:
+            ValueError: If cache_size is not positive
+
+        """
+        if cache_size < 1:
+            raise ValueError('cache_size has to be positive')
+        self.directory = os.fspath(directory)
+        self.cache_size = cache_size
+        self._tiles: OrderedDict[tuple[int, int], Tile] = OrderedDict()
+
+    def __enter__(self) -> 'Terrain':
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps all cached tiles
+        """
+        while self._tiles:
+            self._tiles.popitem()[1].close()
+
+    def tile(self, south: int, west: int) -> Tile:
+        """
+        Getter for a tile, mapped on first use
+
+        Args:
+            south (int): The latitude of the southern border
+            west (int): The longitude of the western border
+
+        Returns:
+            The tile
+
+        Raises:
+            ValueError: If the tile does not exist or is invalid
+
+        """
+        key = (south, west)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+        filename = os.path.join(self.directory, tile_name(south, west))
+        if not os.path.isfile(filename):
+            raise ValueError(f'no terrain tile {filename}')
+        tile = Tile(filename, south, west)
+        self._tiles[key] = tile
+        if len(self._tiles) > self.cache_size:
+            self._tiles.popitem(last=False)[1].close()
+        return tile
+
+    def elevation(self, lat: float, lon: float) -> float:
+        """
+        Samples the terrain height of a point
+
+        Args:
+            lat (float): The latitude
+            lon (float): The longitude
+
+        Returns:
+            The height above mean sea level in meters, nan if the data is void
+
+        Raises:
+            ValueError: If no tile covers the point
+
+        """
+        return self.elevations([lat], [lon])[0]
+
+    def elevations(self, lats: Sequence[float], lons: Sequence[float]) -> list[float]:
+        """
+        Samples the terrain heights of many points, grouped by tile so that
+        every tile is sampled in one batch
+
+        Args:
+            lats (Sequence[float]): The latitudes
+            lons (Sequence[float]): The longitudes
+
+        Returns:
+            The heights above mean sea level in meters, nan where the data is void
+
+        Raises:
+            ValueError: If no tile covers a point
+
+        """
+        groups: dict[tuple[int, int], list[int]] = {}
+        for index, (lat, lon) in enumerate(zip(lats, lons)):
+            groups.setdefault((math.floor(lat), math.floor(lon)), []).append(index)
+        heights = [math.nan] * len(lats)
+        for (south, west), indices in groups.items():
+            sampled = self.tile(south, west).sample(
+                [lats[index] for index in indices], [lons[index] for index in indices]
+            )
+            for index, height in zip(indices, sampled):
+                heights[index] = height
+        return heights
+
+
+def convert_altitudes(
+        waypoints: Iterable[Waypoint],
+        mode: AltitudeMode,
+        terrain: Terrain,
+        pois: bool = True
+) -> int:
+    """
+    Rewrites the altitudes of waypoints (and their POIs) to the requested mode.
+    AGL altitudes are relative to the terrain below the point, MSL altitudes to the
+    mean sea level. All terrain heights are sampled in one batch.
+
+    Args:
+        waypoints (Iterable[Waypoint]): The waypoints, changed in place
+        mode (AltitudeMode): The target altitude mode
+        terrain (Terrain): The terrain heights
+        pois (bool): Also convert the altitudes of the POIs that are set
+
+    Returns:
+        The number of converted altitudes
+
+    Raises:
+        ValueError: If mode is no valid AltitudeMode, no tile covers a point, the
+            terrain is void at a point or a converted altitude would be negative
+            (e.g. a waypoint below the terrain converted to AGL), as litchi csv files
+            only allow altitudes from 0. Nothing is changed in that case.
+
+    """
+    mode = AltitudeMode(mode)
+    targets = []
+    lats = []
+    lons = []
+    for waypoint in waypoints:
+        if waypoint.altitude.mode is not mode:
+            targets.append(waypoint.altitude)
+            lats.append(waypoint.lat)
+            lons.append(waypoint.lon)
+        poi = waypoint.poi
+        if pois and (poi.lat != 0 or poi.lon != 0) and poi.altitude.mode is not mode:
+            targets.append(poi.altitude)
+            lats.append(poi.lat)
+            lons.append(poi.lon)
+    heights = terrain.elevations(lats, lons)
+    for lat, lon, height in zip(lats, lons, heights):
+        if math.isnan(height):
+            raise ValueError(f'no terrain height at {lat}, {lon}')
+    sign = 1 if mode is AltitudeMode.MSL else -1
+    values = [altitude.value + sign * height for altitude, height in zip(targets, heights)]
+    for lat, lon, value in zip(lats, lons, values):
+        if value < 0:
+            raise ValueError(f'the altitude at {lat}, {lon} would be {value:.1f} m {mode.name}, below 0')
+    for altitude, value in zip(targets, values):
+        altitude.set_value(value)
+        altitude.set_mode(mode)
+    return len(targets)
@@ -0,0 +1,30 @@
+import os
+from typing import Iterable, Sequence, Union
+
+from litchi_wp.enums import AltitudeMode as AltitudeMode
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+VOID: int
+
+def tile_name(lat: float, lon: float) -> str: ...
+
+class Tile:
+    south: int
+    west: int
+    size: int
+    def __init__(self, filename: Union[str, os.PathLike], south: int, west: int) -> None: ...
+    def close(self): ...
+    def sample(self, lats: Sequence[float], lons: Sequence[float]) -> list[float]: ...
+
+class Terrain:
+    directory: str
+    cache_size: int
+    def __init__(self, directory: Union[str, os.PathLike], cache_size: int = ...) -> None: ...
+    def __enter__(self) -> Terrain: ...
+    def __exit__(self, *_args) -> None: ...
+    def close(self): ...
+    def tile(self, south: int, west: int) -> Tile: ...
+    def elevation(self, lat: float, lon: float) -> float: ...
+    def elevations(self, lats: Sequence[float], lons: Sequence[float]) -> list[float]: ...
+
+def convert_altitudes(waypoints: Iterable[Waypoint], mode: AltitudeMode, terrain: Terrain, pois: bool = ...) -> int: ...
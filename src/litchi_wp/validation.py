@@ -0,0 +1,375 @@
+"""
+Module for validating whole missions in one pass
+
+Unlike the setters and parsers, which stop at the first invalid value, the validator
+checks every rule column by column over all waypoints and reports every violation.
+Columns without violations are checked with a single min / max comparison, single
+values are only looked at in columns that contain a violation.
+"""
+# pylint: disable=import-error,too-many-arguments,too-many-locals
+import math
+import os
+from collections import Counter
+from typing import Iterable, Iterator, Sequence, TextIO
+
+from litchi_wp.columns import (
+    ACTION_COLUMNS, ACTION_PARAM_RANGES, ALTITUDE, COLUMN_INDICES, COLUMN_NAMES, CONDITIONAL_RANGES,
+    DISABLED_VALUES, ENUM_RANGES, FIELD_PATTERNS, LATITUDE, LONGITUDE, RANGES, SPEED
+)
+from litchi_wp.files import open_text
+from litchi_wp.geodesy import haversine_many
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+class Issue:
+    """
+    Class representing one violated rule
+
+    Attributes:
+        line (int | None): The line number in the csv file (the first waypoint is on line 2),
+            None for rules of the whole mission
+        column (str | None): The name of the csv column, None for rules of whole waypoints
+        rule (str): The violated rule: 'columns', 'format', 'enum', 'range', 'max_waypoints',
+            'min_waypoints', 'max_segment', 'min_segment', 'max_altitude' or 'max_speed'
+        value (float | str | None): The offending value (the text for 'format')
+        message (str): A human readable description
+
+    """
+    __slots__ = ('line', 'column', 'rule', 'value', 'message')
+
+    def __init__(
+            self,
+            line: int | None,
+            column: str | None,
+            rule: str,
+            value: float | str | None,
+            message: str
+    ):
+        """
+        Constructor
+
+        Args:
+            line (int | None): The line number in the csv file, None for the whole mission
+            column (str | None): The name of the csv column, None for whole waypoints
+            rule (str): The violated rule
+            value (float | str | None): The offending value
+            message (str): A human readable description
+
+        """
+        self.line = line
+        self.column = column
+        self.rule = rule
+        self.value = value
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f'Issue(line={self.line}, column={self.column!r}, rule={self.rule!r}, value={self.value!r})'
+
+    def to_dict(self) -> dict:
+        """
+        Transforms the issue to a dict, e.g. for JSON responses
+
+        Returns:
+            The attributes as dict
+
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ValidationReport:
+    """
+    Class holding the result of a validation
+
+    Attributes:
+        issues (list[Issue]): All violations sorted by line and column, mission rules first
+        waypoints (int): The number of checked waypoints
+
+    """
+    __slots__ = ('issues', 'waypoints')
+
+    def __init__(self, issues: list[Issue], waypoints: int):
+        """
+        Constructor
+
+        Args:
+            issues (list[Issue]): All violations
+            waypoints (int): The number of checked waypoints
+
+        """
+        self.issues = sorted(issues, key=_sort_key)
+        self.waypoints = waypoints
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def __iter__(self) -> Iterator[Issue]:
+        return iter(self.issues)
+
+    def __repr__(self) -> str:
+        return f'ValidationReport(waypoints={self.waypoints}, issues={len(self.issues)})'
+
+    @property
+    def ok(self) -> bool:
+        """
+        Getter for the overall result
+
+        Returns:
+            True if no rule is violated
+
+        """
+        return not self.issues
+
+    def count_by_rule(self) -> dict[str, int]:
+        """
+        Counts the issues per rule
+
+        Returns:
+            The number of issues of every violated rule
+
+        """
+        return dict(Counter(issue.rule for issue in self.issues))
+
+
+def _sort_key(issue: Issue) -> tuple[int, int]:
+    return (
+        -1 if issue.line is None else issue.line,
+        len(COLUMN_NAMES) if issue.column is None else COLUMN_INDICES[issue.column]
+    )
+
+
+class MissionLimits:
+    """
+    Class holding the limits of a whole mission, the defaults are the litchi limits
+
+    Attributes:
+        max_waypoints (int): The maximum number of waypoints of one mission
+        min_waypoints (int): The minimum number of waypoints of one mission
+        max_segment (float): The maximum distance between consecutive waypoints in meters
+        min_segment (float): The minimum distance between consecutive waypoints in meters
+        max_altitude (float): The maximum altitude in meters
+        max_speed (float): The maximum speed in meters per second
+
+    """
+    __slots__ = ('max_waypoints', 'min_waypoints', 'max_segment', 'min_segment', 'max_altitude', 'max_speed')
+
+    def __init__(
+            self,
+            max_waypoints: int = 99,
+            min_waypoints: int = 2,
+            max_segment: float = 2000.0,
+            min_segment: float = 0.5,
+            max_altitude: float = 500.0,
+            max_speed: float = 15.0
+    ):
+        """
+        Constructor, use math.inf / 0 to disable a limit
+
+        Args:
+            max_waypoints (int): The maximum number of waypoints of one mission
+            min_waypoints (int): The minimum number of waypoints of one mission
+            max_segment (float): The maximum distance between consecutive waypoints in meters
+            min_segment (float): The minimum distance between consecutive waypoints in meters
+            max_altitude (float): The maximum altitude in meters
+            max_speed (float): The maximum speed in meters per second
+
+        """
+        self.max_waypoints = max_waypoints
+        self.min_waypoints = min_waypoints
+        self.max_segment = max_segment
+        self.min_segment = min_segment
+        self.max_altitude = max_altitude
+        self.max_speed = max_speed
+
+
+def validate_text(text: str, limits: MissionLimits | None = None) -> ValidationReport:
+    """
+    Validates the content of a litchi waypoint csv file.
+    Lines with a wrong number of columns are reported once, all other lines are
+    checked value by value, so a line can have several issues.
+
+    Args:
+        text (str): The content of the csv file
+        limits (MissionLimits | None): The mission limits, the litchi limits if None
+
+    Returns:
+        The report
+
+    """
+    issues: list[Issue] = []
+    header = Waypoint.get_header(line_break=None)
+    rows = []
+    line_numbers = []
+    for line_number, line in enumerate(text.split('\n'), start=1):
+        line = line.rstrip('\r')
+        if not line or (line_number == 1 and line == header):
+            continue
+        fields = line.split(',')
+        if len(fields) < len(COLUMN_NAMES):
+            issues.append(Issue(
+                line_number, None, 'columns', len(fields),
+                f'expected {len(COLUMN_NAMES)} columns, got {len(fields)}'
+            ))
+            continue
+        rows.append(fields[:len(COLUMN_NAMES)])
+        line_numbers.append(line_number)
+    columns = [list(column) for column in zip(*rows)] or [[] for _name in COLUMN_NAMES]
+    for j, column in enumerate(columns):
+        pattern = FIELD_PATTERNS[j]
+        if j == len(COLUMN_NAMES) - 1:
+            column = columns[j] = [match.group() if match else value
+                                   for value, match in zip(column, map(pattern.match, column))]
+        values = set(column)
+        if all(map(pattern.fullmatch, values)):
+            lookup = {value: float(value) for value in values}
+        else:
+            lookup = {value: float(value) if pattern.fullmatch(value) else math.nan for value in values}
+            for i, value in enumerate(column):
+                if math.isnan(lookup[value]):
+                    issues.append(Issue(
+                        line_numbers[i], COLUMN_NAMES[j], 'format', value,
+                        f'invalid value {value!r} in column {COLUMN_NAMES[j]}'
+                    ))
+        columns[j] = list(map(lookup.__getitem__, column))
+    _check_columns(columns, line_numbers, limits or MissionLimits(), issues)
+    return ValidationReport(issues, len(line_numbers))
+
+
+def validate_file(file: str | os.PathLike | TextIO, limits: MissionLimits | None = None) -> ValidationReport:
+    """
+    Validates a litchi waypoint csv file, see validate_text.
+    Paths ending with '.gz' are opened as gzip compressed text.
+
+    Args:
+        file (str | os.PathLike | TextIO): The path + filename or an opened text stream
+        limits (MissionLimits | None): The mission limits, the litchi limits if None
+
+    Returns:
+        The report
+
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open_text(file) as stream:
+            return validate_file(stream, limits)
+    return validate_text(file.read(), limits)
+
+
+def validate_waypoints(
+        waypoints: Iterable[Waypoint] | WaypointTable,
+        limits: MissionLimits | None = None
+) -> ValidationReport:
+    """
+    Validates waypoints, e.g. a Mission, before they are written.
+    The line numbers are those of the written csv file (the first waypoint is on line 2).
+
+    Args:
+        waypoints (Iterable[Waypoint] | WaypointTable): The waypoints in flight order
+        limits (MissionLimits | None): The mission limits, the litchi limits if None
+
+    Returns:
+        The report
+
+    """
+    if isinstance(waypoints, WaypointTable):
+        columns = [list(column) for column in waypoints.columns]
+    else:
+        columns = [list(column) for column in zip(*(waypoint.to_row() for waypoint in waypoints))]
+        columns = columns or [[] for _name in COLUMN_NAMES]
+    issues: list[Issue] = []
+    line_numbers = range(2, len(columns[0]) + 2)
+    _check_columns(columns, line_numbers, limits or MissionLimits(), issues)
+    return ValidationReport(issues, len(line_numbers))
+
+
+def _check_range(
+        column: list[float],
+        line_numbers: Sequence[int],
+        name: str,
+        minimum: float,
+        maximum: float,
+        rule: str,
+        issues: list[Issue],
+        indices: Iterable[int] | None = None,
+        disabled: float | None = None
+):
+    """
+    Reports the values outside minimum..maximum, only the given indices if not None.
+    nan values (invalid format) and the disabled value are not reported.
+    """
+    if indices is None:
+        if not column or (minimum <= min(column) and max(column) <= maximum):
+            return
+        indices = range(len(column))
+    for i in indices:
+        value = column[i]
+        if (value < minimum or value > maximum) and value != disabled:
+            message = f'{name} {value} is outside {minimum} to {maximum}'
+            if disabled is not None:
+                message += f' and not {disabled} (disabled)'
+            issues.append(Issue(line_numbers[i], name, rule, value, message))
+
+
+def _check_columns(
+        columns: list[list[float]],
+        line_numbers: Sequence[int],
+        limits: MissionLimits,
+        issues: list[Issue]
+):
+    """
+    Runs the value rules column by column and the mission rules
+    """
+    count = len(columns[0])
+    for j, allowed in ENUM_RANGES.items():
+        invalid = set(columns[j]).difference(allowed)
+        if any(not math.isnan(value) for value in invalid):
+            for i, value in enumerate(columns[j]):
+                if value in invalid and not math.isnan(value):
+                    issues.append(Issue(
+                        line_numbers[i], COLUMN_NAMES[j], 'enum', value,
+                        f'{value} is no valid value of {COLUMN_NAMES[j]}'
+                    ))
+    for j, (minimum, maximum) in RANGES.items():
+        _check_range(
+            columns[j], line_numbers, COLUMN_NAMES[j], minimum, maximum, 'range', issues,
+            disabled=DISABLED_VALUES.get(j)
+        )
+    for j, (condition, value, minimum, maximum) in CONDITIONAL_RANGES.items():
+        _check_range(
+            columns[j], line_numbers, COLUMN_NAMES[j], minimum, maximum, 'range', issues,
+            [i for i, mode in enumerate(columns[condition]) if mode == value]
+        )
+    for type_index, param_index in ACTION_COLUMNS:
+        types = columns[type_index]
+        for action_type in ACTION_PARAM_RANGES.keys() & set(types):
+            minimum, maximum = ACTION_PARAM_RANGES[action_type]
+            _check_range(
+                columns[param_index], line_numbers, COLUMN_NAMES[param_index], minimum, maximum, 'range', issues,
+                [i for i, value in enumerate(types) if value == action_type]
+            )
+    _check_range(
+        columns[ALTITUDE], line_numbers, COLUMN_NAMES[ALTITUDE], 0.0, limits.max_altitude, 'max_altitude', issues
+    )
+    _check_range(columns[SPEED], line_numbers, COLUMN_NAMES[SPEED], 0.0, limits.max_speed, 'max_speed', issues)
+    if count > limits.max_waypoints:
+        issues.append(Issue(
+            None, None, 'max_waypoints', count, f'{count} waypoints, at most {limits.max_waypoints} are allowed'
+        ))
+    if count < limits.min_waypoints:
+        issues.append(Issue(
+            None, None, 'min_waypoints', count, f'{count} waypoints, at least {limits.min_waypoints} are needed'
+        ))
+    if count > 1:
+        lats, lons = columns[LATITUDE], columns[LONGITUDE]
+        distances = haversine_many(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        if not limits.min_segment <= min(distances) or not max(distances) <= limits.max_segment:
+            for i, distance in enumerate(distances, start=1):
+                if distance > limits.max_segment:
+                    issues.append(Issue(
+                        line_numbers[i], None, 'max_segment', distance,
+                        f'{distance:.1f} m from the previous waypoint, at most {limits.max_segment} m are allowed'
+                    ))
+                elif distance < limits.min_segment:
+                    issues.append(Issue(
+                        line_numbers[i], None, 'min_segment', distance,
+                        f'{distance:.2f} m from the previous waypoint, at least {limits.min_segment} m are needed'
+                    ))
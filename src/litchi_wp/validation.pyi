@@ -0,0 +1,40 @@
+import os
+from typing import Iterable, Iterator, TextIO, Union
+
+from litchi_wp.columns import ACTION_COLUMNS as ACTION_COLUMNS, ACTION_PARAM_RANGES as ACTION_PARAM_RANGES, ALTITUDE as ALTITUDE, COLUMN_INDICES as COLUMN_INDICES, COLUMN_NAMES as COLUMN_NAMES, CONDITIONAL_RANGES as CONDITIONAL_RANGES, DISABLED_VALUES as DISABLED_VALUES, ENUM_RANGES as ENUM_RANGES, FIELD_PATTERNS as FIELD_PATTERNS, LATITUDE as LATITUDE, LONGITUDE as LONGITUDE, RANGES as RANGES, SPEED as SPEED
+from litchi_wp.files import open_text as open_text
+from litchi_wp.geodesy import haversine_many as haversine_many
+from litchi_wp.table import WaypointTable as WaypointTable
+from litchi_wp.waypoint import Waypoint as Waypoint
+
+class Issue:
+    line: Union[int, None]
+    column: Union[str, None]
+    rule: str
+    value: Union[float, str, None]
+    message: str
+    def __init__(self, line: Union[int, None], column: Union[str, None], rule: str, value: Union[float, str, None], message: str) -> None: ...
+    def to_dict(self) -> dict: ...
+
+class ValidationReport:
+    issues: list[Issue]
+    waypoints: int
+    def __init__(self, issues: list[Issue], waypoints: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Issue]: ...
+    @property
+    def ok(self) -> bool: ...
+    def count_by_rule(self) -> dict[str, int]: ...
+
+class MissionLimits:
+    max_waypoints: int
+    min_waypoints: int
+    max_segment: float
+    min_segment: float
+    max_altitude: float
+    max_speed: float
+    def __init__(self, max_waypoints: int = ..., min_waypoints: int = ..., max_segment: float = ..., min_segment: float = ..., max_altitude: float = ..., max_speed: float = ...) -> None: ...
+
+def validate_text(text: str, limits: Union[MissionLimits, None] = ...) -> ValidationReport: ...
+def validate_file(file: Union[str, os.PathLike, TextIO], limits: Union[MissionLimits, None] = ...) -> ValidationReport: ...
+def validate_waypoints(waypoints: Union[Iterable[Waypoint], WaypointTable], limits: Union[MissionLimits, None] = ...) -> ValidationReport: ...
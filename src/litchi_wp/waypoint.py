@@ -2,10 +2,18 @@
 Module for working with the litchi csv waypoints
 """
 # pylint: disable=import-error,too-many-arguments,too-many-instance-attributes
-import re
-from litchi_wp.action import Action, ActionType
+import os
+from typing import Callable, Iterable, Iterator, Sequence, TextIO
+from litchi_wp.action import DELETED_ACTION, NO_ACTION, Action, ActionType, is_empty_action
 from litchi_wp.altitude import Altitude, AltitudeMode
-from litchi_wp.enums import RotationDirection, RegEx
+from litchi_wp.columns import (
+    ACTION_COLUMNS, ALTITUDE, ALTITUDEMODE, COLUMNS, CURVESIZE, GIMBALMODE, GIMBALPITCHANGLE, HEADER, HEADING,
+    LATITUDE, LINE_PATTERN, LONGITUDE, PHOTO_DISTINTERVAL, PHOTO_TIMEINTERVAL, POI_ALTITUDE, POI_ALTITUDEMODE,
+    POI_LATITUDE, POI_LONGITUDE, ROTATIONDIR, SPEED, row_getter
+)
+from litchi_wp.enums import NumberFormat, RotationDirection
+from litchi_wp.files import open_text
+from litchi_wp.formatting import row_formatter
 from litchi_wp.gimbal import Gimbal, GimbalMode
 from litchi_wp.photo import Photo
 from litchi_wp.poi import Poi
@@ -35,7 +43,10 @@ class Waypoint:
                         or rot is no valid RotationDirection
 
     """
-    next_action_index = 0
+    __slots__ = (
+        'lat', 'lon', 'altitude', 'heading', 'curvesize', 'rotationdir',
+        'gimbal', '_actions', 'speed', 'poi', 'photo', 'next_action_index'
+    )
 
     def __init__(
             self,
@@ -54,10 +65,56 @@ class Waypoint:
         self.curvesize = float(curve)
         self.rotationdir = RotationDirection(rot)
         self.gimbal = Gimbal()
-        self.actions = [Action() for i in range(0, 15)]
+        self._actions: list[Action] = [NO_ACTION] * 15
         self.speed = float(speed)
         self.poi = Poi()
         self.photo = Photo()
+        self.next_action_index = 0
+
+    @property
+    def actions(self) -> list[Action]:
+        """
+        The 15 action slots.
+        Empty slots share one immutable action internally, they are replaced by
+        individual Action objects here so the returned actions can be modified.
+
+        Returns:
+            The list of the 15 Action objects
+        """
+        actions = self._actions
+        if NO_ACTION in actions or DELETED_ACTION in actions:
+            for index, action in enumerate(actions):
+                if is_empty_action(action):
+                    actions[index] = Action()
+                    if action is DELETED_ACTION:
+                        actions[index].delete()
+        return actions
+
+    @actions.setter
+    def actions(self, actions: list[Action]):
+        self._actions = actions
+
+    def used_actions(self) -> list[Action]:
+        """
+        Getter for the actions of the used slots in slot order, without creating
+        Action objects for the empty slots. The actions must not be modified.
+
+        Returns:
+            The list of actions that are not ActionType.NO_ACTION
+        """
+        return [action for action in self._actions if action.type is not ActionType.NO_ACTION]
+
+    def has_actions(self) -> bool:
+        """
+        Checks if any slot holds an action, without creating Action objects
+
+        Returns:
+            True if an action is not ActionType.NO_ACTION
+        """
+        actions = self._actions
+        if actions.count(NO_ACTION) + actions.count(DELETED_ACTION) == len(actions):
+            return False
+        return any(action.type is not ActionType.NO_ACTION for action in actions)
 
     def set_coordinates(self, lat: float, lon: float):
         """
@@ -248,21 +305,28 @@ class Waypoint:
         """
         if int(index) > 14 or int(index) < 0:
             raise IndexError(f"Index {index} is out of bounds (0 ... 14)")
+        action = self._actions[index]
+        if is_empty_action(action):
+            if ActionType(action_type) is ActionType.NO_ACTION:
+                self._actions[index] = DELETED_ACTION
+                return
+            action = Action()
         match ActionType(action_type):
             case ActionType.NO_ACTION:
-                self.actions[index].delete()
+                action.delete()
             case ActionType.ROTATE_AIRCRAFT:
-                self.actions[index].set_rotate(param)
+                action.set_rotate(param)
             case ActionType.STAY_FOR:
-                self.actions[index].set_stay_for(int(param))
+                action.set_stay_for(int(param))
             case ActionType.TILT_CAMERA:
-                self.actions[index].set_tilt_cam(param)
+                action.set_tilt_cam(param)
             case ActionType.TAKE_PHOTO:
-                self.actions[index].set_take_photo()
+                action.set_take_photo()
             case ActionType.START_RECORDING:
-                self.actions[index].set_start_rec()
+                action.set_start_rec()
             case ActionType.STOP_RECORDING:
-                self.actions[index].set_stop_rec()
+                action.set_stop_rec()
+        self._actions[index] = action
 
     def set_action(self, action_type: ActionType, param: int | float = 0) -> int:
         """
@@ -309,59 +373,80 @@ class Waypoint:
             The header as a string
 
         """
-        ret = 'latitude,longitude,altitude(m),heading(deg),' \
-              'curvesize(m),rotationdir,gimbalmode,gimbalpitchangle,' \
-              'actiontype1,actionparam1,actiontype2,actionparam2,' \
-              'actiontype3,actionparam3,actiontype4,actionparam4,' \
-              'actiontype5,actionparam5,actiontype6,actionparam6,' \
-              'actiontype7,actionparam7,actiontype8,actionparam8,' \
-              'actiontype9,actionparam9,actiontype10,actionparam10,' \
-              'actiontype11,actionparam11,actiontype12,' \
-              'actionparam12,actiontype13,actionparam13,actiontype14,' \
-              'actionparam14,actiontype15,actionparam15,' \
-              'altitudemode,speed(m/s),poi_latitude,' \
-              'poi_longitude,poi_altitude(m),poi_altitudemode,' \
-              'photo_timeinterval,photo_distinterval'
+        ret = HEADER
         if line_break:
             ret += line_break
         return ret
 
-    def to_line(self, line_break: str | bool | None = '\n') -> str:
+    def to_row(self) -> tuple[int | float, ...]:
+        """
+        Transforms the waypoint to the 46 values of a litchi csv line
+
+        Returns:
+            The column values in the order of the header, enums as their int values
+
+        """
+        return row_getter(self)
+
+    def to_line(
+            self,
+            line_break: str | bool | None = '\n',
+            number_format: NumberFormat | None = None
+    ) -> str:
         """
         Transforms the waypoint to a line in litchi csv format
 
         Args:
             line_break (str | bool | None): Linebreak character, disable with None or False
+            number_format (NumberFormat | None): The number format, the global one
+                (see formatting.set_number_format) if None
 
         Returns:
             The serialized waypoint in litchi csv format
 
         """
-        line = ''
-        line += str(self.lat) + ','
-        line += str(self.lon) + ','
-        line += str(self.altitude.value) + ','
-        line += str(self.heading) + ','
-        line += str(self.curvesize) + ','
-        line += str(self.rotationdir.value) + ','
-        line += str(self.gimbal.mode.value) + ','
-        line += str(self.gimbal.pitchangle) + ','
-        for i in range(0, 15):
-            line += str(self.actions[i].type.value) + ','
-            line += str(self.actions[i].param) + ','
-        line += str(self.altitude.mode.value) + ','
-        line += str(self.speed) + ','
-        line += str(self.poi.lat) + ','
-        line += str(self.poi.lon) + ','
-        line += str(self.poi.altitude.value) + ','
-        line += str(self.poi.altitude.mode.value) + ','
-        line += str(self.photo.time_interval) + ','
-        line += str(self.photo.distance_interval)
+        line = row_formatter(number_format)(self.to_row())
         if line_break:
             if line_break is not True:
                 line += line_break
         return line
 
+    @staticmethod
+    def from_row(row: Sequence[int | float]) -> 'Waypoint':
+        """
+        Creates a Waypoint from the 46 values of a litchi csv line
+
+        Args:
+            row (Sequence[int | float]): The column values in the order of the header
+
+        Returns:
+            The Waypoint as an instance
+
+        Raises:
+            ValueError: If the row does not have 46 values, a value is out of range
+                or no valid enum value
+
+        """
+        if len(row) != len(COLUMNS):
+            raise ValueError(f'expected {len(COLUMNS)} values, got {len(row)}')
+        alt = row[ALTITUDE]
+        waypoint = Waypoint(lat=row[LATITUDE], lon=row[LONGITUDE], alt=alt)
+        waypoint.set_heading(row[HEADING])
+        waypoint.set_curvesize(row[CURVESIZE])
+        waypoint.set_rotation_direction(RotationDirection(int(row[ROTATIONDIR])))
+        waypoint.set_gimbal(mode=GimbalMode(int(row[GIMBALMODE])), pitchangle=row[GIMBALPITCHANGLE])
+        for index, (type_index, param_index) in enumerate(ACTION_COLUMNS):
+            waypoint.replace_action(index=index, action_type=ActionType(int(row[type_index])), param=row[param_index])
+        waypoint.set_altitude(alt, mode=AltitudeMode(int(row[ALTITUDEMODE])))
+        waypoint.set_speed_ms(row[SPEED])
+        waypoint.set_poi(
+            lat=row[POI_LATITUDE], lon=row[POI_LONGITUDE], alt=row[POI_ALTITUDE],
+            alt_mode=AltitudeMode(int(row[POI_ALTITUDEMODE]))
+        )
+        waypoint.photo.time_interval = float(row[PHOTO_TIMEINTERVAL])
+        waypoint.photo.distance_interval = float(row[PHOTO_DISTINTERVAL])
+        return waypoint
+
     @staticmethod
     def from_line(line: str) -> 'Waypoint':
         """
@@ -377,58 +462,118 @@ class Waypoint:
             ValueError: If line does not match regex filter
 
         """
-        match = re.search(RegEx.VALID_LITCHI_WP_LINE.value, line)
+        match = LINE_PATTERN.match(line)
         if match:
-            rows = match.group().split(',')
+            return Waypoint.from_row([float(value) for value in match.group().split(',')])
+        raise ValueError('invalid_input')
 
-            def get_float(index: int):
-                return float(rows[index])
+    @classmethod
+    def dump_many(
+            cls,
+            waypoints: Iterable['Waypoint'],
+            file: str | os.PathLike | TextIO,
+            line_break: str = '\n',
+            header: bool = True,
+            chunk_size: int = 4096,
+            number_format: NumberFormat | None = None
+    ) -> int:
+        """
+        Writes Waypoints to a litchi waypoint csv file.
+        The lines are written in chunks, the whole file content is never built in memory.
+        Paths ending with '.gz' are written as gzip compressed text.
 
-            def get_int(index: int):
-                return int(get_float(index))
+        Args:
+            waypoints (Iterable[Waypoint]): The Waypoints, may be a generator
+            file (str | os.PathLike | TextIO): The path + filename of the file or an
+                already opened text stream
+            line_break (str): Linebreak character
+            header (bool): Write the header as first line
+            chunk_size (int): Number of lines per write call
+            number_format (NumberFormat | None): The number format, the global one
+                (see formatting.set_number_format) if None
 
-            waypoint = Waypoint(
-                lat=get_float(0),
-                lon=get_float(1),
-                alt=get_float(2)
-            )
-            waypoint.set_heading(get_float(3))
-            waypoint.set_curvesize(get_float(4))
-            waypoint.set_rotation_direction(RotationDirection(get_int(5)))
-            waypoint.set_gimbal(
-                mode=GimbalMode(get_int(6)),
-                pitchangle=get_float(7)
-            )
-            action_index = 0
-            for i in range(8, 8 + 30, 2):
-                waypoint.replace_action(
-                    index=action_index,
-                    action_type=ActionType(get_int(i)),
-                    param=get_float(i + 1)
-                )
-                action_index += 1
-            waypoint.set_altitude(
-                get_float(2),
-                mode=AltitudeMode(get_int(38))
-            )
-            waypoint.set_speed_ms(get_float(39))
-            waypoint.set_poi(
-                lat=get_float(40),
-                lon=get_float(41),
-                alt=get_float(42),
-                alt_mode=AltitudeMode(get_int(43))
-            )
-            waypoint.photo.time_interval = get_float(44)
-            waypoint.photo.distance_interval = get_float(45)
-            return waypoint
-        raise ValueError('invalid_input')
+        Returns:
+            The number of written Waypoints
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open_text(file, 'w') as stream:
+                return cls.dump_many(waypoints, stream, line_break, header, chunk_size, number_format)
+        if header:
+            file.write(Waypoint.get_header(line_break=line_break))
+        format_line = cls._line_formatter(number_format)
+        count = 0
+        chunk = []
+        for waypoint in waypoints:
+            chunk.append(format_line(waypoint))
+            if len(chunk) >= chunk_size:
+                file.write(line_break.join(chunk) + line_break)
+                count += len(chunk)
+                chunk.clear()
+        if chunk:
+            file.write(line_break.join(chunk) + line_break)
+            count += len(chunk)
+        return count
+
+    @classmethod
+    def _line_formatter(cls, number_format: NumberFormat | None) -> Callable[['Waypoint'], str]:
+        """
+        Creates the function dump_many writes every waypoint with
+
+        Args:
+            number_format (NumberFormat | None): The number format, the global one if None
+
+        Returns:
+            The function, taking a waypoint and returning its line without line break
+
+        """
+        format_row = row_formatter(number_format)
+        return lambda waypoint: format_row(waypoint.to_row())
+
+    @classmethod
+    def iter_file(
+            cls,
+            file: str | os.PathLike | TextIO,
+            on_error: Callable[[int, str, ValueError], None] | None = None
+    ) -> Iterator['Waypoint']:
+        """
+        Lazily parses a litchi waypoint csv file line by line.
+        Only one line is held in memory at a time, so files of any size can be processed.
+        Paths ending with '.gz' are opened as gzip compressed text.
+
+        Args:
+            file (str | os.PathLike | TextIO): The path + filename of the file or an
+                already opened text stream (e.g. from open() or gzip.open(mode='rt'))
+            on_error (Callable[[int, str, ValueError], None] | None): Called with the
+                line number (starting at 1), the line and the error for every line that
+                could not be parsed. The header line and empty lines are skipped silently.
+
+        Yields:
+            The parsed Waypoints in file order
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open_text(file) as stream:
+                yield from cls.iter_file(stream, on_error)
+            return
+        header = Waypoint.get_header(line_break=None)
+        from_line = cls.from_line
+        for line_number, line in enumerate(file, start=1):
+            line = line.rstrip('\r\n')
+            if not line or (line_number == 1 and line == header):
+                continue
+            try:
+                yield from_line(line)
+            except ValueError as error:
+                if on_error is not None:
+                    on_error(line_number, line, error)
 
     @staticmethod
     def from_file(filename: str) -> list['Waypoint']:
         """
         Creates a list of Waypoints from a litchi waypoint csv file.
         Prints out any lines that did not match the regular expression.
-        Format: {line_number}: {line}
+        Format: {line_number}: {line} (line numbers start at 1)
 
         Args:
             filename (str): The path + filename of the file to be parsed
@@ -437,19 +582,13 @@ class Waypoint:
             The list of parsed Waypoints
 
         """
-        with open(filename, encoding='utf-8', mode='r') as file:
-            file_content = file.read()
-        rows = file_content.split('\n')
-        wp_list = []
         no_ignored_lines = True
-        for row in rows:
-            try:
-                wp_list.append(
-                    Waypoint.from_line(row)
-                )
-            except ValueError:
-                if no_ignored_lines:
-                    no_ignored_lines = False
-                    print('Ignored lines:')
-                print(f"{rows.index(row)}: {row}")
-        return wp_list
+
+        def print_ignored(line_number: int, line: str, _error: ValueError):
+            nonlocal no_ignored_lines
+            if no_ignored_lines:
+                no_ignored_lines = False
+                print('Ignored lines:')
+            print(f"{line_number}: {line}")
+
+        return list(Waypoint.iter_file(filename, on_error=print_ignored))
@@ -1,8 +1,12 @@
-from typing import Union
+import os
+from typing import Callable, Iterable, Iterator, Sequence, TextIO, Union
 
 from litchi_wp.action import Action as Action, ActionType as ActionType
 from litchi_wp.altitude import Altitude as Altitude, AltitudeMode as AltitudeMode
-from litchi_wp.enums import RotationDirection as RotationDirection
+from litchi_wp.columns import ACTION_COLUMNS as ACTION_COLUMNS, ALTITUDE as ALTITUDE, ALTITUDEMODE as ALTITUDEMODE, COLUMNS as COLUMNS, CURVESIZE as CURVESIZE, GIMBALMODE as GIMBALMODE, GIMBALPITCHANGLE as GIMBALPITCHANGLE, HEADER as HEADER, HEADING as HEADING, LATITUDE as LATITUDE, LINE_PATTERN as LINE_PATTERN, LONGITUDE as LONGITUDE, PHOTO_DISTINTERVAL as PHOTO_DISTINTERVAL, PHOTO_TIMEINTERVAL as PHOTO_TIMEINTERVAL, POI_ALTITUDE as POI_ALTITUDE, POI_ALTITUDEMODE as POI_ALTITUDEMODE, POI_LATITUDE as POI_LATITUDE, POI_LONGITUDE as POI_LONGITUDE, ROTATIONDIR as ROTATIONDIR, SPEED as SPEED, row_getter as row_getter
+from litchi_wp.enums import NumberFormat as NumberFormat, RotationDirection as RotationDirection
+from litchi_wp.files import open_text as open_text
+from litchi_wp.formatting import row_formatter as row_formatter
 from litchi_wp.gimbal import Gimbal as Gimbal, GimbalMode as GimbalMode
 from litchi_wp.photo import Photo as Photo
 from litchi_wp.poi import Poi as Poi
@@ -21,6 +25,8 @@ class Waypoint:
     poi: Poi
     photo: Photo
     def __init__(self, lat: float, lon: float, alt: float, head: float = 180, curve: float = 0, rot: RotationDirection = RotationDirection.CW, speed: float = 0) -> None: ...
+    def used_actions(self) -> list[Action]: ...
+    def has_actions(self) -> bool: ...
     def set_coordinates(self, lat: float, lon: float): ...
     def set_altitude(self, value: float, mode: AltitudeMode = AltitudeMode.AGL): ...
     def set_heading(self, value: float): ...
@@ -36,8 +42,15 @@ class Waypoint:
     def set_action(self, action_type: ActionType, param: Union[int, float] = 0) -> int: ...
     @staticmethod
     def get_header(line_break: str = '\n') -> str: ...
-    def to_line(self, line_break: Union[str, bool, None] = '\n') -> str: ...
+    def to_row(self) -> tuple[Union[int, float], ...]: ...
+    def to_line(self, line_break: Union[str, bool, None] = '\n', number_format: Union[NumberFormat, None] = ...) -> str: ...
+    @staticmethod
+    def from_row(row: Sequence[Union[int, float]]) -> Waypoint: ...
     @staticmethod
     def from_line(line: str) -> Waypoint: ...
+    @classmethod
+    def dump_many(cls, waypoints: Iterable[Waypoint], file: Union[str, os.PathLike, TextIO], line_break: str = '\n', header: bool = True, chunk_size: int = 4096, number_format: Union[NumberFormat, None] = ...) -> int: ...
+    @classmethod
+    def iter_file(cls, file: Union[str, os.PathLike, TextIO], on_error: Union[Callable[[int, str, ValueError], None], None] = ...) -> Iterator[Waypoint]: ...
     @staticmethod
     def from_file(filename: str) -> list['Waypoint']: ...
@@ -1,7 +1,10 @@
 # pylint: skip-file
 from unittest import TestCase
 
-from litchi_wp.action import Action
+import copy
+import pickle
+
+from litchi_wp.action import DELETED_ACTION, NO_ACTION, Action, is_empty_action
 from litchi_wp.enums import ActionType
 
 
@@ -115,3 +118,17 @@ class TestAction(TestCase):
                 self.assertEqual(float(degree), action.param)
             except ValueError:
                 self.assertRaises(ValueError, action.set_tilt_cam, deg=degree)
+
+    def test_empty_actions(self):
+        self.assertEqual(ActionType.NO_ACTION, NO_ACTION.type)
+        self.assertEqual(str(Action().param), str(NO_ACTION.param))
+        action = Action()
+        action.delete()
+        self.assertEqual(str(action.param), str(DELETED_ACTION.param))
+        for empty in [NO_ACTION, DELETED_ACTION]:
+            self.assertTrue(is_empty_action(empty))
+            self.assertRaises(AttributeError, empty.set_rotate, 10)
+            self.assertRaises(AttributeError, empty.delete)
+            self.assertIs(empty, copy.deepcopy(empty))
+            self.assertIs(empty, pickle.loads(pickle.dumps(empty)))
+        self.assertFalse(is_empty_action(Action()))
@@ -0,0 +1,157 @@
+# pylint: skip-file
+import io
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from litchi_wp import binary
+from litchi_wp.binary import (
+    COMPACT_RECORD, HEADER, MAGIC, RECORD, VERSION, BinaryMission, dump_binary, load_binary,
+    load_binary_bytes
+)
+from litchi_wp.enums import ActionType
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestBinary(TestCase):
+    def setUp(self):
+        self.waypoints = list(Waypoint.iter_file(FILENAME))
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'mission.lwpb')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.waypoints), dump_binary(self.waypoints, self.filename))
+        self.assertEqual(
+            HEADER.size + len(self.waypoints) * RECORD.size, os.path.getsize(self.filename)
+        )
+        with BinaryMission(self.filename) as mission:
+            self.assertEqual(len(self.waypoints), len(mission))
+            self.assertEqual(
+                [wp.to_line() for wp in self.waypoints],
+                [wp.to_line() for wp in mission]
+            )
+        table = load_binary(self.filename)
+        self.assertEqual(
+            [wp.to_line() for wp in self.waypoints],
+            [table.to_line(index) for index in range(len(table))]
+        )
+
+    def test_to_table_without_numpy(self):
+        dump_binary(self.waypoints, self.filename)
+        expected = load_binary(self.filename)
+        with patch.object(binary, 'np', None):
+            table = load_binary(self.filename)
+        self.assertEqual(
+            [expected.get_row(index) for index in range(len(expected))],
+            [table.get_row(index) for index in range(len(table))]
+        )
+        self.assertEqual(['d', 'b'], [table.columns[0].typecode, table.columns[5].typecode])
+
+    def test_load_bytes(self):
+        for compact in (True, False):
+            buffer = io.BytesIO()
+            dump_binary(self.waypoints, buffer, compact=compact)
+            data = buffer.getvalue()
+            dump_binary(self.waypoints, self.filename, compact=compact)
+            expected = load_binary(self.filename)
+            expected_rows = [expected.get_row(index) for index in range(len(expected))]
+            for numpy in (binary.np, None):
+                with patch.object(binary, 'np', numpy):
+                    table = load_binary_bytes(memoryview(data + b'trailing')[:len(data)])
+                self.assertEqual(expected_rows, [table.get_row(index) for index in range(len(table))])
+            self.assertRaises(ValueError, load_binary_bytes, data[:-1])
+        self.assertRaises(ValueError, load_binary_bytes, b'lat,lon')
+        self.assertRaises(ValueError, load_binary_bytes, HEADER.pack(MAGIC, 3, RECORD.size, 0))
+
+    def test_random_access(self):
+        waypoint = Waypoint(50.5, 8.25, 42.5, head=90)
+        waypoint.set_action(ActionType.TILT_CAMERA, -45.5)
+        waypoint.set_action(ActionType.STAY_FOR, 3000)
+        waypoints = self.waypoints + [waypoint]
+        dump_binary(waypoints, self.filename)
+        expected = Waypoint.from_line(waypoint.to_line())
+        with BinaryMission(self.filename) as mission:
+            self.assertEqual(expected.to_line(), mission[-1].to_line())
+            self.assertEqual(expected.to_row(), mission.get_row(len(waypoints) - 1))
+            self.assertEqual(self.waypoints[2].to_row(), mission.get_row(2))
+            self.assertRaises(IndexError, mission.get_row, len(waypoints))
+            self.assertRaises(IndexError, mission.get_row, -len(waypoints) - 1)
+
+    def test_table_and_generator(self):
+        table = WaypointTable.from_waypoints(self.waypoints)
+        dump_binary(table, self.filename)
+        self.assertEqual(
+            [table.get_row(index) for index in range(len(table))],
+            [row for row in map(load_binary(self.filename).get_row, range(len(table)))]
+        )
+        stream = io.BytesIO()
+        stream.write(b'prefix')
+        self.assertEqual(len(self.waypoints), dump_binary(iter(self.waypoints), stream, chunk_size=2))
+        stream.seek(6)
+        self.assertEqual(
+            (MAGIC, VERSION, RECORD.size, len(self.waypoints)), HEADER.unpack(stream.read(HEADER.size))
+        )
+
+    def test_compact_layout(self):
+        table = WaypointTable.from_waypoints(self.waypoints)
+        rows = [table.get_row(index) for index in range(len(table))]
+        dump_binary(table, self.filename)
+        self.assertEqual(145, COMPACT_RECORD.size)
+        self.assertEqual(HEADER.size + len(table) * COMPACT_RECORD.size, os.path.getsize(self.filename))
+        for numpy in (binary.np, None):
+            with patch.object(binary, 'np', numpy):
+                loaded = load_binary(self.filename)
+            self.assertEqual(rows, [loaded.get_row(index) for index in range(len(loaded))])
+        with BinaryMission(self.filename) as mission:
+            self.assertEqual(rows, [mission.get_row(index) for index in range(len(mission))])
+        dump_binary(self.waypoints, self.filename, compact=True)
+        self.assertEqual(HEADER.size + len(table) * COMPACT_RECORD.size, os.path.getsize(self.filename))
+        self.assertEqual(rows, list(map(load_binary(self.filename).get_row, range(len(table)))))
+
+    def test_wide_layout(self):
+        waypoint = Waypoint(50.5, 8.25, 42.5)
+        waypoint.set_action(ActionType.ROTATE_AIRCRAFT, 90.5)
+        table = WaypointTable.from_waypoints(self.waypoints + [waypoint])
+        dump_binary(table, self.filename)
+        self.assertEqual(HEADER.size + len(table) * RECORD.size, os.path.getsize(self.filename))
+        self.assertEqual(90.5, load_binary(self.filename).get_row(-1)[9])
+        self.assertRaises(ValueError, dump_binary, table, self.filename, compact=True)
+        self.assertRaises(ValueError, dump_binary, [waypoint], self.filename, compact=True)
+        dump_binary(self.waypoints, self.filename, compact=False)
+        with open(self.filename, mode='r+b') as file:
+            file.write(HEADER.pack(MAGIC, 1, RECORD.size, len(self.waypoints)))
+        self.assertEqual(
+            [wp.to_row() for wp in self.waypoints],
+            [row for row in map(load_binary(self.filename).get_row, range(len(self.waypoints)))]
+        )
+
+    def test_empty(self):
+        self.assertEqual(0, dump_binary([], self.filename))
+        with BinaryMission(self.filename) as mission:
+            self.assertEqual(0, len(mission))
+            self.assertEqual(0, len(mission.to_table()))
+
+    def test_invalid_files(self):
+        with open(self.filename, mode='wb') as file:
+            file.write(b'lat,lon')
+        self.assertRaises(ValueError, BinaryMission, self.filename)
+        with open(self.filename, mode='wb') as file:
+            file.write(HEADER.pack(b'XXXX', 1, RECORD.size, 0))
+        self.assertRaises(ValueError, BinaryMission, self.filename)
+        with open(self.filename, mode='wb') as file:
+            file.write(HEADER.pack(MAGIC, 3, RECORD.size, 0))
+        self.assertRaises(ValueError, BinaryMission, self.filename)
+        with open(self.filename, mode='wb') as file:
+            file.write(HEADER.pack(MAGIC, 1, COMPACT_RECORD.size, 0))
+        self.assertRaises(ValueError, BinaryMission, self.filename)
+        dump_binary(self.waypoints, self.filename)
+        with open(self.filename, mode='r+b') as file:
+            file.truncate(HEADER.size + RECORD.size)
+        self.assertRaises(ValueError, BinaryMission, self.filename)
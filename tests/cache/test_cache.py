@@ -0,0 +1,127 @@
+# pylint: skip-file
+import gzip
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from litchi_wp.cache import CacheStats, ParseCache
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestParseCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'mission.csv')
+        shutil.copy(FILENAME, self.filename)
+        self.rows = [waypoint.to_row() for waypoint in WaypointTable.from_file(FILENAME)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def rows_of(self, table):
+        return [table.get_row(index) for index in range(len(table))]
+
+    def test_memory(self):
+        cache = ParseCache()
+        first = cache.load_table(self.filename)
+        second = cache.load_table(self.filename)
+        self.assertEqual(self.rows, self.rows_of(first))
+        self.assertEqual(self.rows, self.rows_of(second))
+        self.assertEqual((1, 0, 1), (cache.stats.hits, cache.stats.disk_hits, cache.stats.misses))
+        self.assertEqual(0.5, cache.stats.hit_rate)
+        del first[0]
+        self.assertEqual(len(self.rows), len(cache.load_table(self.filename)))
+        waypoints = cache.from_file(self.filename)
+        self.assertEqual(
+            [waypoint.to_line() for waypoint in Waypoint.iter_file(FILENAME)],
+            [waypoint.to_line() for waypoint in waypoints]
+        )
+        self.assertEqual(3, cache.stats.hits)
+
+    def test_stat_key_detects_changes(self):
+        cache = ParseCache()
+        cache.load_table(self.filename)
+        with open(self.filename, encoding='utf-8', mode='r') as file:
+            lines = file.readlines()
+        with open(self.filename, encoding='utf-8', mode='w') as file:
+            file.writelines(lines[:3])
+        stat = os.stat(self.filename)
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        self.assertEqual(2, len(cache.load_table(self.filename)))
+        self.assertEqual(2, cache.stats.misses)
+
+    def test_hash_key(self):
+        cache = ParseCache(key='hash')
+        copy = os.path.join(self.directory, 'copy.csv.gz')
+        with open(FILENAME, mode='rb') as source, gzip.open(copy, mode='wb') as target:
+            target.write(source.read())
+        cache.load_table(self.filename)
+        self.assertEqual(self.rows, self.rows_of(cache.load_table(self.filename)))
+        self.assertEqual(self.rows, self.rows_of(cache.load_table(copy)))
+        self.assertEqual((1, 2), (cache.stats.hits, cache.stats.misses))
+
+    def test_eviction(self):
+        cache = ParseCache(max_entries=1)
+        copy = os.path.join(self.directory, 'copy.csv')
+        shutil.copy(FILENAME, copy)
+        cache.load_table(self.filename)
+        cache.load_table(copy)
+        cache.load_table(self.filename)
+        self.assertEqual(1, len(cache))
+        self.assertEqual((0, 3, 2), (cache.stats.hits, cache.stats.misses, cache.stats.evictions))
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_disk(self):
+        directory = os.path.join(self.directory, 'cache')
+        errors = []
+        with open(self.filename, encoding='utf-8', mode='a') as file:
+            file.write('invalid\n')
+        ParseCache(directory=directory).load_table(self.filename, on_error=lambda *args: errors.append(args))
+        self.assertEqual(1, len(errors))
+        self.assertEqual(1, len([name for name in os.listdir(directory) if name.endswith('.lwpb')]))
+        cache = ParseCache(directory=directory)
+        table = cache.load_table(self.filename, on_error=lambda *args: errors.append(args))
+        self.assertEqual(self.rows, self.rows_of(table))
+        self.assertEqual((0, 1, 0), (cache.stats.hits, cache.stats.disk_hits, cache.stats.misses))
+        self.assertEqual(1, len(errors))
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), mode='wb') as file:
+                file.write(b'broken')
+        cache = ParseCache(directory=directory)
+        self.assertEqual(self.rows, self.rows_of(cache.load_table(self.filename)))
+        self.assertEqual(1, cache.stats.misses)
+
+    def test_corrupted_disk_file(self):
+        directory = os.path.join(self.directory, 'cache')
+        ParseCache(directory=directory).load_table(self.filename)
+        path = os.path.join(directory, os.listdir(directory)[0])
+        with open(path, mode='rb') as file:
+            content = bytearray(file.read())
+        for position in (len(content) // 2, len(content) - 1):
+            corrupted = bytearray(content)
+            corrupted[position] ^= 0xff
+            with open(path, mode='wb') as file:
+                file.write(corrupted)
+            cache = ParseCache(directory=directory)
+            self.assertEqual(self.rows, self.rows_of(cache.load_table(self.filename)))
+            self.assertEqual((0, 1), (cache.stats.disk_hits, cache.stats.misses))
+        with open(path, mode='rb') as file:
+            self.assertEqual(bytes(content), file.read())
+
+    def test_store_errors_are_ignored(self):
+        directory = os.path.join(self.directory, 'cache')
+        cache = ParseCache(directory=directory)
+        shutil.rmtree(directory)
+        self.assertEqual(self.rows, self.rows_of(cache.load_table(self.filename)))
+        self.assertEqual(1, cache.stats.misses)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, ParseCache, max_entries=0)
+        self.assertRaises(ValueError, ParseCache, key='name')
+        self.assertRaises(OSError, ParseCache().load_table, os.path.join(self.directory, 'missing.csv'))
+        self.assertEqual('CacheStats(hits=0, disk_hits=0, misses=0, evictions=0)', repr(CacheStats()))
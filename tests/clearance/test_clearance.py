@@ -0,0 +1,116 @@
+# pylint: skip-file
+import math
+import os
+import struct
+import tempfile
+from unittest import TestCase
+
+from litchi_wp.clearance import ClearanceChecker
+from litchi_wp.enums import ActionType, AltitudeMode
+from litchi_wp.terrain import VOID, Terrain, tile_name
+from litchi_wp.waypoint import Waypoint
+
+SIZE = 101
+
+
+def ground(row, column):
+    # flat plain at 100 m with a 300 m hill in the middle of the tile
+    return round(100 + 300 * math.exp(-((row - 50) ** 2 + (column - 50) ** 2) / 50))
+
+
+class CountingTerrain(Terrain):
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.calls = []
+
+    def elevations(self, lats, lons):
+        self.calls.append(len(lats))
+        return super().elevations(lats, lons)
+
+
+class TestClearance(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        values = [ground(row, column) for row in range(SIZE) for column in range(SIZE)]
+        with open(os.path.join(self.directory.name, tile_name(50, 8)), 'wb') as file:
+            file.write(struct.pack(f'>{len(values)}h', *values))
+        self.terrain = CountingTerrain(self.directory.name)
+        self.calls = self.terrain.calls
+        self.checker = ClearanceChecker(self.terrain, step=50, min_clearance=30)
+
+    def tearDown(self):
+        self.terrain.close()
+        self.directory.cleanup()
+
+    def mission(self):
+        # west to east over the hill top, then north over the plain
+        return [
+            Waypoint(50.5, 8.1, 200), Waypoint(50.5, 8.9, 200), Waypoint(50.9, 8.9, 200)
+        ]
+
+    def test_check(self):
+        legs = self.checker.check(self.mission())
+        self.assertEqual(2, len(legs))
+        self.assertEqual([0, 1], [leg.index for leg in legs])
+        self.assertFalse(legs[0].ok)
+        self.assertAlmostEqual(-100, legs[0].clearance, delta=1)
+        self.assertAlmostEqual(8.5, legs[0].lon, delta=0.01)
+        self.assertTrue(legs[1].ok)
+        self.assertAlmostEqual(200, legs[1].clearance, delta=1)
+        self.assertEqual([0], [leg.index for leg in self.checker.low_legs(self.mission())])
+        waypoints = self.mission()
+        waypoints[0].set_altitude(500, AltitudeMode.MSL)
+        waypoints[1].set_altitude(500, AltitudeMode.MSL)
+        self.assertAlmostEqual(100, self.checker.check(waypoints)[0].clearance, delta=1)
+        self.assertRaises(ValueError, ClearanceChecker, self.terrain, step=0)
+
+    def test_cache(self):
+        waypoints = self.mission() + [Waypoint(50.9, 8.1, 200)]
+        self.checker.check(waypoints)
+        self.assertEqual(1, len(self.calls))
+        self.checker.check(waypoints)
+        self.assertEqual(1, len(self.calls))
+        first = self.calls[0]
+        waypoints[3].set_coordinates(50.8, 8.1)
+        self.checker.check(waypoints)
+        self.assertEqual(2, len(self.calls))
+        self.assertLess(self.calls[1], first / 2)
+
+    def test_follow_terrain(self):
+        waypoints = self.mission()
+        waypoints[0].set_action(ActionType.TAKE_PHOTO)
+        result = self.checker.follow_terrain(waypoints, agl=50, tolerance=5)
+        self.assertIs(waypoints[0], result[0])
+        self.assertIs(waypoints[-1], result[-1])
+        self.assertGreater(len(result), 5)
+        for waypoint in result:
+            self.assertEqual(AltitudeMode.MSL, waypoint.altitude.mode)
+        for waypoint in result[1:]:
+            if waypoint is not waypoints[1] and waypoint is not waypoints[2]:
+                self.assertEqual([], waypoint.used_actions())
+        for leg in self.checker.check(result):
+            self.assertGreater(leg.clearance, 50 - 5 - 1)
+        self.assertAlmostEqual(150, waypoints[2].altitude.value, delta=1)
+        # the straight leg over the plain needs no additional waypoints
+        self.assertIs(waypoints[1], result[-2])
+
+    def test_void_leg_end(self):
+        # void data around the last waypoint of the mission
+        values = [
+            VOID if 5 <= row <= 15 and 85 <= column <= 95 else ground(row, column)
+            for row in range(SIZE) for column in range(SIZE)
+        ]
+        with open(os.path.join(self.directory.name, tile_name(50, 8)), 'wb') as file:
+            file.write(struct.pack(f'>{len(values)}h', *values))
+        terrain = Terrain(self.directory.name)
+        try:
+            checker = ClearanceChecker(terrain, step=50)
+            waypoints = self.mission()
+            waypoints[2].set_altitude(100, AltitudeMode.AGL)
+            self.assertRaises(ValueError, checker.check, waypoints)
+            waypoints = self.mission()
+            rows = [waypoint.to_row() for waypoint in waypoints]
+            self.assertRaises(ValueError, checker.follow_terrain, waypoints, 50)
+            self.assertEqual(rows, [waypoint.to_row() for waypoint in waypoints])
+        finally:
+            terrain.close()
@@ -0,0 +1,106 @@
+# pylint: skip-file
+import contextlib
+import gzip
+import io
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from litchi_wp.cli import find_files, main, process_file
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+OPTIONS = {'strict': False, 'reverse': False, 'simplify': None, 'split': None}
+
+
+class TestCli(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, 'in')
+        self.output = os.path.join(self.directory.name, 'out')
+        os.makedirs(os.path.join(self.input, 'sub'))
+        shutil.copy(FILENAME, os.path.join(self.input, 'a.csv'))
+        shutil.copy(FILENAME, os.path.join(self.input, 'sub', 'b.csv'))
+        with open(FILENAME, 'rb') as source, gzip.open(os.path.join(self.input, 'c.csv.gz'), 'wb') as target:
+            target.write(source.read())
+        with open(os.path.join(self.input, 'notes.txt'), 'w') as file:
+            file.write('not a mission')
+        self.expected = list(Waypoint.iter_file(FILENAME))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_main(self, *args):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            code = main(['-j', '1', *args])
+        return code, stderr.getvalue()
+
+    def test_find_files(self):
+        files = find_files([self.input, os.path.join(self.input, '*.csv'), os.path.join(self.input, 'a.csv')])
+        self.assertEqual(
+            ['a.csv', 'c.csv.gz', os.path.join('sub', 'b.csv')],
+            [relative for _file, relative in files]
+        )
+        self.assertEqual([('missing.csv', 'missing.csv')], find_files(['missing.csv']))
+
+    def test_process_file(self):
+        target = os.path.join(self.output, 'a.csv')
+        result = process_file((os.path.join(self.input, 'a.csv'), target, dict(OPTIONS, reverse=True)))
+        self.assertIsNone(result.error)
+        self.assertEqual(len(self.expected), result.waypoints)
+        self.assertEqual([target], result.targets)
+        written = list(Waypoint.iter_file(target))
+        self.assertEqual([wp.to_row() for wp in reversed(self.expected)], [wp.to_row() for wp in written])
+        result = process_file(('missing.csv', None, OPTIONS))
+        self.assertIn('FileNotFoundError', result.error)
+        truncated = os.path.join(self.input, 'truncated.csv.gz')
+        with open(os.path.join(self.input, 'c.csv.gz'), 'rb') as source, open(truncated, 'wb') as file:
+            file.write(source.read()[:-20])
+        result = process_file((truncated, None, OPTIONS))
+        self.assertIn('EOFError', result.error)
+
+    def test_convert(self):
+        code, report = self.run_main(self.input, '-o', self.output)
+        self.assertEqual(0, code)
+        self.assertIn('3 files (0 failed)', report)
+        self.assertIn('waypoints/s', report)
+        for name in ('a.csv', os.path.join('sub', 'b.csv'), 'c.csv.gz'):
+            written = list(Waypoint.iter_file(os.path.join(self.output, name)))
+            self.assertEqual([wp.to_row() for wp in self.expected], [wp.to_row() for wp in written])
+
+    def test_split(self):
+        code, _report = self.run_main(os.path.join(self.input, 'a.csv'), '-o', self.output, '--split', '20')
+        self.assertEqual(0, code)
+        parts = sorted(os.listdir(self.output))
+        self.assertEqual(['a_001.csv', 'a_002.csv', 'a_003.csv'], parts)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, main, [self.input, '--split', '1'])
+            self.assertRaises(SystemExit, main, [self.input, '--jobs', '0'])
+            self.assertRaises(SystemExit, main, [self.input, '--chunksize', '0'])
+
+    def test_errors(self):
+        with open(os.path.join(self.input, 'a.csv'), 'a') as file:
+            file.write('1,2,3\n')
+        code, report = self.run_main(self.input, '-v')
+        self.assertEqual(0, code)
+        self.assertIn('1 rejected lines', report)
+        self.assertIn(f'line {len(self.expected) + 2}:', report)
+        self.assertFalse(os.path.exists(self.output))
+        code, report = self.run_main(self.input, '--strict')
+        self.assertEqual(1, code)
+        self.assertIn('FAILED', report)
+        self.assertIn('3 files (1 failed)', report)
+        code, report = self.run_main(os.path.join(self.input, 'missing.csv'))
+        self.assertEqual(1, code)
+
+    def test_number_format(self):
+        source = os.path.join(self.input, 'a.csv')
+        code, _report = self.run_main(source, '-o', self.output, '--number-format', 'canonical')
+        self.assertEqual(0, code)
+        with open(os.path.join(self.output, 'a.csv'), encoding='utf-8') as file:
+            content = file.read()
+        self.assertNotIn('.0,', content)
+        written = list(Waypoint.iter_file(os.path.join(self.output, 'a.csv')))
+        self.assertEqual([wp.to_row() for wp in self.expected], [wp.to_row() for wp in written])
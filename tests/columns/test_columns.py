@@ -0,0 +1,78 @@
+# pylint: skip-file
+import os
+import re
+from unittest import TestCase
+
+from litchi_wp.columns import (
+    ACTION_COLUMNS, ACTION_PARAM_COLUMNS, COLUMN_INDICES, COLUMN_NAMES, COLUMNS, CONDITIONAL_RANGES,
+    DISABLED_VALUES, ENUM_COLUMNS, ENUM_RANGES, FIELD_PATTERNS, GIMBALPITCHANGLE, HEADER, LINE_PATTERN,
+    PHOTO_DISTINTERVAL, RANGES, SPEED, row_getter
+)
+from litchi_wp.enums import ActionType, AltitudeMode, GimbalMode, RegEx, RotationDirection
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestColumns(TestCase):
+    def test_spec(self):
+        self.assertEqual(46, len(COLUMNS))
+        self.assertEqual(list(range(46)), [column.index for column in COLUMNS])
+        with open(FILENAME, encoding='utf-8') as file:
+            self.assertEqual(file.readline().rstrip('\n'), HEADER)
+        self.assertEqual(HEADER, ','.join(COLUMN_NAMES))
+        self.assertEqual(HEADER + '\n', Waypoint.get_header())
+        self.assertEqual(frozenset([5, 6] + list(range(8, 38, 2)) + [38, 43]), ENUM_COLUMNS)
+        self.assertEqual(frozenset(range(9, 38, 2)), ACTION_PARAM_COLUMNS)
+        self.assertEqual(frozenset(range(-1, 6)), ENUM_RANGES[8])
+        self.assertEqual(frozenset([0, 1, 2]), ENUM_RANGES[6])
+        self.assertEqual((-90.0, 90.0), RANGES[0])
+        self.assertEqual((0.0, float('inf')), RANGES[42])
+        self.assertTrue(COLUMNS[5].is_enum)
+        self.assertFalse(COLUMNS[9].is_enum)
+        self.assertEqual(len(COLUMNS), len(FIELD_PATTERNS))
+
+    def test_layout(self):
+        self.assertEqual(tuple(zip(range(8, 38, 2), range(9, 38, 2))), ACTION_COLUMNS)
+        self.assertEqual(ACTION_PARAM_COLUMNS, frozenset(param for _type, param in ACTION_COLUMNS))
+        self.assertEqual(39, COLUMN_INDICES['speed(m/s)'])
+        self.assertEqual((7, 39, 45), (GIMBALPITCHANGLE, SPEED, PHOTO_DISTINTERVAL))
+        self.assertEqual({7: (6, GimbalMode.INTERPOLATE.value, -90.0, 30.0)}, CONDITIONAL_RANGES)
+        self.assertNotIn(7, RANGES)
+        self.assertEqual({44: -1.0, 45: -1.0}, DISABLED_VALUES)
+        self.assertEqual((0.0, float('inf')), RANGES[44])
+
+    def test_line_pattern(self):
+        with open(FILENAME, encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        lines += [
+            lines[1].replace('100.0', '-100.0', 1),
+            lines[1].replace(',0,0,0.0,', ',2,0,0.0,', 1),
+            lines[1] + ',trailing',
+            lines[1][:-5],
+            'a' + lines[1],
+            ''
+        ]
+        for line in lines:
+            self.assertEqual(
+                re.search(RegEx.VALID_LITCHI_WP_LINE.value, line) is not None,
+                LINE_PATTERN.match(line) is not None,
+                line
+            )
+
+    def test_row_getter(self):
+        waypoint = Waypoint(21.5, -157.5, 100.0)
+        waypoint.set_rotation_direction(RotationDirection.CCW)
+        waypoint.set_gimbal(GimbalMode.INTERPOLATE, -45)
+        waypoint.set_action(ActionType.STAY_FOR, 1500)
+        waypoint.set_action(ActionType.TILT_CAMERA, -30.5)
+        waypoint.set_poi(21.6, -157.6, 20.0, AltitudeMode.AGL)
+        row = row_getter(waypoint)
+        self.assertEqual(46, len(row))
+        self.assertEqual((21.5, -157.5, 100.0), row[:3])
+        self.assertEqual((1, 2, -45), row[5:8])
+        self.assertEqual((0, 1500, 5, -30.5, -1, 0), row[8:14])
+        self.assertEqual((21.6, -157.6, 20.0, 1), row[40:44])
+        self.assertEqual(row, Waypoint.from_row(row).to_row())
+        line = Waypoint.from_line(waypoint.to_line()).to_line()
+        self.assertEqual(line, Waypoint.from_line(line).to_line())
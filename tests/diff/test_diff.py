@@ -0,0 +1,150 @@
+# pylint: skip-file
+import random
+from unittest import TestCase
+
+from litchi_wp.diff import Patch, PatchOperation, apply_patch, diff
+from litchi_wp.enums import ActionType
+from litchi_wp.mission import Mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+def mission(count, seed=0):
+    generator = random.Random(seed)
+    return [
+        Waypoint(47 + index * 1e-4, 8 + generator.random() * 1e-3, 30 + index % 50)
+        for index in range(count)
+    ]
+
+
+def edited(waypoints, seed=1, edits=30):
+    generator = random.Random(seed)
+    result = list(waypoints)
+    for _edit in range(edits):
+        index = generator.randrange(len(result))
+        choice = generator.random()
+        if choice < 0.3:
+            del result[index]
+        elif choice < 0.6:
+            result.insert(index, Waypoint(generator.random(), generator.random(), 10))
+        else:
+            waypoint = Waypoint.from_row(result[index].to_row())
+            waypoint.set_heading(generator.randrange(360))
+            waypoint.set_action(ActionType.TAKE_PHOTO)
+            result[index] = waypoint
+    return result
+
+
+class TestDiff(TestCase):
+    def assert_rows(self, expected, actual):
+        self.assertEqual([waypoint.to_row() for waypoint in expected], [waypoint.to_row() for waypoint in actual])
+
+    def test_equal(self):
+        waypoints = mission(100)
+        patch = diff(waypoints, list(waypoints))
+        self.assertEqual(0, len(patch))
+        self.assertEqual((100, 100), (patch.source_length, patch.target_length))
+        self.assertEqual(0, len(diff([], [])))
+
+    def test_round_trip(self):
+        old = mission(500)
+        for seed in range(5):
+            new = edited(old, seed)
+            for align in ('rows', 'coordinates'):
+                patch = diff(old, new, align=align)
+                target = Mission(old)
+                apply_patch(target, Patch.from_json(patch.to_json()))
+                self.assert_rows(new, target)
+                self.assertEqual(
+                    patch.to_dict(),
+                    diff(WaypointTable.from_waypoints(old), WaypointTable.from_waypoints(new), align).to_dict()
+                )
+
+    def test_unchanged_waypoints_are_kept(self):
+        old = mission(20)
+        new = list(old)
+        del new[3]
+        new.insert(10, Waypoint(1, 2, 3))
+        target = list(old)
+        apply_patch(target, diff(old, new))
+        self.assertIs(old[0], target[0])
+        self.assertIs(old[19], target[19])
+        self.assert_rows(new, target)
+
+    def test_operations(self):
+        old = mission(10)
+        new = list(old)
+        moved = Waypoint.from_row(new[4].to_row())
+        moved.set_heading(90)
+        new[4] = moved
+        del new[7:9]
+        new.insert(1, Waypoint(1, 2, 3))
+        patch = diff(old, new, align='coordinates')
+        self.assertEqual(
+            [
+                {'op': 'insert', 'index': 1, 'rows': [list(Waypoint(1, 2, 3).to_row())]},
+                {'op': 'change', 'index': 5, 'changes': [[3, 90.0]]},
+                {'op': 'delete', 'index': 8, 'count': 2}
+            ],
+            patch.to_dict()['operations']
+        )
+        self.assertEqual(['insert', 'change', 'delete'], [
+            operation.kind for operation in diff(old, new, align='rows')
+        ])
+
+    def test_duplicate_rows(self):
+        old = [Waypoint(1, 2, 3) for _index in range(50)] + mission(5) + [Waypoint(1, 2, 3) for _index in range(20)]
+        new = old[:10] + [Waypoint(4, 5, 6)] + old[30:60] + old[:3]
+        target = list(old)
+        apply_patch(target, diff(old, new))
+        self.assert_rows(new, target)
+
+    def test_repeated_rows(self):
+        generator = random.Random(2)
+        a, b = Waypoint(1, 2, 3), Waypoint(4, 5, 6)
+        few = [Waypoint(index, 1, 10) for index in range(7)]
+        cases = [
+            ([a, b] * 3000, [b, a] * 3000, 'rows'),
+            ([generator.choice(few[:3]) for _index in range(6000)], [generator.choice(few) for _index in range(6000)], 'rows'),
+        ]
+        scan = [Waypoint.from_row(few[index % 5].to_row()) for index in range(6000)]
+        edited_scan = list(scan)
+        for index in range(0, 6000, 100):
+            waypoint = Waypoint.from_row(scan[index].to_row())
+            waypoint.set_heading(90)
+            edited_scan[index] = waypoint
+        edited_scan.insert(3000, few[6])
+        cases.append((scan, edited_scan, 'coordinates'))
+        for old, new, align in cases:
+            target = list(old)
+            apply_patch(target, diff(old, new, align=align))
+            self.assert_rows(new, target)
+
+    def test_invalid(self):
+        old = mission(5)
+        patch = diff(old, old[:3])
+        self.assertRaises(ValueError, apply_patch, old[:4], patch)
+        self.assertRaises(ValueError, diff, old, old, align='index')
+        self.assertRaises(ValueError, PatchOperation, 'move', 0)
+        self.assertRaises(ValueError, PatchOperation, 'delete', -1)
+        self.assertRaises(ValueError, PatchOperation, 'change', 0, changes=[(46, 0)])
+        self.assertRaises(ValueError, PatchOperation, 'change', 0, changes=[(0, None)])
+        self.assertRaises(ValueError, PatchOperation, 'change', 0, changes=[(0, '1')])
+        self.assertRaises(ValueError, PatchOperation, 'change', 0, changes=[(0, True)])
+        self.assertRaises(ValueError, PatchOperation, 'insert', 0, rows=[old[0].to_row()[:45]])
+        self.assertRaises(ValueError, PatchOperation, 'insert', 0, rows=[old[0].to_row() + (0,)])
+        self.assertRaises(ValueError, PatchOperation, 'insert', 0, rows=[old[0].to_row()[:45] + (None,)])
+        self.assertRaises(ValueError, Patch.from_dict, {'operations': []})
+        self.assertRaises(ValueError, Patch.from_json, '{"source_length":1,"target_length":1,"operations":[{"op":"change"}]}')
+        target = list(old)
+        invalid = Patch([PatchOperation('change', 0, changes=[(0, 0.5)]), PatchOperation('change', 9, changes=[(0, 1)])], 5, 5)
+        self.assertRaises(ValueError, apply_patch, target, invalid)
+        self.assertEqual(old, target)
+        invalid = Patch([PatchOperation('change', 0, changes=[(6, 7)])], 5, 5)
+        self.assertRaises(ValueError, apply_patch, target, invalid)
+        self.assertRaises(ValueError, apply_patch, target, Patch([PatchOperation('delete', 4, count=2)], 5, 3))
+        self.assertRaises(ValueError, apply_patch, target, Patch([PatchOperation('insert', 6, rows=[])], 5, 5))
+        self.assertRaises(ValueError, apply_patch, target, Patch([], 5, 4))
+        self.assertEqual(old, target)
+        self.assertEqual('Patch(1 operations, 5 -> 3 waypoints)', repr(patch))
+        self.assertEqual('PatchOperation(delete, 3, count=2)', repr(patch.operations[0]))
@@ -0,0 +1,31 @@
+# pylint: skip-file
+import gzip
+import os
+import tempfile
+from unittest import TestCase
+
+from litchi_wp.files import open_text
+
+
+class TestOpenText(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_plain_and_gzip(self):
+        for name in ('mission.csv', 'mission.csv.gz'):
+            path = os.path.join(self.directory.name, name)
+            with open_text(path, 'w') as file:
+                file.write('a\r\nb\n')
+            with open(path, 'rb') as file:
+                content = file.read()
+            if name.endswith('.gz'):
+                content = gzip.decompress(content)
+            self.assertEqual(b'a\r\nb\n', content)
+            with open_text(path) as file:
+                self.assertEqual(['a\n', 'b\n'], list(file))
+
+    def test_missing(self):
+        self.assertRaises(OSError, open_text, os.path.join(self.directory.name, 'missing.csv'))
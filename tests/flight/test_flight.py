@@ -0,0 +1,109 @@
+# pylint: skip-file
+import random
+from unittest import TestCase
+
+from litchi_wp.enums import ActionType, GimbalMode
+from litchi_wp.flight import AircraftProfile, FlightEstimator
+from litchi_wp.geodesy import haversine
+from litchi_wp.mission import Mission
+from litchi_wp.waypoint import Waypoint
+
+
+class TestFlightEstimator(TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.profile = AircraftProfile()
+
+    def random_waypoint(self):
+        waypoint = Waypoint(50 + random.random() / 100, 8 + random.random() / 100, random.random() * 100)
+        waypoint.set_speed_ms(random.choice([0, 5, 12]))
+        waypoint.set_curvesize(random.choice([0, 0, 10, 30]))
+        if random.random() < 0.5:
+            waypoint.set_action(ActionType.STAY_FOR, random.randint(0, 3000))
+            waypoint.set_action(ActionType.ROTATE_AIRCRAFT, random.randint(0, 359))
+            waypoint.set_action(ActionType.TAKE_PHOTO)
+        return waypoint
+
+    def assertTotalsEqual(self, estimator):
+        reference = FlightEstimator(list(estimator.waypoints), estimator.profile)
+        self.assertAlmostEqual(reference.total_distance, estimator.total_distance, delta=1e-6)
+        self.assertAlmostEqual(reference.total_time, estimator.total_time, delta=1e-6)
+        self.assertAlmostEqual(reference.total_energy, estimator.total_energy, delta=1e-6)
+
+    def test_straight_leg(self):
+        start = Waypoint(50, 8, 10)
+        end = Waypoint(50.01, 8, 10)
+        distance = haversine(50, 8, 50.01, 8)
+        estimator = FlightEstimator([start, end], self.profile)
+        self.assertAlmostEqual(distance, estimator.total_distance)
+        self.assertAlmostEqual(distance / self.profile.cruise_speed, estimator.total_time)
+        self.assertEqual([estimator.total_time], estimator.leg_times)
+        self.assertAlmostEqual(
+            estimator.total_time * self.profile.cruise_power / 3600, estimator.total_energy
+        )
+        start.set_speed_ms(5)
+        estimator.update(0)
+        self.assertAlmostEqual(distance / 5, estimator.total_time)
+        end.set_altitude(2000)
+        estimator.update(1)
+        self.assertAlmostEqual(1990 / self.profile.climb_rate, estimator.total_time)
+        self.assertAlmostEqual(estimator.total_energy / self.profile.usable_energy, estimator.battery_usage)
+
+    def test_actions(self):
+        waypoint = Waypoint(50, 8, 10, head=0)
+        waypoint.set_gimbal(GimbalMode.INTERPOLATE, -30)
+        waypoint.set_action(ActionType.STAY_FOR, 1500)
+        waypoint.set_action(ActionType.ROTATE_AIRCRAFT, 270)
+        waypoint.set_action(ActionType.TILT_CAMERA, -90)
+        waypoint.set_action(ActionType.TAKE_PHOTO)
+        estimator = FlightEstimator([waypoint], self.profile)
+        expected = 1.5 + 90 / self.profile.yaw_rate + 60 / self.profile.gimbal_rate + self.profile.action_time
+        self.assertAlmostEqual(expected, estimator.total_time)
+
+    def test_turns(self):
+        waypoints = [Waypoint(50, 8, 10), Waypoint(50.01, 8, 10), Waypoint(50.01, 8.01, 10)]
+        estimator = FlightEstimator(waypoints, self.profile)
+        straight = sum(estimator.leg_times)
+        self.assertAlmostEqual(straight + self.profile.stop_time, estimator.total_time)
+        waypoints[1].set_curvesize(50)
+        estimator.update(1)
+        self.assertLess(estimator.total_time, straight)
+        self.assertLess(estimator.total_distance, sum(
+            haversine(a.lat, a.lon, b.lat, b.lon) for a, b in zip(waypoints, waypoints[1:])
+        ))
+
+    def test_incremental(self):
+        mission = Mission(self.random_waypoint() for _ in range(30))
+        estimator = FlightEstimator(mission, self.profile)
+        self.assertTotalsEqual(estimator)
+        for _ in range(100):
+            match random.choice(['update', 'insert', 'delete']):
+                case 'update':
+                    index = random.randrange(len(mission))
+                    mission[index].set_coordinates(50 + random.random() / 100, 8 + random.random() / 100)
+                    mission[index].set_curvesize(random.choice([0, 20]))
+                    estimator.update(index)
+                case 'insert':
+                    estimator.insert(random.randint(0, len(mission)), self.random_waypoint())
+                case 'delete':
+                    if len(mission) > 1:
+                        estimator.delete(random.randrange(len(mission)))
+            self.assertTotalsEqual(estimator)
+        self.assertRaises(IndexError, estimator.update, len(mission))
+        self.assertRaises(IndexError, estimator.delete, -1)
+
+    def test_small_missions(self):
+        estimator = FlightEstimator([], self.profile)
+        self.assertEqual(0, estimator.total_time)
+        estimator.insert(0, Waypoint(50, 8, 10))
+        estimator.insert(1, Waypoint(50.01, 8, 10))
+        self.assertTotalsEqual(estimator)
+        estimator.delete(0)
+        estimator.delete(0)
+        self.assertAlmostEqual(0, estimator.total_time)
+        self.assertAlmostEqual(0, estimator.total_distance)
+
+    def test_profile(self):
+        self.assertRaises(ValueError, AircraftProfile, cruise_speed=0)
+        self.assertRaises(ValueError, AircraftProfile, battery_capacity='abc')
+        self.assertAlmostEqual(50, AircraftProfile(battery_capacity=100, battery_reserve=0.5).usable_energy)
@@ -0,0 +1,91 @@
+# pylint: skip-file
+import io
+import os
+from unittest import TestCase
+
+from litchi_wp.enums import ActionType, NumberFormat
+from litchi_wp.formatting import format_canonical, get_number_format, row_formatter, set_number_format
+from litchi_wp.mission import Mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestFormatting(TestCase):
+    def tearDown(self):
+        set_number_format(NumberFormat.REPR, 7)
+
+    def test_canonical(self):
+        self.assertEqual('100', format_canonical(100.0))
+        self.assertEqual('-1', format_canonical(-1.0))
+        self.assertEqual('1500', format_canonical(1500))
+        self.assertEqual('0', format_canonical(-0.0))
+        self.assertEqual('21.2568756', format_canonical(21.2568756))
+        self.assertEqual('0.1', format_canonical(0.1))
+        self.assertEqual('0.00001', format_canonical(1e-05))
+        self.assertEqual('-0.000012345', format_canonical(-1.2345e-05))
+        self.assertEqual('12345678901234567000', format_canonical(1.2345678901234567e19))
+        self.assertRaises(ValueError, format_canonical, float('nan'))
+        self.assertRaises(ValueError, format_canonical, float('inf'))
+
+    def test_fixed(self):
+        waypoint = Waypoint(50.123456789, -8.5, 100)
+        waypoint.set_action(ActionType.STAY_FOR, 1500)
+        line = row_formatter(NumberFormat.FIXED, 3)(waypoint.to_row())
+        self.assertTrue(line.startswith('50.123,-8.500,100.000,180.000,0.000,0,0,0.000,0,1500.000,-1,0.000,'))
+        self.assertTrue(line.endswith(',1,0.000,0.000,0.000,0.000,0,-1.000,-1.000'))
+        parsed = Waypoint.from_line(line)
+        self.assertEqual(50.123, parsed.lat)
+        self.assertEqual(1500, parsed.actions[0].param)
+        line = row_formatter(NumberFormat.FIXED, 0)(waypoint.to_row())
+        self.assertTrue(line.startswith('50,-8,100,180,0,0,0,0,0,1500,-1,0,'))
+        self.assertEqual(46, len(Waypoint.from_line(line).to_row()))
+
+    def test_canonical_round_trip(self):
+        waypoints = list(Waypoint.iter_file(FILENAME))
+        for waypoint in waypoints:
+            line = waypoint.to_line(number_format=NumberFormat.CANONICAL)
+            self.assertNotIn('.0,', line)
+            parsed = Waypoint.from_line(line)
+            self.assertEqual(waypoint.to_row(), parsed.to_row())
+            self.assertEqual(line, parsed.to_line(number_format=NumberFormat.CANONICAL))
+        edited = Waypoint(1e-05, -0.0, 10.0)
+        line = edited.to_line(line_break=None, number_format=NumberFormat.CANONICAL)
+        self.assertTrue(line.startswith('0.00001,0,10,180,0,'))
+        self.assertEqual(edited.to_row(), Waypoint.from_line(line).to_row())
+        self.assertTrue(Waypoint(-0.0, 5, 10).to_line(number_format=NumberFormat.CANONICAL).startswith('0,5,10,'))
+
+    def test_global(self):
+        self.assertEqual((NumberFormat.REPR, 7), get_number_format())
+        waypoint = Waypoint(50.123456789, 8.5, 100)
+        self.assertTrue(waypoint.to_line().startswith('50.123456789,8.5,100.0,180.0,'))
+        set_number_format(NumberFormat.FIXED, 4)
+        self.assertEqual((NumberFormat.FIXED, 4), get_number_format())
+        self.assertTrue(waypoint.to_line().startswith('50.1235,8.5000,100.0000,180.0000,'))
+        set_number_format(NumberFormat.CANONICAL)
+        self.assertEqual((NumberFormat.CANONICAL, 4), get_number_format())
+        self.assertTrue(waypoint.to_line().startswith('50.123456789,8.5,100,180,'))
+        self.assertTrue(waypoint.to_line(number_format=NumberFormat.REPR).startswith('50.123456789,8.5,100.0,'))
+        self.assertRaises(ValueError, set_number_format, 5)
+        self.assertRaises(ValueError, set_number_format, NumberFormat.FIXED, -1)
+
+    def test_writers(self):
+        mission = Mission.from_file(FILENAME)
+        table = mission.to_table()
+        expected = Waypoint.get_header() + ''.join(
+            wp.to_line(number_format=NumberFormat.CANONICAL) for wp in mission
+        )
+        for write in (
+                lambda stream: Waypoint.dump_many(mission, stream, number_format=NumberFormat.CANONICAL),
+                lambda stream: mission.to_file(stream, number_format=NumberFormat.CANONICAL),
+                lambda stream: table.to_file(stream, number_format=NumberFormat.CANONICAL),
+        ):
+            stream = io.StringIO()
+            write(stream)
+            self.assertEqual(expected, stream.getvalue())
+        self.assertEqual(
+            mission[0].to_line(number_format=NumberFormat.FIXED),
+            table.to_line(0, number_format=NumberFormat.FIXED)
+        )
+        self.assertLess(len(expected), len(Waypoint.get_header() + ''.join(wp.to_line() for wp in mission)))
@@ -0,0 +1,84 @@
+# pylint: skip-file
+import math
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from litchi_wp import geodesy
+from litchi_wp.mission import Mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+
+class TestGeodesy(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.waypoints = [
+            Waypoint(50 + random.random(), 8 + random.random(), random.random() * 100)
+            for _ in range(50)
+        ]
+
+    def assertListAlmostEqual(self, expected, result, delta=1e-6):
+        self.assertEqual(len(expected), len(result))
+        for x, y in zip(expected, result):
+            self.assertAlmostEqual(x, y, delta=delta)
+
+    def test_haversine(self):
+        self.assertAlmostEqual(111195.08, geodesy.haversine(0, 0, 1, 0), delta=0.01)
+        self.assertEqual(0.0, geodesy.haversine(50, 8, 50, 8))
+        self.assertAlmostEqual(math.pi * geodesy.EARTH_RADIUS, geodesy.haversine(0, 0, 0, 180), delta=0.01)
+
+    def test_vincenty(self):
+        # Flinders Peak -> Buninyong (Vincenty 1975)
+        distance = geodesy.vincenty(
+            -(37 + 57 / 60 + 3.72030 / 3600), 144 + 25 / 60 + 29.52440 / 3600,
+            -(37 + 39 / 60 + 10.15610 / 3600), 143 + 55 / 60 + 35.38390 / 3600
+        )
+        self.assertAlmostEqual(54972.271, distance, delta=0.001)
+        self.assertEqual(0.0, geodesy.vincenty(50, 8, 50, 8))
+        self.assertRaises(ValueError, geodesy.vincenty, 0, 0, 0.5, 179.7)
+
+    def test_bearing(self):
+        self.assertAlmostEqual(0, geodesy.bearing(0, 0, 1, 0))
+        self.assertAlmostEqual(90, geodesy.bearing(0, 0, 0, 1))
+        self.assertAlmostEqual(180, geodesy.bearing(1, 0, 0, 0))
+        self.assertAlmostEqual(270, geodesy.bearing(0, 1, 0, 0))
+
+    def test_leg_distances(self):
+        pairs = list(zip(self.waypoints, self.waypoints[1:]))
+        expected = [geodesy.haversine(a.lat, a.lon, b.lat, b.lon) for a, b in pairs]
+        self.assertListAlmostEqual(expected, geodesy.leg_distances(self.waypoints))
+        expected_3d = [
+            math.hypot(d, b.altitude.value - a.altitude.value) for d, (a, b) in zip(expected, pairs)
+        ]
+        self.assertListAlmostEqual(expected_3d, geodesy.leg_distances(self.waypoints, altitude=True))
+        expected = [geodesy.vincenty(a.lat, a.lon, b.lat, b.lon) for a, b in pairs]
+        self.assertListAlmostEqual(expected, geodesy.leg_distances(self.waypoints, 'vincenty'), delta=1e-3)
+        self.assertRaises(ValueError, geodesy.leg_distances, self.waypoints, 'abc')
+        self.assertEqual([], geodesy.leg_distances([]))
+        self.assertEqual([], geodesy.leg_distances(self.waypoints[:1]))
+
+    def test_leg_bearings(self):
+        pairs = zip(self.waypoints, self.waypoints[1:])
+        expected = [geodesy.bearing(a.lat, a.lon, b.lat, b.lon) for a, b in pairs]
+        self.assertListAlmostEqual(expected, geodesy.leg_bearings(self.waypoints))
+
+    def test_sources(self):
+        expected = geodesy.path_length(self.waypoints, altitude=True)
+        self.assertAlmostEqual(expected, geodesy.path_length(Mission(self.waypoints), altitude=True))
+        self.assertAlmostEqual(expected, geodesy.path_length(iter(self.waypoints), altitude=True))
+        self.assertAlmostEqual(
+            expected, geodesy.path_length(WaypointTable.from_waypoints(self.waypoints), altitude=True)
+        )
+
+    def test_pure_python(self):
+        results = []
+        for method in ['haversine', 'vincenty']:
+            results.append(geodesy.leg_distances(self.waypoints, method, altitude=True))
+        results.append(geodesy.leg_bearings(self.waypoints))
+        with patch.object(geodesy, 'np', None):
+            for method, expected in zip(['haversine', 'vincenty'], results):
+                self.assertListAlmostEqual(
+                    expected, geodesy.leg_distances(self.waypoints, method, altitude=True), delta=1e-3
+                )
+            self.assertListAlmostEqual(results[2], geodesy.leg_bearings(self.waypoints))
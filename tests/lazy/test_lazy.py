@@ -0,0 +1,113 @@
+# pylint: skip-file
+import copy
+import io
+import os
+from unittest import TestCase
+
+from litchi_wp.enums import ActionType, AltitudeMode, GimbalMode, NumberFormat
+from litchi_wp.lazy import LazyWaypoint
+from litchi_wp.split import resume_waypoint
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestLazyWaypoint(TestCase):
+    def setUp(self):
+        with open(FILENAME, encoding='utf-8') as file:
+            self.lines = file.read().splitlines()[1:]
+
+    def test_decode_on_access(self):
+        waypoint = LazyWaypoint.from_line(self.lines[1])
+        self.assertIsInstance(waypoint, Waypoint)
+        self.assertEqual([], waypoint.decoded())
+        self.assertEqual(21.2568609, waypoint.lat)
+        self.assertEqual(-157.8071047, waypoint.lon)
+        self.assertEqual(['lat', 'lon'], waypoint.decoded())
+        self.assertEqual(100.0, waypoint.altitude.value)
+        self.assertIs(AltitudeMode.AGL, waypoint.altitude.mode)
+        self.assertNotIn('_actions', waypoint.decoded())
+        self.assertIs(ActionType.TAKE_PHOTO, waypoint.actions[1].type)
+        self.assertIn('_actions', waypoint.decoded())
+        self.assertNotIn('poi', waypoint.decoded())
+
+    def test_same_values_as_waypoint(self):
+        for line in self.lines:
+            lazy = LazyWaypoint.from_line(line)
+            eager = Waypoint.from_line(line)
+            self.assertEqual(eager.to_row(), lazy.to_row())
+            self.assertEqual(eager.to_line(), Waypoint.to_line(lazy))
+            self.assertEqual(
+                [action.type for action in eager.used_actions()], [action.type for action in lazy.used_actions()]
+            )
+            self.assertEqual(eager.has_actions(), lazy.has_actions())
+
+    def test_to_line_unmodified(self):
+        line = self.lines[0].replace('100.0', '100', 1)
+        waypoint = LazyWaypoint.from_line(line + ',ignored')
+        self.assertEqual(line + '\n', waypoint.to_line())
+        waypoint.lat
+        waypoint.actions
+        waypoint.set_altitude(100, AltitudeMode.AGL)
+        self.assertFalse(waypoint.is_modified())
+        self.assertEqual(line, waypoint.to_line(line_break=None))
+        self.assertEqual(Waypoint.from_line(line).to_line(number_format=NumberFormat.CANONICAL),
+                         waypoint.to_line(number_format=NumberFormat.CANONICAL))
+
+    def test_to_line_modified(self):
+        for modify in (
+                lambda waypoint: waypoint.set_coordinates(1.5, 2.5),
+                lambda waypoint: waypoint.altitude.set_value(50),
+                lambda waypoint: waypoint.set_action(ActionType.STAY_FOR, 100),
+                lambda waypoint: waypoint.set_gimbal(GimbalMode.INTERPOLATE, -30),
+                lambda waypoint: waypoint.set_poi(1, 2, 3),
+                lambda waypoint: waypoint.set_photo_interval_time(2),
+                lambda waypoint: setattr(waypoint, 'speed', 5.0),
+        ):
+            lazy = LazyWaypoint.from_line(self.lines[2])
+            eager = Waypoint.from_line(self.lines[2])
+            modify(lazy)
+            modify(eager)
+            self.assertTrue(lazy.is_modified())
+            self.assertEqual(eager.to_line(), lazy.to_line())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, LazyWaypoint.from_line, 'a,b')
+        waypoint = LazyWaypoint.from_line(self.lines[0].replace(',0,0,0.0,0,1500,', ',0,2,45.0,0,1500,', 1))
+        self.assertRaises(ValueError, Waypoint.from_line, waypoint.line)
+        self.assertEqual(21.2568756, waypoint.lat)
+        self.assertRaises(ValueError, getattr, waypoint, 'gimbal')
+        self.assertNotIn('gimbal', waypoint.decoded())
+        self.assertRaises(ValueError, waypoint.materialize)
+        self.assertRaises(AttributeError, getattr, waypoint, 'missing')
+
+    def test_copy(self):
+        waypoint = LazyWaypoint.from_line(self.lines[1])
+        copied = copy.deepcopy(waypoint)
+        self.assertEqual(waypoint.to_row(), copied.to_row())
+        copied.set_coordinates(1, 2)
+        self.assertFalse(waypoint.is_modified())
+        self.assertTrue(copied.is_modified())
+        self.assertEqual(waypoint.lat, resume_waypoint(waypoint).lat)
+
+    def test_iter_file_and_dump_many(self):
+        errors = []
+        waypoints = list(LazyWaypoint.iter_file(
+            io.StringIO(Waypoint.get_header() + self.lines[0] + '\ninvalid\n' + self.lines[1] + '\n'),
+            on_error=lambda *args: errors.append(args[:2])
+        ))
+        self.assertEqual(2, len(waypoints))
+        self.assertEqual([(3, 'invalid')], errors)
+        waypoints.append(Waypoint(1, 2, 3))
+        waypoints[1].set_coordinates(3, 4)
+        stream = io.StringIO()
+        self.assertEqual(3, LazyWaypoint.dump_many(waypoints, stream))
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(Waypoint.get_header(None), lines[0])
+        self.assertEqual(self.lines[0], lines[1])
+        self.assertEqual(waypoints[1].to_line(None), lines[2])
+        self.assertEqual(Waypoint(1, 2, 3).to_line(None), lines[3])
+        self.assertEqual(
+            len(self.lines),
+            len(list(LazyWaypoint.iter_file(FILENAME)))
+        )
@@ -0,0 +1,142 @@
+# pylint: skip-file
+import asyncio
+import io
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from litchi_wp.mission import Mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestMission(TestCase):
+    def create_mission(self, count=10):
+        return Mission(Waypoint(i, i, 10) for i in range(count))
+
+    def lats(self, mission):
+        return [int(waypoint.lat) for waypoint in mission]
+
+    def test_sequence(self):
+        mission = self.create_mission()
+        self.assertEqual(10, len(mission))
+        self.assertEqual(list(range(10)), self.lats(mission))
+        self.assertEqual(list(range(9, -1, -1)), [int(wp.lat) for wp in reversed(mission)])
+        self.assertEqual(3.0, mission[3].lat)
+        part = mission[2:5]
+        self.assertIsInstance(part, Mission)
+        self.assertEqual([2, 3, 4], self.lats(part))
+        mission[0] = Waypoint(20, 20, 10)
+        del mission[1]
+        self.assertEqual([20, 2, 3], self.lats(mission)[:3])
+        mission[1:3] = [Waypoint(30, 30, 10)]
+        self.assertEqual([20, 30, 4], self.lats(mission)[:3])
+
+    def test_append_insert(self):
+        mission = Mission()
+        mission.append(Waypoint(1, 1, 10))
+        mission.extend([Waypoint(3, 3, 10), Waypoint(4, 4, 10)])
+        mission.insert(1, Waypoint(2, 2, 10))
+        mission.insert_many(0, (Waypoint(i, i, 10) for i in range(-2, 1)))
+        self.assertEqual([-2, -1, 0, 1, 2, 3, 4], self.lats(mission))
+        mission.insert_many(len(mission), [Waypoint(5, 5, 10)])
+        self.assertEqual(5, int(mission[-1].lat))
+
+    def test_delete_many(self):
+        mission = self.create_mission()
+        mission.delete_many([0, 5, 9, 5])
+        self.assertEqual([1, 2, 3, 4, 6, 7, 8], self.lats(mission))
+        mission.delete_many([])
+        self.assertEqual(7, len(mission))
+        self.assertRaises(IndexError, mission.delete_many, [7])
+
+    def test_reorder(self):
+        mission = self.create_mission(5)
+        mission.reorder([4, 0, 3, 1, 2])
+        self.assertEqual([4, 0, 3, 1, 2], self.lats(mission))
+        self.assertRaises(ValueError, mission.reorder, [0, 0, 1, 2, 3])
+        self.assertRaises(ValueError, mission.reorder, [0, 1])
+        mission.reverse()
+        self.assertEqual([2, 1, 3, 0, 4], self.lats(mission))
+
+    def test_file(self):
+        with open(FILENAME, mode='r', encoding='utf-8') as file:
+            content_file = file.read()
+        mission = Mission.from_file(FILENAME)
+        stream = io.StringIO()
+        self.assertEqual(len(mission), mission.to_file(stream))
+        self.assertEqual(content_file, stream.getvalue())
+
+    def test_table(self):
+        mission = Mission.from_file(FILENAME)
+        table = mission.to_table()
+        self.assertIsInstance(table, WaypointTable)
+        self.assertEqual(
+            [wp.to_line() for wp in mission],
+            [wp.to_line() for wp in Mission.from_table(table)]
+        )
+
+
+class TestMissionAsync(IsolatedAsyncioTestCase):
+    def lines(self, count):
+        with open(FILENAME, mode='r', encoding='utf-8') as file:
+            lines = file.read().split('\n')[1:-1]
+        return Waypoint.get_header() + ''.join(lines[i % len(lines)] + '\n' for i in range(count))
+
+    async def test_aload_asave(self):
+        with open(FILENAME, mode='r', encoding='utf-8') as file:
+            content_file = file.read()
+        mission = await Mission.aload(FILENAME, chunk_size=3)
+        self.assertEqual(
+            [wp.to_row() for wp in Mission.from_file(FILENAME)],
+            [wp.to_row() for wp in mission]
+        )
+        stream = io.StringIO()
+        self.assertEqual(len(mission), await mission.asave(stream, chunk_size=4))
+        self.assertEqual(content_file, stream.getvalue())
+
+    async def test_files(self):
+        mission = Mission.from_file(FILENAME)
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('mission.csv', 'mission.csv.gz'):
+                filename = os.path.join(directory, name)
+                self.assertEqual(len(mission), await mission.asave(filename))
+                loaded = await Mission.aload(filename)
+                self.assertEqual([wp.to_row() for wp in mission], [wp.to_row() for wp in loaded])
+
+    async def test_on_error(self):
+        rejected = []
+        content = self.lines(3) + 'invalid\n\n' + self.lines(2).split('\n', 1)[1]
+        mission = await Mission.aload(
+            io.StringIO(content), on_error=lambda number, line, _error: rejected.append((number, line))
+        )
+        self.assertEqual(5, len(mission))
+        self.assertEqual([(5, 'invalid')], rejected)
+
+    async def test_event_loop_is_not_blocked(self):
+        """
+        Counts the turns of a task that yields on every event loop iteration while
+        missions are loaded concurrently, the loaders have to yield at least once per
+        chunk (the latency itself is measured in benchmarks/bench_async.py)
+        """
+        content = self.lines(5000)
+        chunk_size = 64
+        turns = 0
+
+        async def ticker(done):
+            nonlocal turns
+            while not done.is_set():
+                await asyncio.sleep(0)
+                turns += 1
+
+        done = asyncio.Event()
+        tick = asyncio.create_task(ticker(done))
+        missions = await asyncio.gather(
+            *(Mission.aload(io.StringIO(content), chunk_size=chunk_size) for _ in range(3))
+        )
+        done.set()
+        await tick
+        self.assertEqual([5000] * 3, [len(mission) for mission in missions])
+        self.assertGreaterEqual(turns, 5000 // chunk_size)
@@ -0,0 +1,87 @@
+# pylint: skip-file
+import itertools
+import random
+from unittest import TestCase
+
+from litchi_wp import route
+from litchi_wp.enums import ActionType
+from litchi_wp.geodesy import haversine, path_length
+from litchi_wp.mission import Mission
+from litchi_wp.route import distance_matrix, optimize_order, optimize_route
+from litchi_wp.waypoint import Waypoint
+
+
+class TestRoute(TestCase):
+    def setUp(self):
+        random.seed(4)
+        self.waypoints = [Waypoint(50 + random.random() / 100, 8 + random.random() / 60, 20) for _ in range(200)]
+
+    def length(self, order):
+        matrix = distance_matrix(self.waypoints)
+        return sum(matrix[a][b] for a, b in zip(order, order[1:]))
+
+    def test_distance_matrix(self):
+        waypoints = [Waypoint(50, 8, 10), Waypoint(50.001, 8.001, 40), Waypoint(50.002, 8, 10)]
+        matrix = distance_matrix(waypoints)
+        self.assertEqual(3, len(matrix))
+        self.assertEqual(0, matrix[1][1])
+        self.assertAlmostEqual(matrix[0][1], matrix[1][0])
+        self.assertAlmostEqual(haversine(50, 8, 50.002, 8), matrix[0][2], delta=1e-6)
+        horizontal = haversine(50, 8, 50.001, 8.001)
+        self.assertAlmostEqual((horizontal ** 2 + 30 ** 2) ** 0.5, matrix[0][1], delta=1e-6)
+        if route.np is not None:
+            route.np, numpy = None, route.np
+            try:
+                for row, expected in zip(distance_matrix(waypoints), matrix):
+                    for value, other in zip(row, expected):
+                        self.assertAlmostEqual(other, value, delta=1e-6)
+            finally:
+                route.np = numpy
+
+    def test_line(self):
+        waypoints = [Waypoint(50 + i / 1000, 8, 20) for i in range(30)]
+        order = list(range(1, 29))
+        random.shuffle(order)
+        shuffled = [waypoints[0]] + [waypoints[i] for i in order] + [waypoints[29]]
+        result = optimize_route(shuffled, fixed_end=True)
+        self.assertEqual([id(wp) for wp in waypoints], [id(wp) for wp in result])
+
+    def test_fixed_ends(self):
+        nearest = route._nearest_neighbour(distance_matrix(self.waypoints), 0, 199, None)
+        order = optimize_order(self.waypoints, fixed_end=True)
+        self.assertEqual(list(range(200)), sorted(order))
+        self.assertEqual((0, 199), (order[0], order[-1]))
+        self.assertLess(self.length(order), self.length(nearest))
+        order = optimize_order(self.waypoints)
+        self.assertEqual(0, order[0])
+        self.assertEqual(list(range(200)), sorted(order))
+        order = optimize_order(self.waypoints, fixed_start=False)
+        self.assertEqual(list(range(200)), sorted(order))
+
+    def test_small(self):
+        waypoints = self.waypoints[:7]
+        order = optimize_order(waypoints, fixed_end=True)
+        best = min(
+            ([0] + list(middle) + [6] for middle in itertools.permutations(range(1, 6))),
+            key=self.length
+        )
+        self.assertAlmostEqual(self.length(best), self.length(order), delta=1e-6)
+        self.assertEqual([0, 1], optimize_order(waypoints[:2]))
+        self.assertEqual([], optimize_order([]))
+
+    def test_keeps_waypoints(self):
+        self.waypoints[5].set_action(ActionType.TAKE_PHOTO)
+        self.waypoints[7].set_poi(50, 8, 5)
+        mission = Mission(self.waypoints)
+        before = path_length(mission)
+        mission.reorder(optimize_order(mission.waypoints))
+        self.assertLess(path_length(mission), before)
+        self.assertEqual(ActionType.TAKE_PHOTO, self.waypoints[5].used_actions()[0].type)
+        self.assertIn(self.waypoints[7], mission.waypoints)
+
+    def test_restarts(self):
+        single = optimize_order(self.waypoints, restarts=0)
+        local = optimize_order(self.waypoints, restarts=3, seed=1)
+        pooled = optimize_order(self.waypoints, restarts=3, processes=2, seed=1)
+        self.assertEqual(local, pooled)
+        self.assertLessEqual(self.length(local), self.length(single) + 1e-6)
@@ -0,0 +1,80 @@
+# pylint: skip-file
+import math
+import random
+from unittest import TestCase
+
+from litchi_wp.enums import ActionType
+from litchi_wp.simplify import _project, douglas_peucker, is_anchor, simplify, visvalingam
+from litchi_wp.waypoint import Waypoint
+
+
+class TestSimplify(TestCase):
+    def track(self, count=1000):
+        random.seed(3)
+        # a zigzag of straight 500 point runs with gps noise of a few centimeters
+        waypoints = []
+        for i in range(count):
+            run, step = divmod(i, 500)
+            lat = 50 + (step if run % 2 == 0 else 500 - step) * 1e-5 + random.gauss(0, 3e-7)
+            waypoints.append(Waypoint(lat, 8 + i * 1e-6, 30 + random.gauss(0, 0.02)))
+        return waypoints
+
+    def test_straight_runs(self):
+        waypoints = self.track()
+        for method, tolerance in (('visvalingam', 50.0), ('douglas_peucker', 0.5)):
+            kept = simplify(waypoints, tolerance, method=method)
+            self.assertIs(waypoints[0], kept[0])
+            self.assertIs(waypoints[-1], kept[-1])
+            self.assertIn(waypoints[500], kept)
+            self.assertLessEqual(len(kept), 4, method)
+        self.assertEqual(list(range(1000)), visvalingam(waypoints, -1))
+        self.assertEqual(list(range(1000)), douglas_peucker(waypoints, -1))
+
+    def test_max_waypoints(self):
+        waypoints = self.track()
+        self.assertEqual(99, len(simplify(waypoints, max_waypoints=99)))
+        self.assertEqual([0, 500, 999], visvalingam(waypoints, max_waypoints=3))
+        self.assertEqual([0, 999], visvalingam(waypoints, max_waypoints=1))
+        self.assertEqual([0, 1], visvalingam(waypoints[:2], 100))
+
+    def test_altitude(self):
+        waypoints = [Waypoint(50, 8 + i * 1e-4, 30 + (20 if i == 5 else 0)) for i in range(11)]
+        self.assertEqual([0, 4, 5, 6, 10], douglas_peucker(waypoints, 1))
+        self.assertEqual([0, 4, 5, 6, 10], visvalingam(waypoints, 1))
+
+    def test_spiral(self):
+        # every split of a spiral peels off a single waypoint, the depth limit
+        # switches to middle splits, removed waypoints still have to be within tolerance
+        waypoints = [
+            Waypoint(50 + i * 2e-8 * math.cos(i * 0.05), 8 + i * 3e-8 * math.sin(i * 0.05), 30)
+            for i in range(3000)
+        ]
+        kept = douglas_peucker(waypoints, 0.5)
+        self.assertLess(len(kept), 3000)
+        xs, ys, zs = (list(values) for values in _project(waypoints))
+        for first, last in zip(kept, kept[1:]):
+            dx, dy = xs[last] - xs[first], ys[last] - ys[first]
+            length = dx * dx + dy * dy
+            for index in range(first + 1, last):
+                px, py = xs[index] - xs[first], ys[index] - ys[first]
+                t = min(max((px * dx + py * dy) / length, 0.0), 1.0)
+                self.assertLessEqual(math.hypot(px - t * dx, py - t * dy), 0.5)
+
+    def test_anchors(self):
+        waypoints = self.track()
+        waypoints[100].set_action(ActionType.TAKE_PHOTO)
+        waypoints[200].set_poi(50, 8, 0)
+        for waypoint in waypoints[300:]:
+            waypoint.set_photo_interval_distance(10)
+        self.assertTrue(is_anchor(waypoints[300], waypoints[299]))
+        self.assertFalse(is_anchor(waypoints[301], waypoints[300]))
+        self.assertFalse(is_anchor(waypoints[0]))
+        for method in ('visvalingam', 'douglas_peucker'):
+            kept = simplify(waypoints, 10, method=method)
+            for index in (0, 100, 200, 300, 999):
+                self.assertIn(waypoints[index], kept)
+        self.assertEqual([0, 100, 200, 300, 999], visvalingam(waypoints, max_waypoints=2))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, simplify, self.track(10), method='unknown')
+        self.assertRaises(ValueError, simplify, self.track(10), max_waypoints=5, method='douglas_peucker')
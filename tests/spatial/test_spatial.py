@@ -0,0 +1,76 @@
+# pylint: skip-file
+import random
+from unittest import TestCase
+
+from litchi_wp.geodesy import haversine
+from litchi_wp.spatial import SpatialIndex
+from litchi_wp.waypoint import Waypoint
+
+
+class TestSpatialIndex(TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.waypoints = [
+            Waypoint(50 + random.random() / 50, 8 + random.random() / 30, 10) for _ in range(2000)
+        ]
+        self.index = SpatialIndex(self.waypoints, cell_size=100)
+
+    def brute_nearest(self, lat, lon, k):
+        return sorted(self.waypoints, key=lambda wp: haversine(lat, lon, wp.lat, wp.lon))[:k]
+
+    def test_container(self):
+        self.assertEqual(2000, len(self.index))
+        self.assertIn(self.waypoints[3], self.index)
+        self.assertNotIn(Waypoint(50, 8, 10), self.index)
+        self.assertEqual(set(map(id, self.waypoints)), set(map(id, self.index)))
+        self.index.remove(self.waypoints[3])
+        self.assertNotIn(self.waypoints[3], self.index)
+        self.assertRaises(ValueError, self.index.remove, self.waypoints[3])
+        self.assertRaises(ValueError, self.index.update, self.waypoints[3])
+        self.assertRaises(ValueError, SpatialIndex, cell_size=0)
+
+    def test_nearest(self):
+        for _ in range(50):
+            lat, lon = 49.99 + random.random() / 25, 7.99 + random.random() / 15
+            for k in (1, 5):
+                self.assertEqual(
+                    [id(wp) for wp in self.brute_nearest(lat, lon, k)],
+                    [id(wp) for wp in self.index.nearest(lat, lon, k)]
+                )
+        far = self.index.nearest(10, 10, 3)
+        self.assertEqual([id(wp) for wp in self.brute_nearest(10, 10, 3)], [id(wp) for wp in far])
+        self.assertEqual(2000, len(self.index.nearest(50, 8, 5000)))
+        self.assertEqual([], self.index.nearest(50, 8, 0))
+        self.assertEqual([], SpatialIndex().nearest(50, 8))
+
+    def test_within(self):
+        lat, lon = 50.01, 8.015
+        expected = sorted(id(wp) for wp in self.waypoints if haversine(lat, lon, wp.lat, wp.lon) <= 250)
+        result = self.index.within(lat, lon, 250)
+        self.assertEqual(expected, sorted(map(id, result)))
+        distances = [haversine(lat, lon, wp.lat, wp.lon) for wp in result]
+        self.assertEqual(sorted(distances), distances)
+
+    def test_in_bbox(self):
+        box = (50.005, 8.01, 50.012, 8.02)
+        expected = sorted(
+            id(wp) for wp in self.waypoints
+            if box[0] <= wp.lat <= box[2] and box[1] <= wp.lon <= box[3]
+        )
+        self.assertEqual(expected, sorted(map(id, self.index.in_bbox(*box))))
+        self.assertEqual(2000, len(self.index.in_bbox(-90, -180, 90, 180)))
+        self.assertEqual([], self.index.in_bbox(51, 8, 50, 9))
+
+    def test_move(self):
+        waypoint = self.waypoints[0]
+        self.index.move(waypoint, 51, 9)
+        self.assertEqual((51, 9), (waypoint.lat, waypoint.lon))
+        self.assertIs(waypoint, self.index.nearest(51.0001, 9)[0])
+        self.assertEqual([waypoint], self.index.in_bbox(50.9, 8.9, 51.1, 9.1))
+        waypoint.set_coordinates(50.01, 8.01)
+        self.index.update(waypoint)
+        self.assertEqual([], self.index.in_bbox(50.9, 8.9, 51.1, 9.1))
+        self.assertIs(waypoint, self.index.nearest(50.01, 8.01)[0])
+        self.index.insert(waypoint)
+        self.assertEqual(2000, len(self.index))
+        self.assertRaises(ValueError, self.index.move, Waypoint(50, 8, 10), 50, 8)
@@ -0,0 +1,85 @@
+# pylint: skip-file
+import os
+import tempfile
+from unittest import TestCase
+
+from litchi_wp.enums import ActionType, GimbalMode
+from litchi_wp.flight import AircraftProfile, FlightEstimator
+from litchi_wp.split import resume_waypoint, split_mission, split_to_files
+from litchi_wp.waypoint import Waypoint
+
+
+class TestSplit(TestCase):
+    def corridor(self, count=200):
+        for i in range(count):
+            waypoint = Waypoint(50 + i / 1000, 8, 50)
+            waypoint.set_curvesize(10)
+            if i % 7 == 0:
+                waypoint.set_action(ActionType.TAKE_PHOTO)
+            yield waypoint
+
+    def assertConnected(self, waypoints, parts):
+        self.assertIs(waypoints[0], parts[0][0])
+        flown = [parts[0][0]]
+        for before, part in zip(parts, parts[1:]):
+            self.assertEqual(before[-1].to_row()[:8], part[0].to_row()[:8])
+            self.assertEqual([], part[0].used_actions())
+        for part in parts:
+            flown.extend(part[1:])
+        self.assertEqual([id(waypoint) for waypoint in waypoints], [id(waypoint) for waypoint in flown])
+
+    def test_budgets(self):
+        profile = AircraftProfile()
+        waypoints = list(self.corridor())
+        parts = list(split_mission(iter(waypoints), max_time=300, profile=profile))
+        self.assertGreater(len(parts), 1)
+        self.assertConnected(waypoints, parts)
+        for part in parts:
+            self.assertLessEqual(FlightEstimator(part, profile).total_time, 300 + 1e-9)
+        parts = list(split_mission(waypoints, max_distance=5000))
+        self.assertConnected(waypoints, parts)
+        for part in parts:
+            self.assertLessEqual(FlightEstimator(part).total_distance, 5000 + 1e-9)
+        parts = list(split_mission(waypoints, max_energy=profile.usable_energy / 4))
+        self.assertConnected(waypoints, parts)
+        self.assertEqual(
+            [99, 99, 4],
+            [len(part) for part in split_mission(waypoints, max_waypoints=99)]
+        )
+        self.assertEqual([waypoints], list(split_mission(waypoints, max_time=10 ** 6)))
+        self.assertEqual([], list(split_mission([], max_time=1)))
+
+    def test_errors(self):
+        waypoints = list(self.corridor(5))
+        self.assertRaises(ValueError, list, split_mission(waypoints))
+        self.assertRaises(ValueError, list, split_mission(waypoints, max_waypoints=1))
+        self.assertRaises(ValueError, list, split_mission(waypoints, max_distance=10))
+
+    def test_state(self):
+        waypoints = list(self.corridor(10))
+        waypoints[2].set_action(ActionType.START_RECORDING)
+        for waypoint in waypoints[4:]:
+            waypoint.set_gimbal(GimbalMode.INTERPOLATE, -45)
+            waypoint.set_poi(50.1, 8.1, 5)
+            waypoint.set_photo_interval_distance(20)
+        parts = list(split_mission(waypoints, max_waypoints=6))
+        entry = parts[1][0]
+        self.assertIsNot(waypoints[5], entry)
+        self.assertEqual(GimbalMode.INTERPOLATE, entry.gimbal.mode)
+        self.assertEqual(-45, entry.gimbal.pitchangle)
+        self.assertEqual(50.1, entry.poi.lat)
+        self.assertEqual(20, entry.photo.distance_interval)
+        self.assertEqual([ActionType.START_RECORDING], [action.type for action in entry.used_actions()])
+        self.assertEqual(ActionType.TAKE_PHOTO, waypoints[0].used_actions()[0].type)
+        self.assertEqual([], resume_waypoint(waypoints[0]).used_actions())
+
+    def test_split_to_files(self):
+        waypoints = list(self.corridor())
+        with tempfile.TemporaryDirectory() as directory:
+            names = split_to_files(
+                iter(waypoints), os.path.join(directory, 'part_{:02d}.csv'), max_waypoints=99
+            )
+            self.assertEqual(['part_01.csv', 'part_02.csv', 'part_03.csv'], [os.path.basename(n) for n in names])
+            parts = [list(Waypoint.iter_file(name)) for name in names]
+        self.assertEqual([99, 99, 4], [len(part) for part in parts])
+        self.assertEqual(waypoints[-1].to_row(), parts[-1][-1].to_row())
@@ -0,0 +1,71 @@
+# pylint: skip-file
+import types
+from unittest import TestCase
+
+from litchi_wp.enums import GimbalMode
+from litchi_wp.geodesy import haversine
+from litchi_wp.survey import camera_footprint, survey
+
+SQUARE = [(50.0, 8.0), (50.0, 8.014), (50.009, 8.014), (50.009, 8.0)]
+# U shaped field, open to the north
+U_SHAPE = [
+    (50.0, 8.0), (50.0, 8.014), (50.009, 8.014), (50.009, 8.01),
+    (50.003, 8.01), (50.003, 8.004), (50.009, 8.004), (50.009, 8.0), (50.0, 8.0)
+]
+
+
+class TestSurvey(TestCase):
+    def test_footprint(self):
+        self.assertEqual((120.0, 80.0), camera_footprint(100, 12, 8, 10))
+        self.assertRaises(ValueError, camera_footprint, 100, 12, 8, 0)
+
+    def test_square(self):
+        generator = survey(SQUARE, 50, (100, 80), front_overlap=0.75, side_overlap=0.5)
+        self.assertIsInstance(generator, types.GeneratorType)
+        waypoints = list(generator)
+        # 1000 m north-south with 50 m line spacing
+        self.assertEqual(40, len(waypoints))
+        for waypoint in waypoints:
+            self.assertEqual(GimbalMode.INTERPOLATE, waypoint.gimbal.mode)
+            self.assertEqual(-90, waypoint.gimbal.pitchangle)
+            self.assertEqual(50, waypoint.altitude.value)
+        self.assertEqual([20.0, -1.0], [wp.photo.distance_interval for wp in waypoints[:2]])
+        self.assertEqual([90.0, 90.0, 270.0, 270.0], [wp.heading for wp in waypoints[:4]])
+        self.assertLess(waypoints[0].lon, waypoints[1].lon)
+        self.assertGreater(waypoints[2].lon, waypoints[3].lon)
+        spacing = haversine(waypoints[0].lat, waypoints[0].lon, waypoints[3].lat, waypoints[3].lon)
+        self.assertAlmostEqual(50, spacing, delta=0.5)
+        for waypoint in waypoints:
+            self.assertTrue(50.0 <= waypoint.lat <= 50.009)
+            self.assertTrue(8.0 - 1e-9 <= waypoint.lon <= 8.014 + 1e-9)
+
+    def test_direction(self):
+        waypoints = list(survey(SQUARE, 50, (100, 80), side_overlap=0.5, direction=0))
+        # 1000 m east-west with 50 m line spacing
+        self.assertEqual(40, len(waypoints))
+        self.assertEqual([0.0, 0.0, 180.0], [wp.heading for wp in waypoints[:3]])
+        self.assertAlmostEqual(waypoints[0].lon, waypoints[1].lon)
+        self.assertLess(waypoints[0].lat, waypoints[1].lat)
+
+    def test_concave(self):
+        waypoints = list(survey(U_SHAPE, 50, (100, 80), front_overlap=0.75, side_overlap=0.5))
+        lines = {}
+        for waypoint in waypoints:
+            lines.setdefault(round(waypoint.lat, 6), []).append(waypoint)
+        counts = sorted(len(line) for line in lines.values())
+        # 7 lines cross the bottom, 13 lines cross both arms
+        self.assertEqual([2] * 7 + [4] * 13, counts)
+        for waypoint in waypoints:
+            self.assertFalse(waypoint.lat > 50.003 and 8.004 < waypoint.lon < 8.01)
+        for line in lines.values():
+            self.assertEqual([20.0, -1.0] * (len(line) // 2), [wp.photo.distance_interval for wp in line])
+
+    def test_lazy(self):
+        big = [(50.0, 8.0), (50.0, 9.0), (51.0, 9.0), (51.0, 8.0)]
+        generator = survey(big, 50, (10, 10))
+        self.assertEqual(2, len([next(generator), next(generator)]))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, list, survey(SQUARE[:2], 50, (100, 80)))
+        self.assertRaises(ValueError, list, survey(SQUARE, 50, (100, 80), front_overlap=1))
+        self.assertRaises(ValueError, list, survey(SQUARE, 50, (0, 80)))
@@ -0,0 +1,125 @@
+# pylint: skip-file
+import io
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from litchi_wp.enums import ActionType
+from litchi_wp.table import COLUMN_NAMES, WaypointTable, parse_csv_bulk
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestWaypointTable(TestCase):
+    def setUp(self):
+        with open(FILENAME, mode='r', encoding='utf-8') as file:
+            self.content_file = file.read()
+        self.waypoints = Waypoint.from_file(FILENAME)
+
+    def test_columns(self):
+        self.assertEqual(46, len(COLUMN_NAMES))
+        table = WaypointTable.from_waypoints(self.waypoints)
+        self.assertEqual(len(self.waypoints), len(table))
+        self.assertEqual('d', table.column('latitude').typecode)
+        self.assertEqual('b', table.column('actiontype1').typecode)
+        self.assertEqual([wp.lat for wp in self.waypoints], list(table.column('latitude')))
+        self.assertRaises(ValueError, table.column, 'abc')
+
+    def test_from_file(self):
+        table = WaypointTable.from_file(FILENAME)
+        for index, waypoint in enumerate(self.waypoints):
+            self.assertEqual(waypoint.to_row(), table.get_row(index))
+            self.assertEqual(waypoint.to_line(), table[index].to_line())
+
+    def test_to_file(self):
+        table = WaypointTable.from_file(FILENAME)
+        stream = io.StringIO()
+        table.to_file(stream)
+        self.assertEqual(self.content_file, stream.getvalue())
+
+    def test_to_line(self):
+        table = WaypointTable.from_waypoints(self.waypoints)
+        for index, waypoint in enumerate(self.waypoints):
+            self.assertEqual(waypoint.to_line(), table.to_line(index))
+            self.assertEqual(waypoint.to_line(None), table.to_line(index, None))
+
+    def test_item_access(self):
+        table = WaypointTable.from_waypoints(self.waypoints)
+        waypoint = table[0]
+        waypoint.set_coordinates(1.5, 2.5)
+        waypoint.replace_action(3, ActionType.ROTATE_AIRCRAFT, 90.5)
+        self.assertNotEqual(1.5, table[0].lat)
+        table[0] = waypoint
+        self.assertEqual(waypoint.to_line(), table[0].to_line())
+        part = table[1:4]
+        self.assertIsInstance(part, WaypointTable)
+        self.assertEqual(3, len(part))
+        self.assertEqual(table.get_row(1), part.get_row(0))
+        del table[0]
+        self.assertEqual(len(self.waypoints) - 1, len(table))
+        self.assertEqual([wp.to_line() for wp in self.waypoints[1:]], [wp.to_line() for wp in table])
+
+    def test_append_row(self):
+        table = WaypointTable()
+        self.assertRaises(ValueError, table.append_row, (0, 1, 2))
+        table.append(Waypoint(1, 2, 3))
+        self.assertEqual(1, len(table))
+        self.assertEqual(3.0, table.get_waypoint(0).altitude.value)
+
+    def test_parse_csv_bulk(self):
+        table = parse_csv_bulk(self.content_file)
+        self.assertEqual([wp.to_line() for wp in self.waypoints], [table.to_line(i) for i in range(len(table))])
+        self.assertEqual(0, len(parse_csv_bulk('')))
+        self.assertEqual(0, len(parse_csv_bulk(Waypoint.get_header())))
+
+    def test_parse_csv_bulk_same_lines_as_from_line(self):
+        line = self.content_file.split('\n')[1]
+        replacements = [
+            (0, '-0'), (2, '-5'), (4, '-3.5'), (5, '01'), (5, '10'), (6, '-'), (6, '2'), (6, '3'),
+            (7, '-91'), (8, '6'), (8, '-1'), (8, '4'), (8, '5'), (9, '32001'), (9, '1500.7'),
+            (9, '-0.5'), (9, '-1'), (9, '1.'), (38, '2'), (43, '-0'), (43, '-1'), (44, '-15'),
+            (45, '-15'), (45, '5abc'), (45, '5\r'), (45, '.5'), (46, 'abc'), (3, 'abc'), (3, '')
+        ]
+        lines = []
+        for column, value in replacements:
+            fields = line.split(',')
+            if column < len(fields):
+                fields[column] = value
+            else:
+                fields.append(value)
+            lines.append(','.join(fields))
+        lines.extend(['abc', '', line, line.replace(',4,', ',4,400,', 1)])
+        expected_lines = []
+        expected_errors = []
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                expected_lines.append(Waypoint.from_line(line).to_line())
+            except ValueError:
+                if line:
+                    expected_errors.append(line_number)
+        errors = []
+        table = parse_csv_bulk('\n'.join(lines), on_error=lambda *error: errors.append(error))
+        self.assertEqual(expected_lines, [table.to_line(i) for i in range(len(table))])
+        self.assertEqual(expected_errors, [error[0] for error in errors])
+        self.assertEqual([lines[i - 1] for i in expected_errors], [error[1] for error in errors])
+
+    def test_from_file_chunks(self):
+        stream = io.StringIO(self.content_file + 'abc\n' + self.content_file.split('\n', 1)[1])
+        errors = []
+        with patch('litchi_wp.table.CHUNK_SIZE', 7):
+            table = WaypointTable.from_file(stream, on_error=lambda *error: errors.append(error))
+        self.assertEqual(2 * len(self.waypoints), len(table))
+        self.assertEqual([len(self.waypoints) + 2], [error[0] for error in errors])
+
+    def test_extend_from_text(self):
+        lines = self.content_file.split('\n')
+        table = WaypointTable()
+        errors = []
+        self.assertEqual(3, table.extend_from_text('\n'.join(lines[:4]) + '\n'))
+        self.assertEqual(2, table.extend_from_text(
+            '\n'.join(lines[4:6] + ['abc']) + '\n', lambda *error: errors.append(error), first_line_number=5
+        ))
+        self.assertEqual(5, len(table))
+        self.assertEqual([(7, 'abc')], [error[:2] for error in errors])
+        self.assertEqual([wp.to_row() for wp in self.waypoints[:5]], [table.get_row(i) for i in range(5)])
@@ -0,0 +1,101 @@
+# pylint: skip-file
+import math
+import os
+import struct
+import tempfile
+from unittest import TestCase
+
+from litchi_wp import terrain
+from litchi_wp.enums import AltitudeMode
+from litchi_wp.terrain import Terrain, convert_altitudes, tile_name
+from litchi_wp.waypoint import Waypoint
+
+SIZE = 11
+
+
+def height(lat, lon, south=None, west=None):
+    south = math.floor(lat) if south is None else south
+    west = math.floor(lon) if west is None else west
+    return 100 + 1000 * (lat - south) + 500 * (lon - west)
+
+
+class TestTerrain(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for south, west in ((50, 8), (50, 9)):
+            values = [
+                round(height(south + 1 - row / (SIZE - 1), west + column / (SIZE - 1), south, west))
+                for row in range(SIZE) for column in range(SIZE)
+            ]
+            with open(os.path.join(self.directory.name, tile_name(south, west)), 'wb') as file:
+                file.write(struct.pack(f'>{len(values)}h', *values))
+        self.terrain = Terrain(self.directory.name, cache_size=1)
+
+    def tearDown(self):
+        self.terrain.close()
+        self.directory.cleanup()
+
+    def test_tile_name(self):
+        self.assertEqual('N50E008.hgt', tile_name(50.5, 8.2))
+        self.assertEqual('S01W001.hgt', tile_name(-0.5, -0.2))
+
+    def check_elevations(self):
+        lats = [50.0, 50.55, 50.99, 50.123, 50.5]
+        lons = [8.0, 8.25, 8.999, 8.77, 9.5]
+        for lat, lon, value in zip(lats, lons, self.terrain.elevations(lats, lons)):
+            self.assertAlmostEqual(height(lat, lon), value, delta=1e-6)
+        self.assertAlmostEqual(height(50.3, 8.3), self.terrain.elevation(50.3, 8.3), delta=1e-6)
+
+    def test_elevations(self):
+        self.check_elevations()
+        self.assertEqual(1, len(self.terrain._tiles))
+        self.assertRaises(ValueError, self.terrain.elevation, 10, 10)
+
+    def test_elevations_pure_python(self):
+        numpy, terrain.np = terrain.np, None
+        try:
+            self.terrain.close()
+            self.check_elevations()
+        finally:
+            self.terrain.close()
+            terrain.np = numpy
+
+    def test_void(self):
+        filename = os.path.join(self.directory.name, tile_name(50, 8))
+        with open(filename, 'r+b') as file:
+            file.seek((5 * SIZE + 5) * 2)
+            file.write(struct.pack('>h', terrain.VOID))
+        self.assertTrue(math.isnan(self.terrain.elevation(50.45, 8.45)))
+        self.assertFalse(math.isnan(self.terrain.elevation(50.05, 8.05)))
+        waypoint = Waypoint(50.45, 8.45, 30)
+        self.assertRaises(ValueError, convert_altitudes, [waypoint], AltitudeMode.MSL, self.terrain)
+        self.assertEqual((30, AltitudeMode.AGL), (waypoint.altitude.value, waypoint.altitude.mode))
+
+    def test_invalid_tile(self):
+        with open(os.path.join(self.directory.name, tile_name(51, 8)), 'wb') as file:
+            file.write(b'\x00' * 7)
+        self.assertRaises(ValueError, self.terrain.elevation, 51.5, 8.5)
+        self.assertRaises(ValueError, Terrain, self.directory.name, 0)
+
+    def test_convert(self):
+        waypoints = [Waypoint(50.2, 8.4, 30), Waypoint(50.6, 9.1, 40)]
+        waypoints[0].set_poi(50.3, 8.3, 5, AltitudeMode.AGL)
+        waypoints[1].set_altitude(1000, AltitudeMode.MSL)
+        self.assertEqual(2, convert_altitudes(waypoints, AltitudeMode.MSL, self.terrain))
+        self.assertAlmostEqual(30 + height(50.2, 8.4), waypoints[0].altitude.value)
+        self.assertEqual(AltitudeMode.MSL, waypoints[0].altitude.mode)
+        self.assertAlmostEqual(5 + height(50.3, 8.3), waypoints[0].poi.altitude.value)
+        self.assertEqual(1000, waypoints[1].altitude.value)
+        self.assertEqual(3, convert_altitudes(waypoints, AltitudeMode.AGL, self.terrain))
+        self.assertAlmostEqual(30, waypoints[0].altitude.value)
+        self.assertAlmostEqual(5, waypoints[0].poi.altitude.value)
+        self.assertAlmostEqual(1000 - height(50.6, 9.1), waypoints[1].altitude.value)
+        self.assertEqual(0, convert_altitudes(waypoints, AltitudeMode.AGL, self.terrain, pois=False))
+
+    def test_convert_below_terrain(self):
+        waypoints = [Waypoint(50.2, 8.4, 30), Waypoint(50.6, 9.1, 40)]
+        waypoints[0].set_altitude(1000, AltitudeMode.MSL)
+        waypoints[1].set_altitude(height(50.6, 9.1) - 10, AltitudeMode.MSL)
+        rows = [waypoint.to_row() for waypoint in waypoints]
+        self.assertRaises(ValueError, convert_altitudes, waypoints, AltitudeMode.AGL, self.terrain)
+        self.assertEqual(rows, [waypoint.to_row() for waypoint in waypoints])
@@ -0,0 +1,106 @@
+# pylint: skip-file
+import io
+import math
+import os
+from unittest import TestCase
+
+from litchi_wp.enums import ActionType, GimbalMode
+from litchi_wp.mission import Mission
+from litchi_wp.table import WaypointTable
+from litchi_wp.validation import MissionLimits, validate_file, validate_text, validate_waypoints
+from litchi_wp.waypoint import Waypoint
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'waypoint', 'waypoints.csv')
+
+
+class TestValidation(TestCase):
+    def setUp(self):
+        with open(FILENAME, mode='r', encoding='utf-8') as file:
+            self.lines = file.read().split('\n')
+
+    def replace(self, line_number, column, value):
+        fields = self.lines[line_number - 1].split(',')
+        fields[column] = value
+        self.lines[line_number - 1] = ','.join(fields)
+
+    def issues(self, report):
+        return [(issue.line, issue.column, issue.rule, issue.value) for issue in report]
+
+    def test_valid_file(self):
+        report = validate_file(FILENAME)
+        self.assertTrue(report.ok)
+        self.assertEqual(52, report.waypoints)
+        self.assertEqual(0, len(report))
+
+    def test_all_issues_of_a_line(self):
+        self.replace(2, 0, '91.5')
+        self.replace(2, 3, 'abc')
+        self.replace(2, 5, '11')
+        self.replace(2, 9, '40000')
+        self.replace(4, 39, '20')
+        self.replace(5, 44, '-2')
+        self.lines[6] = '1,2,3'
+        report = validate_text('\n'.join(self.lines))
+        self.assertFalse(report.ok)
+        self.assertEqual(51, report.waypoints)
+        self.assertEqual([
+            (2, 'latitude', 'range', 91.5),
+            (2, 'heading(deg)', 'format', 'abc'),
+            (2, 'rotationdir', 'enum', 11.0),
+            (2, 'actionparam1', 'range', 40000.0),
+            (3, None, 'max_segment', report.issues[4].value),
+            (4, 'speed(m/s)', 'max_speed', 20.0),
+            (5, 'photo_timeinterval', 'format', '-2'),
+            (7, None, 'columns', 3),
+        ], self.issues(report))
+        self.assertGreater(report.issues[4].value, 2000)
+        self.assertEqual(
+            {'range': 2, 'format': 2, 'enum': 1, 'max_segment': 1, 'max_speed': 1, 'columns': 1},
+            report.count_by_rule()
+        )
+        self.assertEqual('latitude 91.5 is outside -90.0 to 90.0', report.issues[0].message)
+        self.assertEqual(
+            {'line': 7, 'column': None, 'rule': 'columns', 'value': 3, 'message': 'expected 46 columns, got 3'},
+            report.issues[-1].to_dict()
+        )
+
+    def test_conditional_rules(self):
+        waypoints = [Waypoint(50, 8, 30), Waypoint(50.0001, 8, 30)]
+        waypoints[0].gimbal.pitchangle = 45.0
+        waypoints[1].set_gimbal(GimbalMode.INTERPOLATE, 0)
+        waypoints[1].gimbal.pitchangle = 45.0
+        waypoints[1].set_action(ActionType.ROTATE_AIRCRAFT, 10)
+        waypoints[1].actions[0].param = 400.0
+        waypoints[0].set_action(ActionType.TAKE_PHOTO)
+        waypoints[0].photo.time_interval = -3.0
+        report = validate_waypoints(waypoints)
+        self.assertEqual([
+            (2, 'photo_timeinterval', 'range', -3.0),
+            (3, 'gimbalpitchangle', 'range', 45.0),
+            (3, 'actionparam1', 'range', 400.0),
+        ], self.issues(report))
+
+    def test_mission_limits(self):
+        waypoints = [Waypoint(50 + i * 0.0001, 8, 30) for i in range(120)]
+        waypoints[50] = Waypoint(50 + 49 * 0.0001, 8, 30)
+        waypoints[60].set_altitude(600)
+        report = validate_waypoints(Mission(waypoints))
+        self.assertEqual([
+            (None, None, 'max_waypoints', 120),
+            (52, None, 'min_segment', 0.0),
+            (62, 'altitude(m)', 'max_altitude', 600.0),
+        ], self.issues(report))
+        report = validate_waypoints(
+            WaypointTable.from_waypoints(waypoints), MissionLimits(max_waypoints=200, max_altitude=math.inf)
+        )
+        self.assertEqual([(52, None, 'min_segment', 0.0)], self.issues(report))
+        self.assertEqual(
+            [(None, None, 'min_waypoints', 1)], self.issues(validate_waypoints(waypoints[:1]))
+        )
+        self.assertEqual(
+            [(None, None, 'min_waypoints', 0)], self.issues(validate_text(Waypoint.get_header()))
+        )
+
+    def test_stream_and_generator(self):
+        self.assertTrue(validate_file(io.StringIO('\n'.join(self.lines))).ok)
+        self.assertTrue(validate_waypoints(Waypoint.iter_file(FILENAME)).ok)
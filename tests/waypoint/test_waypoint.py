@@ -1,5 +1,8 @@
 # pylint: skip-file
+import gzip
+import io
 import os
+import tempfile
 from unittest import TestCase
 
 from litchi_wp.enums import AltitudeMode, GimbalMode, RotationDirection, ActionType
@@ -289,3 +292,86 @@ class TestWaypoint(TestCase):
         with open(filename, mode='r', encoding='utf-8') as file:
             content_file = file.read()
             self.assertEqual(content_file, content_waypoints)
+
+    def test_iter_file(self):
+        filename = os.path.join(os.path.dirname(__file__), 'waypoints.csv')
+        waypoints = list(Waypoint.iter_file(filename))
+        with open(filename, mode='r', encoding='utf-8') as file:
+            content_file = file.read()
+        content_waypoints = Waypoint.get_header()
+        for waypoint in waypoints:
+            content_waypoints += waypoint.to_line()
+        self.assertEqual(content_file, content_waypoints)
+
+    def test_iter_file_line_numbers(self):
+        with open(os.path.join(os.path.dirname(__file__), 'waypoints.csv'), encoding='utf-8') as file:
+            header, line, _ = file.read().split('\n', 2)
+        stream = io.StringIO('\n'.join([header, 'abc', line, 'abc', line, '']))
+        errors = []
+        waypoints = list(Waypoint.iter_file(stream, on_error=lambda *error: errors.append(error)))
+        self.assertEqual(2, len(waypoints))
+        self.assertEqual([2, 4], [error[0] for error in errors])
+        self.assertEqual(['abc', 'abc'], [error[1] for error in errors])
+        self.assertTrue(all(isinstance(error[2], ValueError) for error in errors))
+
+    def test_iter_file_gzip(self):
+        filename = os.path.join(os.path.dirname(__file__), 'waypoints.csv')
+        with open(filename, mode='r', encoding='utf-8') as file:
+            content_file = file.read()
+        with tempfile.TemporaryDirectory() as directory:
+            gz_filename = os.path.join(directory, 'waypoints.csv.gz')
+            with gzip.open(gz_filename, mode='wt', encoding='utf-8') as file:
+                file.write(content_file)
+            waypoints = list(Waypoint.iter_file(gz_filename))
+        self.assertEqual([wp.to_line() for wp in Waypoint.from_file(filename)], [wp.to_line() for wp in waypoints])
+
+    def test_dump_many(self):
+        filename = os.path.join(os.path.dirname(__file__), 'waypoints.csv')
+        with open(filename, mode='r', encoding='utf-8') as file:
+            content_file = file.read()
+        waypoints = Waypoint.from_file(filename)
+        for chunk_size in [1, 7, 4096]:
+            stream = io.StringIO()
+            count = Waypoint.dump_many(iter(waypoints), stream, chunk_size=chunk_size)
+            self.assertEqual(len(waypoints), count)
+            self.assertEqual(content_file, stream.getvalue())
+        stream = io.StringIO()
+        Waypoint.dump_many(waypoints, stream, line_break='\r\n', header=False)
+        self.assertEqual(''.join(wp.to_line('\r\n') for wp in waypoints), stream.getvalue())
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ['waypoints.csv', 'waypoints.csv.gz']:
+                Waypoint.dump_many(waypoints, os.path.join(directory, name))
+                self.assertEqual(
+                    [wp.to_line() for wp in waypoints],
+                    [wp.to_line() for wp in Waypoint.iter_file(os.path.join(directory, name))]
+                )
+
+    def test_slots(self):
+        waypoint = Waypoint(0, 0, 0)
+        objects = [waypoint, waypoint.altitude, waypoint.gimbal, waypoint.poi, waypoint.poi.altitude, waypoint.photo]
+        objects.extend(waypoint.actions)
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertRaises(AttributeError, setattr, waypoint, 'abc', 0)
+        self.assertEqual(0, waypoint.next_action_index)
+
+    def test_actions(self):
+        waypoint = Waypoint(0, 0, 0)
+        waypoint.replace_action(1, ActionType.STAY_FOR, 1000)
+        waypoint.replace_action(2, ActionType.NO_ACTION)
+        line = waypoint.to_line()
+        self.assertEqual('-1,0.0,0,1000,-1,0,-1,0.0', ','.join(line.split(',')[8:16]))
+        actions = waypoint.actions
+        self.assertEqual(15, len(set(map(id, actions))))
+        self.assertEqual(line, waypoint.to_line())
+        actions[0].set_rotate(90)
+        self.assertEqual(ActionType.ROTATE_AIRCRAFT, waypoint.actions[0].type)
+        waypoint.replace_action(0, ActionType.NO_ACTION)
+        self.assertIs(actions[0], waypoint.actions[0])
+        self.assertEqual(ActionType.NO_ACTION, actions[0].type)
+        waypoint.replace_action(5, ActionType.TILT_CAMERA, -90)
+        self.assertRaises(ValueError, waypoint.replace_action, 6, ActionType.TILT_CAMERA, -100)
+        self.assertEqual(ActionType.NO_ACTION, waypoint.actions[6].type)
+        other = Waypoint(0, 0, 0)
+        self.assertRaises(ValueError, other.replace_action, 0, ActionType.STAY_FOR, -1)
+        self.assertEqual(Waypoint(0, 0, 0).to_line(), other.to_line())